@@ -944,8 +944,14 @@ class CDLParameterOptimizer:
         if not adjustments:
             return "low"  # Changed from "none" to "low" to match database constraint
         
-        high_risk_count = sum(1 for adj in adjustments if adj.risk_level == "high")
-        medium_risk_count = sum(1 for adj in adjustments if adj.risk_level == "medium")
+        # Single pass over adjustments for both risk counts
+        high_risk_count = 0
+        medium_risk_count = 0
+        for adj in adjustments:
+            if adj.risk_level == "high":
+                high_risk_count += 1
+            elif adj.risk_level == "medium":
+                medium_risk_count += 1
         
         if high_risk_count > 0 or len(adjustments) > 5:
             return "high"
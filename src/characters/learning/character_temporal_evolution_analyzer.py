@@ -19,6 +19,7 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from collections import defaultdict
+from itertools import islice
 from enum import Enum
 import numpy as np
 from statistics import mean, stdev
@@ -706,7 +707,7 @@ class CharacterTemporalEvolutionAnalyzer:
             # Generate natural evolution references
             evolution_references = []
             if relevant_learning:
-                for moment in relevant_learning[:2]:  # Top 2 relevant learning moments
+                for moment in islice(relevant_learning, 2):  # Top 2 relevant learning moments
                     evolution_references.append(f"I remember {moment.description.lower()}")
             
             # Generate growth awareness statements
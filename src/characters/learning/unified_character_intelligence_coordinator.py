@@ -828,19 +828,30 @@ class UnifiedCharacterIntelligenceCoordinator:
         """Gather intelligence from multiple systems in parallel."""
         # Use existing single system method for each system
         combined_intelligence = {}
-        
-        for system in systems:
-            if await self._is_system_available(system):
-                try:
-                    result = await self._gather_single_system_intelligence(request, system)
-                    if result:
-                        combined_intelligence[system.value] = result
-                except Exception as e:
-                    combined_intelligence[system.value] = {
-                        'error': str(e),
-                        'available': False
-                    }
-        
+
+        available_systems = [
+            system for system in systems if await self._is_system_available(system)
+        ]
+        if not available_systems:
+            return combined_intelligence
+
+        # The systems share no state (episodic = Qdrant, temporal = InfluxDB,
+        # graph = PostgreSQL, ...) so their network latencies can overlap
+        results = await asyncio.gather(
+            *(self._gather_single_system_intelligence(request, system)
+              for system in available_systems),
+            return_exceptions=True
+        )
+
+        for system, result in zip(available_systems, results):
+            if isinstance(result, BaseException):
+                combined_intelligence[system.value] = {
+                    'error': str(result),
+                    'available': False
+                }
+            elif result:
+                combined_intelligence[system.value] = result
+
         return combined_intelligence
     
     def _update_performance_tracking(self, 
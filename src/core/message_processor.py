@@ -12,14 +12,20 @@ integration, and context management.
 """
 
 import asyncio
+import bisect
+import hashlib
 import json
 import logging
 import os
 import re
+import sys
+import time
 import traceback
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+
+import numpy as np
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, NamedTuple, Optional, Any
+from dataclasses import dataclass, field
 
 from src.utils.production_error_handler import handle_errors, ErrorCategory, ErrorSeverity
 from src.utils.bot_name_utils import get_normalized_bot_name_from_env
@@ -28,13 +34,14 @@ from src.adapters.platform_adapters import (
     create_discord_message_adapter,
     create_discord_attachment_adapters
 )
-from src.prompts.prompt_assembler import create_prompt_assembler
+from src.prompts.prompt_assembler import PromptAssembler, create_prompt_assembler
 from src.prompts.prompt_components import (
     create_core_system_component,
     create_memory_component,
     create_anti_hallucination_component,
     create_guidance_component,
     create_user_facts_component,
+    create_ai_intelligence_component,
     PromptComponent,
     PromptComponentType,
     is_component_enabled  # Feature flag check for early-exit optimization
@@ -59,8 +66,245 @@ from src.memory.unified_query_classification import (
 
 logger = logging.getLogger(__name__)
 
+# Precompiled hot-path regexes (module-level so we skip re's internal LRU cache)
+# "My preferred name is X" extraction from stored facts
+_PREFERRED_NAME_RE = re.compile(r"(?:preferred )?name is ([A-Z][a-zA-Z\-']+)", re.IGNORECASE)
+# Timestamp echo at start of LLM responses, e.g. "[2025-11-21 18:26] "
+_TIMESTAMP_ECHO_RE = re.compile(r'^\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}\]\s*')
+# Bare analytical section headers like "Emotional Analysis:" on their own line
+_SECTION_HEADER_RE = re.compile(r"^[A-Z][A-Za-z &]+:\s*$")
+# Known recursive LLM failure indicators (checked against every response)
+_RECURSIVE_PATTERN_RES = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r'remember that you can remember',
+        r'(\b\w+\b)(\s+\1){24,}',  # Same word repeating 25+ times (word + 24 more repetitions)
+        r'(that you can\s+){5,}',  # "that you can" repeating
+        r'(\b\w+\s+\w+\b)(\s+\1){19,}',  # Same two-word phrase repeating 20+ times
+        r'(being able to\s+){3,}',  # "being able to" repeating
+        r'EEREE|Eternalized Eternally',  # Specific nonsense patterns from Ryan
+        r'(processing data.*entertainment.*){3,}',  # Recursive tech explanations
+        r'(.{20,})\1{3,}',  # Any 20+ char phrase repeating 3+ times
+    )
+]
+# Meta-conversation content to exclude from memory retrieval (bot-development chatter)
+_META_EXCLUDE_PATTERNS = (
+    "your prompt", "your system prompt", "how you're programmed",
+    "your character file", "cdl_ai_integration.py", "fix the bot's",
+    "bot is announcing wrong time", "bot should speak like",
+    "testing bot response", "bot container",
+    "bot's speaking style", "bot's detection"
+)
+# Single-pass alternation so downstream filters can scan each memory once
+# instead of running one substring test per pattern
+_META_EXCLUDE_RE = re.compile('|'.join(re.escape(p) for p in _META_EXCLUDE_PATTERNS), re.IGNORECASE)
+# Static retrieval filter keys shared by every optimized-retrieval call;
+# merged into the per-message filter dict in one copy
+_STATIC_FILTER_BASE = {
+    "prefer_recent_conversation": True,
+    "recency_hours": 2,
+    "exclude_content_patterns": _META_EXCLUDE_PATTERNS,
+    "exclude_content_regex": _META_EXCLUDE_RE,
+}
+# Query-type classification keywords (word-level sets avoid substring false
+# positives like "where" matching "somewhere")
+_QUERY_TOKEN_RE = re.compile(r"[a-z']+")
+_RECALL_WORDS = frozenset({'remember', 'recall', 'told'})
+_QUESTION_WORDS = frozenset({'how', 'what', 'why', 'when', 'where'})
+_EMOTION_WORDS = frozenset({'feel', 'emotion', 'mood', 'sad', 'happy', 'angry'})
+
+# Role values the memory manager uses for bot-authored messages
+_BOT_ROLES = frozenset({'bot', 'assistant'})
+
+# Topic/summary keyword tables compiled to single alternation scans so each
+# category costs one C-level pass over the text instead of one Python-level
+# substring test per keyword. Plain alternation (no word boundaries) keeps
+# the original substring-match semantics.
+_CONVERSATION_TOPIC_KEYWORDS = {
+    'food': ['pizza', 'burger', 'sandwich', 'taco', 'food', 'eat', 'meal', 'cook', 'recipe'],
+    'activities': ['beach', 'swim', 'dive', 'hike', 'travel', 'visit', 'explore', 'adventure'],
+    'greetings': ['hi', 'hello', 'good morning', 'good afternoon', 'good evening', 'hey'],
+    'emotions': ['excited', 'happy', 'sad', 'worried', 'curious', 'interested'],
+    'work': ['project', 'research', 'study', 'work', 'job', 'career'],
+    'creativity': ['dream', 'creative', 'art', 'music', 'write', 'design', 'imagine'],
+    'science': ['research', 'experiment', 'discover', 'analysis', 'data', 'ocean', 'marine'],
+}
+_CONVERSATION_TOPIC_RES = {
+    topic: re.compile('|'.join(re.escape(kw) for kw in keywords))
+    for topic, keywords in _CONVERSATION_TOPIC_KEYWORDS.items()
+}
+_MEMORY_TOPIC_RES = (
+    (re.compile('food|pizza|burger|sandwich'), "Food preferences"),
+    (re.compile('beach|swim'), "Beach activities"),
+    (re.compile('dream|creative|art'), "Creative discussions"),
+    (re.compile('research|science|ocean'), "Science topics"),
+)
+_SUMMARY_TOPIC_RES = (
+    (re.compile('coffee|meet|dinner|lunch|hang out|get together'), "Discussed meeting/social plans"),
+    (re.compile('food|pizza|burger|sandwich|taco|meal|eat|cook'), "Talked about food/meals"),
+    (re.compile('beach|ocean|swim|dive|surf|water|sea'), "Discussed beach/ocean activities"),
+    (re.compile('dream|creative|art|music|imagine|poetry|write'), "Creative/artistic conversation"),
+    (re.compile('research|science|marine|biology|experiment|study'), "Science/research discussion"),
+    (re.compile('work|job|career|project|profession|business'), "Work/career conversation"),
+    (re.compile('family|parent|mother|father|sibling|relative|background'), "Family/background discussion"),
+    (re.compile('adventure|travel|explore|journey|trek|expedition'), "Adventure/travel conversation"),
+    (re.compile('photography|photo|camera|picture|shoot|lens'), "Photography discussion"),
+)
+
+# Fact-extraction tables for _extract_user_facts_from_memories, compiled once
+# so the per-memory loop does one C-level scan per category rather than one
+# Python substring test per keyword
+_NAME_PATTERN_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"(?:my name is|call me|i'm|i am)\s+([A-Z][a-z]+)",
+    r"(?:name is|called)\s+([A-Z][a-z]+)",
+    r"just (?:call me|use)\s+([A-Z][a-z]+)",
+    r"prefer (?:to be called|being called)\s+([A-Z][a-z]+)",
+))
+_FOOD_CATEGORY_RES = (
+    ('pizza', re.compile('pizza|pizzas')),
+    ('burgers', re.compile('burger|burgers')),
+    ('sandwiches', re.compile('sandwich|sandwiches')),
+    ('tacos', re.compile('taco|tacos')),
+)
+_ACTIVITY_CATEGORY_RES = (
+    ('beach activities', re.compile('beach|ocean|surf')),
+    ('swimming', re.compile('swim|swimming')),
+    ('diving', re.compile('dive|diving|scuba')),
+    ('travel', re.compile('travel|traveling')),
+)
+
+# Discord compound-name splitter ("MarkAnthony" -> ["Mark", "Anthony"])
+_DISCORD_NAME_RE = re.compile(r'[A-Z][a-z]+')
+
+# Recall-query keyword extraction ("we talked about X" -> X)
+_RECALL_QUERY_RES = (
+    re.compile(r'we (?:talked|discussed|were talking) about (.+)'),
+    re.compile(r'remember when we (?:talked|discussed) (.+)'),
+    re.compile(r'recall (?:our discussion|talking) about (.+)'),
+)
+_RECALL_SPLIT_RE = re.compile(r'[,;]|\band\b')
+
+# Preference-detection patterns (name / timezone / location / communication
+# style), compiled once for the per-message detection pass
+_PREF_NAME_RES = tuple(re.compile(p) for p in (
+    # "My name is Mark" - captures capitalized names
+    r"(?:my|My)\s+name\s+is\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
+    # "Call me Mark"
+    r"(?:call|Call)\s+me\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
+    # "I prefer to be called Mark" or "I prefer Mark"
+    r"(?:i|I)\s+prefer\s+(?:to\s+be\s+called\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
+    # "I go by Mark"
+    r"(?:i|I)\s+go\s+by\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
+    # "You can call me Mark"
+    r"(?:you|You)\s+can\s+call\s+me\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
+    # "Just call me Mark"
+    r"(?:just|Just)\s+call\s+me\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
+    # "I'm Mark" (less formal)
+    r"(?:i|I)[''']m\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
+))
+_PREF_TIMEZONE_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    # "I'm in EST", "I'm in Pacific time"
+    r"(?:i|I)[''']?m\s+in\s+([A-Z]{2,4}|Pacific|Eastern|Central|Mountain|GMT|UTC)(?:\s+time)?",
+    # "My timezone is EST"
+    r"(?:my|My)\s+(?:timezone|time\s+zone)\s+is\s+([A-Z]{2,4}|Pacific|Eastern|Central|Mountain|GMT|UTC)",
+    # "I live in EST", "I'm on PST"
+    r"(?:i|I)\s+(?:live\s+in|am\s+on|use)\s+([A-Z]{2,4}|Pacific|Eastern|Central|Mountain|GMT|UTC)(?:\s+time)?",
+))
+_PREF_LOCATION_RES = tuple(re.compile(p) for p in (
+    # "I live in Seattle", "I'm from Chicago"
+    r"(?:i|I)\s+(?:live\s+in|am\s+from|reside\s+in)\s+([A-Z][a-zA-Z\s]{2,30})",
+    # "I'm in New York", "I'm located in Boston"
+    r"(?:i|I)[''']?m\s+(?:in|located\s+in)\s+([A-Z][a-zA-Z\s]{2,30})",
+    # "My location is Seattle"
+    r"(?:my|My)\s+location\s+is\s+([A-Z][a-zA-Z\s]{2,30})",
+))
+_PREF_COMM_STYLE_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    # "I prefer short responses", "I like detailed explanations"
+    r"(?:i|I)\s+(?:prefer|like)\s+(short|brief|long|detailed|simple|technical)\s+(?:responses|answers|explanations)",
+    # "Keep it brief", "Make it detailed"
+    r"(?:keep\s+it|make\s+it)\s+(brief|short|detailed|simple|technical)",
+    # "I want concise answers"
+    r"(?:i|I)\s+want\s+(concise|brief|detailed|thorough)\s+(?:answers|responses)",
+))
+
+# Memory-safety filters for response storage
+_UNSAFE_RESPONSE_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'remember that you can remember',
+    r'EEREE|Eternalized Eternally',
+    r'(\w+\s+){20,}',  # 20+ repeated words
+))
+_DEBUG_CONVERSATION_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    # Memory corruption/system issues
+    r'\b(corrupt|corrupted|fragmenting)\s+(your\s+)?(memory|context)',
+    r'\b(reset|restart|reboot)\s+(your\s+memory|your\s+context|your\s+system)',
+    r'\b(stuck|frozen)\s+(context|conversation|memory)',
+    r'\bprompt.*\blog\b',  # Discussions about prompt logging
+
+    # Explicit technical commands
+    r'\bclear\s+(your\s+)?(cache|context|memory)',
+    r'\bfix\s+(your\s+)?(memory|context|system)',
+))
+
+
+def _parse_iso_timestamp(value) -> datetime:
+    """Parse a stored timestamp, accepting datetimes and ISO strings.
+
+    Fast-paths already-typed datetimes and only rewrites the trailing 'Z'
+    (fromisoformat can't parse it before Python 3.11) when one is present,
+    avoiding a string copy for offset-formatted timestamps.
+    """
+    if isinstance(value, datetime):
+        return value
+    s = str(value)
+    if s.endswith('Z'):
+        s = s[:-1] + '+00:00'
+    return datetime.fromisoformat(s)
+
+
+def _trunc(text: str, limit: int) -> str:
+    """Truncate text to ``limit`` chars, appending an ellipsis only when needed."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+# Relationship depth / conversation quality threshold tables (bisect lookup
+# replaces chained float comparisons). Depth labels are interned so every
+# message shares the same string objects and downstream equality checks
+# short-circuit on identity.
+_DEPTH_THRESHOLDS = (0.2, 0.4, 0.6, 0.8)
+_DEPTH_LABELS = tuple(sys.intern(s) for s in (
+    'new_connection', 'acquaintance', 'growing_relationship',
+    'strong_connection', 'deep_bond'))
+_QUALITY_THRESHOLDS = (0.30, 0.50, 0.70, 0.85)
+# Expected failure modes for defensive catches around optional subsystems
+_COMMON_EXC = (AttributeError, ValueError, TypeError)
+
+# How long a formatted fact/preference pack stays valid before re-querying
+# PostgreSQL (facts change slowly relative to message cadence)
+_FACTS_CACHE_TTL_SECONDS = 60
+_FACTS_CACHE_MAX_ENTRIES = 2048
+
+# Short-TTL cache for hybrid context detection keyed on message + history
+# tail digest; retries, edits, and near-identical follow-ups hit it
+_CONTEXT_CACHE_TTL_SECONDS = 300
+_CONTEXT_CACHE_MAX_ENTRIES = 2048
+
+# Static prompt-section framing shared by guidance builders
+_AI_GUIDANCE_HEADER = "\n\n🤖 AI INTELLIGENCE GUIDANCE:\n"
+_GUIDANCE_BULLET = "• "
+
+# Translate internal engagement strategy names into clear LLM instructions
+_ENGAGEMENT_STRATEGY_GUIDANCE = {
+    'curiosity_prompt': 'Ask an open, curious question to spark deeper conversation',
+    'topic_suggestion': 'Suggest a new topic related to shared interests',
+    'memory_connection': 'Reference a past conversation naturally to deepen connection',
+    'emotional_check_in': 'Gently check in on their emotional state with empathy',
+    'follow_up_question': 'Ask a thoughtful follow-up about the current topic',
+    'shared_interest': 'Connect around shared interests authentically',
+    'celebration': 'Celebrate their achievements with genuine enthusiasm',
+    'support_offer': 'Offer support or encouragement naturally'
+}
+
 
-@dataclass
+@dataclass(slots=True)
 class MessageContext:
     """Platform-agnostic message context."""
     user_id: str
@@ -70,7 +314,9 @@ class MessageContext:
     platform: str = "unknown"  # "discord", "api", etc.
     channel_id: Optional[str] = None
     channel_type: Optional[str] = None  # "dm", "guild", etc.
-    metadata: Optional[Dict[str, Any]] = None
+    # Defaults to an empty dict so per-message enrichment can update() it
+    # directly; None is still accepted from callers that pass it explicitly
+    metadata: Optional[Dict[str, Any]] = field(default_factory=dict)
     # Platform-specific context for features like typing indicators
     platform_context: Optional[Any] = None  # Discord channel, HTTP response object, etc.
     # Metadata control for API responses
@@ -83,9 +329,16 @@ class MessageContext:
             self.metadata = {}
 
 
-@dataclass
+class SecurityValidation(NamedTuple):
+    """Result of input security validation (slot-based - no dict overhead on the hot path)."""
+    is_safe: bool
+    sanitized_content: str
+    warnings: List[str]
+
+
+@dataclass(frozen=True, slots=True)
 class ProcessingResult:
-    """Result of message processing."""
+    """Result of message processing. Immutable - treated as a pure return value."""
     response: str
     success: bool = True
     error_message: Optional[str] = None
@@ -97,7 +350,7 @@ class ProcessingResult:
 
     def __post_init__(self):
         if self.metadata is None:
-            self.metadata = {}
+            object.__setattr__(self, 'metadata', {})
 
 
 class MessageProcessor:
@@ -119,7 +372,37 @@ class MessageProcessor:
         self.emoji_intelligence = emoji_intelligence
         self.image_processor = image_processor
         self.conversation_cache = conversation_cache
-        
+
+        # Memory retrieval strategy chain, resolved lazily on first retrieval
+        # (the memory manager's optional capabilities are probed exactly once);
+        # bound method refs skip the attribute chain on each call
+        self._memory_retrieval_strategies: Optional[List[Any]] = None
+        self._mb_retrieve_legacy = None
+        self._mb_retrieve_optimized = None
+        self._ctx_retrieve = None
+
+        # Minute-resolution timestamp cache for context strings (avoids a
+        # strftime call per message)
+        self._cached_minute_key = -1
+        self._cached_minute_ts = ''
+
+        # Enhanced CDL manager, created lazily once the postgres pool exists
+        # (previously re-constructed on every message in the prompt path)
+        self._enhanced_cdl_manager = None
+
+        # ConversationQuality bucket table, built on first use (enum members
+        # are singletons, so the tuple is shared across messages)
+        self._conv_quality_levels = None
+
+        # Bounded queue + background drain task that keeps synchronous
+        # InfluxDB metric writes off the hot message path
+        self._metrics_queue: asyncio.Queue = asyncio.Queue(maxsize=4096)
+        self._metrics_drain_task: Optional[asyncio.Task] = None
+
+        # Resolve shared bot_core attributes once (bot_core may be None in tests)
+        postgres_pool = getattr(bot_core, 'postgres_pool', None) if bot_core else None
+        knowledge_router = getattr(bot_core, 'knowledge_router', None) if bot_core else None
+
         # Phase 2c: Initialize unified query classifier for single authoritative classification
         # PERFORMANCE: Disabled by default due to significant overhead (~2x processing time)
         # Enable via ENABLE_LLM_TOOL_CALLING=true environment variable
@@ -144,7 +427,6 @@ class MessageProcessor:
             from src.temporal.temporal_protocol import create_temporal_intelligence_system
             
             # Pass knowledge_router for actual PostgreSQL relationship scores
-            knowledge_router = getattr(bot_core, 'knowledge_router', None) if bot_core else None
             self.temporal_client, self.confidence_analyzer = create_temporal_intelligence_system(
                 knowledge_router=knowledge_router
             )
@@ -152,7 +434,22 @@ class MessageProcessor:
                        knowledge_router is not None)
         except ImportError:
             logger.warning("Temporal intelligence not available - install influxdb-client")
-        
+
+        # Pre-bind recorder methods once at init (None when unavailable) - avoids
+        # per-message attribute lookups and try/except AttributeError feature
+        # detection in _record_temporal_metrics
+        _tc = self.temporal_client
+        self._tc_record_confidence_evolution = getattr(_tc, 'record_confidence_evolution', None)
+        self._tc_record_relationship_progression = getattr(_tc, 'record_relationship_progression', None)
+        self._tc_record_conversation_quality = getattr(_tc, 'record_conversation_quality', None)
+        self._tc_record_bot_emotion = getattr(_tc, 'record_bot_emotion', None)
+        self._tc_record_user_emotion = getattr(_tc, 'record_user_emotion', None)
+        self._tc_record_memory_aging = getattr(_tc, 'record_memory_aging_metrics', None)
+        self._tc_record_character_graph = getattr(_tc, 'record_character_graph_performance', None)
+        self._tc_record_intelligence_coordination = getattr(_tc, 'record_intelligence_coordination_metrics', None)
+        self._tc_record_emotion_analysis_perf = getattr(_tc, 'record_emotion_analysis_performance', None)
+        self._tc_record_vector_memory_perf = getattr(_tc, 'record_vector_memory_performance', None)
+
         # STAGE 2: Enhanced AI Ethics for Character Learning
         self.enhanced_ai_ethics = None
         
@@ -219,7 +516,7 @@ class MessageProcessor:
                     confidence_adapter=None,  # ConfidenceAdapter removed
                     memory_manager=self.memory_manager,
                     temporal_client=self.temporal_client,
-                    postgres_pool=getattr(bot_core, 'postgres_pool', None) if bot_core else None
+                    postgres_pool=postgres_pool
                 )
                 
                 # Pass dependencies to Predictive Engine
@@ -241,6 +538,16 @@ class MessageProcessor:
         # Shared emotion analyzer for preventing RoBERTa race conditions
         self._shared_emotion_analyzer = None
         self._shared_analyzer_lock = asyncio.Lock()
+
+        # Single-flight map for bot emotion analysis: concurrent requests for the
+        # same response text await one in-flight RoBERTa pass instead of queuing
+        # serially on the shared analyzer
+        self._inflight_emotion: Dict[str, asyncio.Future] = {}
+
+        # Negative cache for bot emotional trajectory: users whose history lookups
+        # came back empty. Skips the InfluxDB/Qdrant round trip for cold users;
+        # entries are evicted as soon as a bot emotion is recorded for the user.
+        self._users_without_bot_emotion_history: set = set()
         
         # Stance Analyzer for filtering emotions by speaker perspective
         self._stance_analyzer = None
@@ -405,7 +712,24 @@ class MessageProcessor:
         
         # Get character name for emoji selection
         self.character_name = get_normalized_bot_name_from_env()
-        
+
+        # Cache raw bot name from environment (stable for process lifetime)
+        self._bot_name = os.getenv('DISCORD_BOT_NAME', 'unknown')
+        self._bot_name_lower = self._bot_name.lower()
+        self._bot_name_display = os.getenv('DISCORD_BOT_NAME', 'Assistant')
+        self._collection_name = os.getenv('QDRANT_COLLECTION_NAME', f'whisperengine_memory_{self._bot_name_lower}')
+
+        # TTL cache for formatted PostgreSQL fact/preference packs:
+        # (user_id, bot_name) -> (timestamp, version_hash, formatted_facts)
+        self._facts_cache: Dict[tuple, tuple] = {}
+
+        # Memoized bot_core capability probe (resolved lazily on first message
+        # because bot_core may still be wiring up subsystems during __init__)
+        self._has_phase2_integration: Optional[bool] = None
+
+        # digest -> (timestamp, context_result); see _analyze_enhanced_context
+        self._context_analysis_cache: Dict[bytes, tuple] = {}
+
         # Initialize Emotional Context Engine for tactical personality adaptation
         try:
             self.emotional_context_engine = EmotionalContextEngine()
@@ -1032,8 +1356,8 @@ class MessageProcessor:
         This is the main entry point that replicates the sophisticated processing
         from the Discord handlers but in a platform-agnostic way.
         """
-        logger.info(f"🚀 MESSAGE PROCESSOR DEBUG: Starting process_message for user {message_context.user_id}")
-        start_time = datetime.now()
+        logger.info("🚀 MESSAGE PROCESSOR DEBUG: Starting process_message for user %s", message_context.user_id)
+        start_ns = time.perf_counter_ns()
         
         try:
             logger.info("🔄 MESSAGE PROCESSOR: Starting processing for user %s on platform %s", 
@@ -1041,11 +1365,11 @@ class MessageProcessor:
             
             # Phase 1: Security validation
             validation_result = await self._validate_security(message_context)
-            if not validation_result["is_safe"]:
+            if not validation_result.is_safe:
                 logger.warning("SECURITY: Rejected unsafe message from user %s", message_context.user_id)
-                
+
                 # Check if this is a silent ignore case (e.g., mystical symbols)
-                is_silent = any("Mystical" in w for w in validation_result.get("warnings", []))
+                is_silent = any("Mystical" in w for w in validation_result.warnings)
                 
                 if is_silent:
                     # Silently ignore - no response at all
@@ -1064,10 +1388,10 @@ class MessageProcessor:
                     )
             
             # Update message content with sanitized version
-            message_context.content = validation_result["sanitized_content"]
-            if validation_result["warnings"]:
-                logger.warning("SECURITY: Input warnings for user %s: %s", 
-                             message_context.user_id, validation_result['warnings'])
+            message_context.content = validation_result.sanitized_content
+            if validation_result.warnings:
+                logger.warning("SECURITY: Input warnings for user %s: %s",
+                             message_context.user_id, validation_result.warnings)
             
             # Phase 1.5: Chronological message ordering (FIXED)
             # BUG IN COMMIT 01a8292: Called _store_user_message_immediately() which never existed
@@ -1078,7 +1402,7 @@ class MessageProcessor:
                 pass  # Memory stored later with full context in Phase 4
             
             # Phase 2: Name detection and storage
-            await self._process_name_detection(message_context)
+            self._process_name_detection(message_context)
             
             # Phase 2.25: Memory summary detection and processing
             memory_summary_result = await self._process_memory_summary_detection(message_context)
@@ -1111,13 +1435,13 @@ class MessageProcessor:
                     doc = nlp(message_context.content)
                     nlp_cache = NLPAnalysisCache.from_doc(doc, message_context.content)
                     logger.debug(
-                        f"🚀 NLP CACHE: Created unified cache "
-                        f"(lemmas={len(nlp_cache.lemmas)}, emotion_keywords={len(nlp_cache.emotion_keywords)})"
+                        "🚀 NLP CACHE: Created unified cache (lemmas=%d, emotion_keywords=%d)",
+                        len(nlp_cache.lemmas), len(nlp_cache.emotion_keywords)
                     )
                 else:
                     logger.debug("🚀 NLP CACHE: spaCy not available, analyzers will use legacy paths")
             except Exception as e:
-                logger.debug(f"🚀 NLP CACHE: Cache creation failed (non-blocking, using legacy): {e}")
+                logger.debug("🚀 NLP CACHE: Cache creation failed (non-blocking, using legacy): %s", e)
                 nlp_cache = None
             
             # First, analyze stance to filter emotions by speaker perspective
@@ -1129,12 +1453,13 @@ class MessageProcessor:
                     )
                     if user_stance_analysis:
                         logger.info(
-                            f"🎯 USER STANCE ANALYSIS: self_focus={user_stance_analysis.self_focus:.2f}, "
-                            f"type={user_stance_analysis.emotion_type}, "
-                            f"emotions={user_stance_analysis.primary_emotions}"
+                            "🎯 USER STANCE ANALYSIS: self_focus=%.2f, type=%s, emotions=%s",
+                            user_stance_analysis.self_focus,
+                            user_stance_analysis.emotion_type,
+                            user_stance_analysis.primary_emotions
                         )
                 except Exception as e:
-                    logger.debug(f"Stance analysis failed: {e}")
+                    logger.debug("Stance analysis failed: %s", e)
                     user_stance_analysis = None
             
             # Then analyze emotion, potentially weighted by stance
@@ -1150,11 +1475,11 @@ class MessageProcessor:
                         early_emotion_context = early_emotion_result.primary_emotion
                         # If stance indicates other's emotions, deprioritize in context retrieval
                         if user_stance_analysis and user_stance_analysis.self_focus < 0.5:
-                            logger.info(f"⚠️  LOW SELF-FOCUS: Deprioritizing emotion '{early_emotion_context}' (likely about others)")
+                            logger.info("⚠️  LOW SELF-FOCUS: Deprioritizing emotion '%s' (likely about others)", early_emotion_context)
                         else:
-                            logger.info(f"🎭 EARLY EMOTION DETECTION: {early_emotion_context} (for context-aware memory retrieval)")
+                            logger.info("🎭 EARLY EMOTION DETECTION: %s (for context-aware memory retrieval)", early_emotion_context)
                 except Exception as e:
-                    logger.debug(f"Early emotion analysis failed, using neutral context: {e}")
+                    logger.debug("Early emotion analysis failed, using neutral context: %s", e)
                     early_emotion_context = "neutral"
             
             # Phase 2.8: Strategic intelligence cache retrieval (background-computed insights)
@@ -1169,14 +1494,14 @@ class MessageProcessor:
                     )
                     if memory_health_cache:
                         logger.info(
-                            f"📊 STRATEGIC INTELLIGENCE: Retrieved memory health cache "
-                            f"(avg_age={memory_health_cache.get('avg_memory_age_hours', 0) / 24:.1f}d, "
-                            f"trend={memory_health_cache.get('retrieval_frequency_trend', 'unknown')})"
+                            "📊 STRATEGIC INTELLIGENCE: Retrieved memory health cache (avg_age=%.1fd, trend=%s)",
+                            memory_health_cache.get('avg_memory_age_hours', 0) / 24,
+                            memory_health_cache.get('retrieval_frequency_trend', 'unknown')
                         )
                     else:
-                        logger.debug(f"Strategic cache miss for {self.character_name}/{message_context.user_id[:8]}")
+                        logger.debug("Strategic cache miss for %s/%s", self.character_name, message_context.user_id[:8])
                 except Exception as e:
-                    logger.warning(f"Strategic cache retrieval failed (non-blocking): {e}", exc_info=True)
+                    logger.warning("Strategic cache retrieval failed (non-blocking): %s", e, exc_info=True)
             
             # Phase 3: Memory retrieval with emotional context-aware filtering
             # Check if memory component is enabled before expensive retrieval
@@ -1187,7 +1512,7 @@ class MessageProcessor:
                     early_emotion_context,
                     memory_health_cache
                 )
-                logger.debug(f"✅ Retrieved {len(relevant_memories)} relevant memories (memory component enabled)")
+                logger.debug("✅ Retrieved %d relevant memories (memory component enabled)", len(relevant_memories))
             else:
                 logger.debug("⏭️  Skipped memory retrieval (MEMORY component disabled)")
             
@@ -1208,8 +1533,7 @@ class MessageProcessor:
                     # Retrieve all 7 strategic intelligence engines in parallel
                     bot_name = self.character_name or get_normalized_bot_name_from_env()
                     user_id = message_context.user_id
-                    
-                    import asyncio
+
                     strategic_results = await asyncio.gather(
                         self._get_cached_memory_health(user_id, bot_name),
                         self._get_cached_character_performance(user_id, bot_name),
@@ -1235,7 +1559,7 @@ class MessageProcessor:
                     cache_hits = 0
                     for i, (name, result) in enumerate(zip(engine_names, strategic_results)):
                         if isinstance(result, Exception):
-                            logger.debug(f"Strategic cache retrieval error ({name}): {result}")
+                            logger.debug("Strategic cache retrieval error (%s): %s", name, result)
                             strategic_intelligence[name] = None
                         elif result:
                             strategic_intelligence[name] = result
@@ -1245,14 +1569,15 @@ class MessageProcessor:
                     
                     if cache_hits > 0:
                         logger.info(
-                            f"🧠 STRATEGIC INTELLIGENCE: Retrieved {cache_hits}/7 engines "
-                            f"({', '.join(n for n, r in zip(engine_names, strategic_results) if r and not isinstance(r, Exception))})"
+                            "🧠 STRATEGIC INTELLIGENCE: Retrieved %d/7 engines (%s)",
+                            cache_hits,
+                            ', '.join(n for n, r in zip(engine_names, strategic_results) if r and not isinstance(r, Exception))
                         )
                     else:
-                        logger.debug(f"Strategic intelligence: No cached data available (enrichment worker may not have run yet)")
+                        logger.debug("Strategic intelligence: No cached data available (enrichment worker may not have run yet)")
                         
                 except Exception as e:
-                    logger.warning(f"Strategic intelligence retrieval failed (non-blocking): {e}")
+                    logger.warning("Strategic intelligence retrieval failed (non-blocking): %s", e)
                     strategic_intelligence = {}
             
             # Store in ai_components for CDL prompt enhancement (Phase 3G-3)
@@ -1291,7 +1616,7 @@ class MessageProcessor:
             
             # Phase 6: Image processing if attachments present
             if message_context.attachments:
-                logger.info(f"📎 PHASE 6: Processing {len(message_context.attachments)} attachment(s) for user {message_context.user_id}")
+                logger.info("📎 PHASE 6: Processing %d attachment(s) for user %s", len(message_context.attachments), message_context.user_id)
                 conversation_context = await self._process_attachments(
                     message_context, conversation_context
                 )
@@ -1316,8 +1641,7 @@ class MessageProcessor:
             if self.character_state_manager and self.temporal_client:
                 try:
                     # Get bot name for state tracking
-                    from src.utils.bot_name_utils import get_normalized_bot_name_from_env
-                    character_name = get_normalized_bot_name_from_env()
+                    character_name = self.character_name
                     
                     # Update character state based on bot's emotional response (after response is generated)
                     # Note: This will be called AFTER response generation in Phase 9
@@ -1337,8 +1661,7 @@ class MessageProcessor:
                 
                 try:
                     # Get bot name from environment using standard utility
-                    from src.utils.bot_name_utils import get_normalized_bot_name_from_env
-                    bot_name = get_normalized_bot_name_from_env()
+                    bot_name = self.character_name
                     
                     logger.info(
                         "🔧 TOOL FILTER: Query passed selective filter, running classifier | "
@@ -1379,11 +1702,11 @@ class MessageProcessor:
                 )
             
             # Phase 7: Response generation
-            print(f"🎯 PHASE 7 START: About to call _generate_response for user {message_context.user_id}", flush=True)
+            logger.debug("🎯 PHASE 7 START: Calling _generate_response for user %s", message_context.user_id)
             response = await self._generate_response(
                 message_context, conversation_context, ai_components
             )
-            print(f"✅ PHASE 7 DONE: _generate_response returned {len(response)} chars", flush=True)
+            logger.debug("✅ PHASE 7 DONE: _generate_response returned %d chars", len(response))
             
             # Phase 7.5: Analyze bot's emotional state from response (SERIAL to avoid RoBERTa conflicts)
             bot_emotion = await self._analyze_bot_emotion_with_shared_analyzer(response, message_context, ai_components)
@@ -1462,35 +1785,35 @@ class MessageProcessor:
                     # Continue processing - emoji decoration failure shouldn't break the response
             
             # STAGE 2: Enhanced AI Ethics for Character Learning - Monitor and enhance response
-            if self.enhanced_ai_ethics:
+            # Short-circuit when no character data is loaded - skips the try frame and
+            # context-dict allocation entirely for bots without character archetypes
+            character_data = ai_components.get('character_data') if self.enhanced_ai_ethics else None
+            if self.enhanced_ai_ethics and character_data:
                 try:
-                    # Get character data for archetype determination
-                    character_data = ai_components.get('character_data')
-                    if character_data:
-                        # Get recent user messages for attachment analysis (simplified for initial integration)
-                        recent_messages = [message_context.content]  # Start with current message
-                        
-                        enhanced_response = await self.enhanced_ai_ethics.enhance_character_response(
-                            character=character_data,
-                            user_id=message_context.user_id,
-                            bot_name=get_normalized_bot_name_from_env(),
-                            base_response=response,
-                            recent_user_messages=recent_messages,
-                            conversation_context={
-                                'ai_components': ai_components,
-                                'platform': message_context.platform,
-                                'conversation_metadata': getattr(message_context, 'metadata', {})
-                            }
-                        )
-                        
-                        # Apply the enhanced response if different
-                        if enhanced_response != response:
-                            logger.info("🛡️ ENHANCED AI ETHICS: Applied ethical enhancement for user %s", message_context.user_id)
-                            response = enhanced_response
-                    
+                    # Get recent user messages for attachment analysis (simplified for initial integration)
+                    recent_messages = [message_context.content]  # Start with current message
+
+                    enhanced_response = await self.enhanced_ai_ethics.enhance_character_response(
+                        character=character_data,
+                        user_id=message_context.user_id,
+                        bot_name=self.character_name,
+                        base_response=response,
+                        recent_user_messages=recent_messages,
+                        conversation_context={
+                            'ai_components': ai_components,
+                            'platform': message_context.platform,
+                            'conversation_metadata': getattr(message_context, 'metadata', {})
+                        }
+                    )
+
+                    # Apply the enhanced response if different
+                    if enhanced_response != response:
+                        logger.info("🛡️ ENHANCED AI ETHICS: Applied ethical enhancement for user %s", message_context.user_id)
+                        response = enhanced_response
+
                     # Store ethics processing flag for metadata
                     ai_components['enhanced_ai_ethics_processed'] = True
-                    
+
                 except Exception as e:
                     logger.warning("Enhanced AI Ethics processing failed: %s", e)
 
@@ -1541,8 +1864,7 @@ class MessageProcessor:
             # NOT used in prompt building (CDL personality system handles that)
             if self.character_state_manager and self.temporal_client:
                 try:
-                    from src.utils.bot_name_utils import get_normalized_bot_name_from_env
-                    character_name = get_normalized_bot_name_from_env()
+                    character_name = self.character_name
                     
                     # Get bot emotion data from AI components
                     bot_emotion_data = ai_components.get('bot_emotion', {})
@@ -1590,9 +1912,8 @@ class MessageProcessor:
                 message_context, ai_components, relevant_memories, response
             )
             
-            # Calculate processing time
-            end_time = datetime.now()
-            processing_time_ms = int((end_time - start_time).total_seconds() * 1000)
+            # Calculate processing time (monotonic clock - immune to wall-clock jumps)
+            processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             
             # Extract LLM timing from ai_components
             llm_time_ms = ai_components.get('llm_time_ms', 0)
@@ -1651,16 +1972,19 @@ class MessageProcessor:
                             stance_confidence=0.0
                         )
                 except Exception as e:
-                    logger.debug(f"Failed to record emotion/stance metrics: {e}")
+                    logger.debug("Failed to record emotion/stance metrics: %s", e)
             
             # Phase 5: Record temporal intelligence metrics
-            await self._record_temporal_metrics(
-                message_context=message_context,
-                ai_components=ai_components,
-                relevant_memories=relevant_memories,
-                response=response,
-                processing_time_ms=processing_time_ms
-            )
+            # Guard at the call site - skips the coroutine round trip entirely
+            # for deployments without InfluxDB
+            if self.temporal_client and self.confidence_analyzer:
+                await self._record_temporal_metrics(
+                    message_context=message_context,
+                    ai_components=ai_components,
+                    relevant_memories=relevant_memories,
+                    response=response,
+                    processing_time_ms=processing_time_ms
+                )
             
             logger.info("✅ MESSAGE PROCESSOR: Successfully processed message for user %s in %dms", 
                        message_context.user_id, processing_time_ms)
@@ -1689,8 +2013,7 @@ class MessageProcessor:
             )
             
         except (ValueError, KeyError, TypeError) as e:
-            end_time = datetime.now()
-            processing_time_ms = int((end_time - start_time).total_seconds() * 1000)
+            processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             
             logger.error("❌ MESSAGE PROCESSOR: Failed to process message for user %s: %s", 
                         message_context.user_id, str(e))
@@ -1717,96 +2040,90 @@ class MessageProcessor:
 
         try:
             # Get bot name from environment
-            bot_name = os.getenv('DISCORD_BOT_NAME', 'unknown')
-            
-            # Calculate confidence metrics
-            confidence_metrics = self.confidence_analyzer.calculate_confidence_metrics(
-                ai_components=ai_components,
-                memory_count=len(relevant_memories) if relevant_memories else 0,
-                processing_time_ms=processing_time_ms
-            )
-            
-            # Calculate relationship metrics (using actual PostgreSQL scores)
-            relationship_metrics = await self.confidence_analyzer.calculate_relationship_metrics(
+            bot_name = self._bot_name
+
+            # Calculate confidence, relationship (actual PostgreSQL scores), and
+            # conversation quality metrics in a single pass over ai_components
+            all_metrics = await self.confidence_analyzer.calculate_all(
                 user_id=message_context.user_id,
                 ai_components=ai_components,
-                conversation_history_length=len(relevant_memories) if relevant_memories else 0
-            )
-            
-            # Calculate conversation quality metrics
-            quality_metrics = self.confidence_analyzer.calculate_conversation_quality(
-                ai_components=ai_components,
+                memory_count=len(relevant_memories) if relevant_memories else 0,
                 response_length=len(response),
                 processing_time_ms=processing_time_ms
             )
+            confidence_metrics = all_metrics.confidence
+            relationship_metrics = all_metrics.relationship
+            quality_metrics = all_metrics.quality
             
-            # Phase 7.5: Record bot emotion separately in InfluxDB
+            # Record metrics to InfluxDB (async, non-blocking)
+            temporal_tasks = [
+                self._tc_record_confidence_evolution(
+                    bot_name=bot_name,
+                    user_id=message_context.user_id,
+                    confidence_metrics=confidence_metrics
+                ),
+                self._tc_record_relationship_progression(
+                    bot_name=bot_name,
+                    user_id=message_context.user_id,
+                    relationship_metrics=relationship_metrics
+                ),
+                self._tc_record_conversation_quality(
+                    bot_name=bot_name,
+                    user_id=message_context.user_id,
+                    quality_metrics=quality_metrics
+                ),
+            ]
+
+            # Phase 7.5: Record bot emotion in the same InfluxDB batch (independent write)
             bot_emotion = ai_components.get('bot_emotion')
             if bot_emotion and isinstance(bot_emotion, dict):
-                try:
+                if self._tc_record_bot_emotion is not None:
                     # Record bot emotion as separate metric for temporal tracking
-                    await self.temporal_client.record_bot_emotion(
+                    temporal_tasks.append(self._tc_record_bot_emotion(
                         bot_name=bot_name,
                         user_id=message_context.user_id,
                         primary_emotion=bot_emotion.get('primary_emotion', 'neutral'),
                         intensity=bot_emotion.get('intensity', 0.0),
                         confidence=bot_emotion.get('confidence', 0.0)
-                    )
+                    ))
                     logger.debug(
-                        "📊 TEMPORAL: Recorded bot emotion '%s' to InfluxDB (intensity: %.2f)",
+                        "📊 TEMPORAL: Added bot emotion '%s' to batch recording (intensity: %.2f)",
                         bot_emotion.get('primary_emotion', 'neutral'),
                         bot_emotion.get('intensity', 0.0)
                     )
-                except AttributeError:
+                    # User now has emotion history - re-enable trajectory analysis
+                    self._users_without_bot_emotion_history.discard(message_context.user_id)
+                else:
                     # record_bot_emotion method doesn't exist yet - log for now
                     logger.debug("Bot emotion recording not yet implemented in TemporalIntelligenceClient")
-            
-            # Phase 7.5: Record user emotion to InfluxDB (CRITICAL FIX)
+
+            # Phase 7.5: Record user emotion in the same InfluxDB batch (CRITICAL FIX)
             user_emotion = ai_components.get('emotion_data')
             if user_emotion and isinstance(user_emotion, dict):
-                try:
+                if self._tc_record_user_emotion is not None:
                     # Record user emotion for temporal tracking and character tuning
                     # FIX: Use 'emotional_intensity' field (RoBERTa standard), not 'intensity'
-                    await self.temporal_client.record_user_emotion(
+                    temporal_tasks.append(self._tc_record_user_emotion(
                         bot_name=bot_name,
                         user_id=message_context.user_id,
                         primary_emotion=user_emotion.get('primary_emotion', 'neutral'),
                         intensity=user_emotion.get('emotional_intensity', user_emotion.get('intensity', 0.0)),  # Try emotional_intensity first, fallback to intensity
                         confidence=user_emotion.get('roberta_confidence', user_emotion.get('confidence', 0.0))  # Try roberta_confidence first
-                    )
+                    ))
                     logger.debug(
-                        "📊 TEMPORAL: Recorded user emotion '%s' to InfluxDB (intensity: %.2f)",
+                        "📊 TEMPORAL: Added user emotion '%s' to batch recording (intensity: %.2f)",
                         user_emotion.get('primary_emotion', 'neutral'),
                         user_emotion.get('emotional_intensity', user_emotion.get('intensity', 0.0))
                     )
-                except AttributeError:
+                else:
                     # record_user_emotion method doesn't exist yet - log for now
                     logger.debug("User emotion recording not yet implemented in TemporalIntelligenceClient")
-            
-            # Record metrics to InfluxDB (async, non-blocking)
-            temporal_tasks = [
-                self.temporal_client.record_confidence_evolution(
-                    bot_name=bot_name,
-                    user_id=message_context.user_id,
-                    confidence_metrics=confidence_metrics
-                ),
-                self.temporal_client.record_relationship_progression(
-                    bot_name=bot_name,
-                    user_id=message_context.user_id,
-                    relationship_metrics=relationship_metrics
-                ),
-                self.temporal_client.record_conversation_quality(
-                    bot_name=bot_name,
-                    user_id=message_context.user_id,
-                    quality_metrics=quality_metrics
-                ),
-            ]
-            
+
             # Add memory aging metrics if available
             memory_aging = ai_components.get('memory_aging_intelligence')
             if memory_aging and isinstance(memory_aging, dict):
-                try:
-                    memory_aging_task = self.temporal_client.record_memory_aging_metrics(
+                if self._tc_record_memory_aging is not None:
+                    memory_aging_task = self._tc_record_memory_aging(
                         bot_name=bot_name,
                         user_id=message_context.user_id,
                         health_status=memory_aging.get('health_status', 'unknown'),
@@ -1817,7 +2134,7 @@ class MessageProcessor:
                     )
                     temporal_tasks.append(memory_aging_task)
                     logger.debug("📊 TEMPORAL: Added memory aging metrics to batch recording")
-                except AttributeError:
+                else:
                     # record_memory_aging_metrics method doesn't exist yet - skip for now
                     logger.debug("Memory aging metrics recording not yet implemented in TemporalIntelligenceClient")
             
@@ -1826,8 +2143,8 @@ class MessageProcessor:
             # CharacterGraphManager metrics (if available)
             character_performance = ai_components.get('character_performance_intelligence')
             if character_performance and isinstance(character_performance, dict):
-                try:
-                    character_graph_task = self.temporal_client.record_character_graph_performance(
+                if self._tc_record_character_graph is not None:
+                    character_graph_task = self._tc_record_character_graph(
                         bot_name=bot_name,
                         user_id=message_context.user_id,
                         operation="knowledge_query",
@@ -1838,13 +2155,13 @@ class MessageProcessor:
                     )
                     temporal_tasks.append(character_graph_task)
                     logger.debug("📊 TEMPORAL: Added character graph performance metrics to batch recording")
-                except AttributeError:
+                else:
                     logger.debug("Character graph performance recording not yet implemented in TemporalIntelligenceClient")
             
             # UnifiedCharacterIntelligenceCoordinator metrics (if available)
             unified_intelligence = ai_components.get('unified_character_intelligence')
             if unified_intelligence and isinstance(unified_intelligence, dict):
-                try:
+                if self._tc_record_intelligence_coordination is not None:
                     systems_used = ["conversation_intelligence", "memory_boost"]  # Default systems
                     coordination_metadata = unified_intelligence.get('coordination_metadata', {})
                     if not isinstance(coordination_metadata, dict):
@@ -1854,7 +2171,7 @@ class MessageProcessor:
                     if not isinstance(performance_metrics, dict):
                         performance_metrics = {}
                     
-                    coordination_task = self.temporal_client.record_intelligence_coordination_metrics(
+                    coordination_task = self._tc_record_intelligence_coordination(
                         bot_name=bot_name,
                         user_id=message_context.user_id,
                         systems_used=systems_used,
@@ -1867,13 +2184,13 @@ class MessageProcessor:
                     )
                     temporal_tasks.append(coordination_task)
                     logger.debug("📊 TEMPORAL: Added intelligence coordination metrics to batch recording")
-                except AttributeError:
+                else:
                     logger.debug("Intelligence coordination metrics recording not yet implemented in TemporalIntelligenceClient")
             
             # Enhanced Vector Emotion Analyzer metrics (already handled individually but can aggregate)
             emotion_analysis = ai_components.get('emotion_analysis')
             if emotion_analysis and isinstance(emotion_analysis, dict):
-                try:
+                if self._tc_record_emotion_analysis_perf is not None:
                     # Note: Individual emotion analysis metrics are recorded by the analyzer itself
                     # This aggregates them for overall message processing metrics
                     all_emotions = emotion_analysis.get('all_emotions', {})
@@ -1882,7 +2199,7 @@ class MessageProcessor:
                     else:
                         emotion_count = 0
                     
-                    emotion_task = self.temporal_client.record_emotion_analysis_performance(
+                    emotion_task = self._tc_record_emotion_analysis_perf(
                         bot_name=bot_name,
                         user_id=message_context.user_id,
                         analysis_time_ms=emotion_analysis.get('analysis_time_ms', 0),
@@ -1892,21 +2209,21 @@ class MessageProcessor:
                     )
                     temporal_tasks.append(emotion_task)
                     logger.debug("📊 TEMPORAL: Added emotion analysis performance metrics to batch recording")
-                except AttributeError:
+                else:
                     logger.debug("Emotion analysis performance recording not yet implemented in TemporalIntelligenceClient")
             
             # Vector Memory System metrics (memory retrieval performance)
             if relevant_memories:
-                try:
+                if self._tc_record_vector_memory_perf is not None:
                     # Filter out None values and calculate average relevance score
                     valid_memories = [mem for mem in relevant_memories if mem and isinstance(mem, dict)]
                     if valid_memories:
                         avg_relevance = sum(mem.get('score', 0.0) for mem in valid_memories) / len(valid_memories)
                         
-                        # Get collection name from environment
-                        collection_name = os.getenv('QDRANT_COLLECTION_NAME', f'whisperengine_memory_{bot_name.lower()}')
+                        # Collection name cached at init (stable for process lifetime)
+                        collection_name = self._collection_name
                         
-                        vector_memory_task = self.temporal_client.record_vector_memory_performance(
+                        vector_memory_task = self._tc_record_vector_memory_perf(
                             bot_name=bot_name,
                             user_id=message_context.user_id,
                             operation="message_processing_retrieval",
@@ -1918,7 +2235,7 @@ class MessageProcessor:
                         )
                         temporal_tasks.append(vector_memory_task)
                         logger.debug("📊 TEMPORAL: Added vector memory performance metrics to batch recording")
-                except AttributeError:
+                else:
                     logger.debug("Vector memory performance recording not yet implemented in TemporalIntelligenceClient")
             
             await asyncio.gather(
@@ -1952,33 +2269,32 @@ class MessageProcessor:
                     logger.debug("ML Shadow Mode: Prediction logging failed - %s", e)
             
             # Relationship Intelligence: Lazy initialization and update of dynamic relationship scores
-            await self._ensure_relationship_initialized()
+            self._ensure_relationship_initialized()
             
             if self.relationship_engine:
                 try:
-                    # Map quality_metrics to ConversationQuality enum (TrendWise)
-                    from src.relationships.evolution_engine import ConversationQuality
-                    
+                    # Map quality_metrics to ConversationQuality enum (TrendWise).
+                    # The bucket table is built once — enum members are singletons
+                    if self._conv_quality_levels is None:
+                        from src.relationships.evolution_engine import ConversationQuality
+                        self._conv_quality_levels = (
+                            ConversationQuality.FAILED, ConversationQuality.POOR,
+                            ConversationQuality.AVERAGE, ConversationQuality.GOOD,
+                            ConversationQuality.EXCELLENT
+                        )
+
                     # Calculate overall quality score from metrics
+                    qm = quality_metrics
                     avg_quality = (
-                        quality_metrics.engagement_score +
-                        quality_metrics.satisfaction_score +
-                        quality_metrics.natural_flow_score +
-                        quality_metrics.emotional_resonance +
-                        quality_metrics.topic_relevance
+                        qm.engagement_score + qm.satisfaction_score +
+                        qm.natural_flow_score + qm.emotional_resonance +
+                        qm.topic_relevance
                     ) / 5.0
                     
-                    # Map to ConversationQuality enum
-                    if avg_quality >= 0.85:
-                        conversation_quality = ConversationQuality.EXCELLENT
-                    elif avg_quality >= 0.70:
-                        conversation_quality = ConversationQuality.GOOD
-                    elif avg_quality >= 0.50:
-                        conversation_quality = ConversationQuality.AVERAGE
-                    elif avg_quality >= 0.30:
-                        conversation_quality = ConversationQuality.POOR
-                    else:
-                        conversation_quality = ConversationQuality.FAILED
+                    # Map to ConversationQuality enum via threshold table
+                    conversation_quality = self._conv_quality_levels[
+                        bisect.bisect_right(_QUALITY_THRESHOLDS, avg_quality)
+                    ]
                     
                     # Get RoBERTa emotion data (Enhanced Emotion Intelligence)
                     emotion_data = ai_components.get('emotion_data', {})
@@ -2012,8 +2328,12 @@ class MessageProcessor:
             logger.warning("Failed to record temporal metrics: %s", str(e))
             logger.debug("Temporal metrics error traceback: %s", traceback.format_exc())
     
-    async def _ensure_relationship_initialized(self):
-        """Lazy initialization of Relationship Intelligence components (postgres_pool may not be ready at __init__ time)."""
+    def _ensure_relationship_initialized(self):
+        """Lazy initialization of Relationship Intelligence components (postgres_pool may not be ready at __init__ time).
+
+        Plain (non-async) method: nothing in the body awaits, and it is called
+        on every message — a coroutine here would just add scheduling overhead.
+        """
         if self._relationship_init_attempted:
             return  # Already tried, don't spam logs
         
@@ -2059,36 +2379,23 @@ class MessageProcessor:
         """
         try:
             # Ensure relationship evolution system is initialized
-            await self._ensure_relationship_initialized()
+            self._ensure_relationship_initialized()
             
             if not self.relationship_engine:
                 logger.debug("Relationship Intelligence: Relationship engine not available for prompt injection")
                 return
             
-            bot_name = os.getenv('DISCORD_BOT_NAME', 'unknown')
-            
-            # RELATIONSHIP INTELLIGENCE: Get current relationship scores
-            try:
-                scores = await self.relationship_engine._get_current_scores(
+            bot_name = self._bot_name
+
+            # RELATIONSHIP INTELLIGENCE: Kick off the Postgres round trip now so it
+            # overlaps with the quality-trend query and confidence computation below
+            scores_task = asyncio.create_task(
+                self.relationship_engine._get_current_scores(
                     user_id=message_context.user_id,
                     bot_name=bot_name
                 )
-                
-                if scores:
-                    ai_components['relationship_state'] = {
-                        'trust': float(scores.trust),
-                        'affection': float(scores.affection),
-                        'attunement': float(scores.attunement),
-                        'interaction_count': int(scores.interaction_count),
-                        'relationship_depth': self._calculate_relationship_depth(scores)
-                    }
-                    logger.info(
-                        "🎯 RELATIONSHIP: Added relationship scores - trust=%.3f, affection=%.3f, attunement=%.3f",
-                        scores.trust, scores.affection, scores.attunement
-                    )
-            except Exception as e:
-                logger.debug("Relationship Intelligence: Could not retrieve relationship scores: %s", e)
-            
+            )
+
             # TRENDWISE ANALYTICS: Get conversation quality trends from InfluxDB
             if self.temporal_client and self.temporal_client.enabled:
                 try:
@@ -2132,6 +2439,9 @@ class MessageProcessor:
                         processing_time_ms=0.0
                     )
                     
+                    # NOTE: stays a plain dict — ai_components is returned verbatim
+                    # as JSON API metadata and read dict-style by the status
+                    # footer and trigger-fusion consumers
                     ai_components['conversation_confidence'] = {
                         'overall_confidence': confidence_metrics.overall_confidence,
                         'context_confidence': confidence_metrics.context_confidence,
@@ -2143,26 +2453,41 @@ class MessageProcessor:
                     )
                 except Exception as e:
                     logger.debug("TrendWise Analytics: Could not calculate confidence metrics: %s", e)
-            
+
+            # RELATIONSHIP INTELLIGENCE: Collect the scores fetched concurrently above
+            try:
+                scores = await scores_task
+
+                if scores:
+                    trust = float(scores.trust)
+                    affection = float(scores.affection)
+                    attunement = float(scores.attunement)
+                    # NOTE: stays a plain dict for the same serialization
+                    # contract as conversation_confidence above
+                    ai_components['relationship_state'] = {
+                        'trust': trust,
+                        'affection': affection,
+                        'attunement': attunement,
+                        'interaction_count': int(scores.interaction_count),
+                        'relationship_depth': self._calculate_relationship_depth(scores)
+                    }
+                    logger.info(
+                        "🎯 RELATIONSHIP: Added relationship scores - trust=%.3f, affection=%.3f, attunement=%.3f",
+                        trust, affection, attunement
+                    )
+            except Exception as e:
+                logger.debug("Relationship Intelligence: Could not retrieve relationship scores: %s", e)
+
             # Enhanced Emotion Intelligence RoBERTa data is already in ai_components['emotion_data']
-            
+
         except Exception as e:
             logger.warning("Failed to enrich AI components with adaptive learning data: %s", str(e))
     
     def _calculate_relationship_depth(self, scores) -> str:
         """Calculate human-readable relationship depth from scores."""
-        avg_score = (float(scores.trust) + float(scores.affection) + float(scores.attunement)) / 3.0
-        
-        if avg_score >= 0.8:
-            return "deep_bond"
-        elif avg_score >= 0.6:
-            return "strong_connection"
-        elif avg_score >= 0.4:
-            return "growing_relationship"
-        elif avg_score >= 0.2:
-            return "acquaintance"
-        else:
-            return "new_connection"
+        # Single float() on the sum (scores may arrive as Decimal from Postgres)
+        avg_score = float(scores.trust + scores.affection + scores.attunement) / 3.0
+        return _DEPTH_LABELS[bisect.bisect_right(_DEPTH_THRESHOLDS, avg_score)]
 
     async def _get_user_display_name(self, message_context: MessageContext) -> str:
         """
@@ -2195,9 +2520,7 @@ class MessageProcessor:
                         fact_content = fact.get('fact', '').lower()
                         if 'preferred name is' in fact_content or 'name is' in fact_content:
                             # Extract name from fact content
-                            import re
-                            match = re.search(r"(?:preferred )?name is ([A-Z][a-zA-Z\-']+)", 
-                                            fact.get('fact', ''), re.IGNORECASE)
+                            match = _PREFERRED_NAME_RE.search(fact.get('fact', ''))
                             if match:
                                 preferred_name = match.group(1)
                                 logger.debug("Extracted preferred name '%s' from fact for user %s", 
@@ -2223,63 +2546,69 @@ class MessageProcessor:
             logger.warning("Error getting user display name: %s", e)
             return "User"
 
-    async def _validate_security(self, message_context: MessageContext) -> Dict[str, Any]:
+    async def _validate_security(self, message_context: MessageContext) -> SecurityValidation:
         """Validate message security and sanitize content."""
         # Check for mystical symbols first (silent ignore) - feature flag controlled
         import os
         enable_mystical_filter = os.getenv("ENABLE_MYSTICAL_SYMBOL_FILTER", "false").lower() == "true"
-        
+
         if enable_mystical_filter:
             mystical_detector = get_mystical_symbol_detector()
             should_ignore, reason = mystical_detector.should_ignore_message(message_context.content)
-            
+
             if should_ignore:
                 logger.info(
                     "🔮 MYSTICAL FILTER: Silently ignoring message from user %s - %s",
                     message_context.user_id, reason
                 )
-                return {
-                    "is_safe": False,
-                    "sanitized_content": message_context.content,
-                    "warnings": ["Mystical symbol content detected"]
-                }
-        
+                return SecurityValidation(
+                    is_safe=False,
+                    sanitized_content=message_context.content,
+                    warnings=["Mystical symbol content detected"]
+                )
+
         if not self.security_validator:
-            return {
-                "is_safe": True,
-                "sanitized_content": message_context.content,
-                "warnings": []
-            }
-        
+            return SecurityValidation(
+                is_safe=True,
+                sanitized_content=message_context.content,
+                warnings=[]
+            )
+
         try:
             # Create adapter for Discord-specific components
             discord_message = create_discord_message_adapter(message_context)
-            
-            validation_result = await self.security_validator.validate_input(discord_message)
+
+            raw_result = await self.security_validator.validate_input(discord_message)
+            validation_result = SecurityValidation(
+                is_safe=raw_result.get("is_safe", True),
+                sanitized_content=raw_result.get("sanitized_content", message_context.content),
+                warnings=raw_result.get("warnings", [])
+            )
             self._last_security_validation = validation_result
             return validation_result
-            
-        except (AttributeError, ValueError, TypeError) as e:
+
+        except _COMMON_EXC as e:
             logger.error("Security validation failed: %s", str(e))
-            return {
-                "is_safe": True,  # Fail open for now
-                "sanitized_content": message_context.content,
-                "warnings": [f"Security validation error: {e}"]
-            }
+            return SecurityValidation(
+                is_safe=True,  # Fail open for now
+                sanitized_content=message_context.content,
+                warnings=[f"Security validation error: {e}"]
+            )
 
-    async def _process_name_detection(self, message_context: MessageContext):
+    def _process_name_detection(self, message_context: MessageContext):
         """
         DISABLED: No automatic name storage.
-        
+
         User's preferred name should only be stored when explicitly mentioned in conversation
-        (e.g., "My name is John", "Call me Sarah"). Discord display names are already 
+        (e.g., "My name is John", "Call me Sarah"). Discord display names are already
         available in metadata for reference but should not be preemptively stored as "preferred name".
-        
+
         This method is kept as a no-op placeholder for the processing pipeline.
+        Plain (non-async) method so the per-message call is a cheap no-op
+        rather than a scheduled coroutine.
         """
         # No-op: Name detection happens naturally through conversation only
         logger.debug("Name detection phase: No automatic storage - waiting for explicit user introduction")
-        pass
 
     async def _process_workflow_detection(self, message_context: MessageContext):
         """
@@ -2295,11 +2624,11 @@ class MessageProcessor:
                 return
             
             # Get bot name for transaction isolation
-            import os
-            bot_name = os.getenv("DISCORD_BOT_NAME", "unknown").lower()
+            bot_name = self._bot_name_lower
             
-            logger.debug("🎯 WORKFLOW: Starting detection for user %s, message: '%s'", 
-                        message_context.user_id, message_context.content[:100])
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("🎯 WORKFLOW: Starting detection for user %s, message: '%s'",
+                            message_context.user_id, message_context.content[:100])
             
             # Detect workflow intent
             trigger_result = await self.bot_core.workflow_manager.detect_intent(
@@ -2320,16 +2649,17 @@ class MessageProcessor:
                     message=message_context.content
                 )
                 
-                # Store workflow context in message metadata for later use in prompt building
-                if not message_context.metadata:
-                    message_context.metadata = {}
-                
-                message_context.metadata['workflow_prompt_injection'] = workflow_result.get("prompt_injection")
-                message_context.metadata['workflow_result'] = workflow_result
-                message_context.metadata['workflow_transaction_id'] = workflow_result.get("transaction_id")
-                
-                logger.info("🎯 WORKFLOW: Executed action '%s', transaction: %s", 
-                           workflow_result.get("action"), workflow_result.get("transaction_id"))
+                # Store workflow context in message metadata for later use in
+                # prompt building (metadata is never None after __post_init__)
+                wr = workflow_result
+                message_context.metadata.update({
+                    'workflow_prompt_injection': wr.get("prompt_injection"),
+                    'workflow_result': wr,
+                    'workflow_transaction_id': wr.get("transaction_id"),
+                })
+
+                logger.info("🎯 WORKFLOW: Executed action '%s', transaction: %s",
+                           wr.get("action"), wr.get("transaction_id"))
             else:
                 logger.debug("🎯 WORKFLOW: No workflow pattern matched for message")
                 
@@ -2536,7 +2866,13 @@ class MessageProcessor:
     ) -> List[Dict[str, Any]]:
         """
         Retrieve relevant memories with multi-vector intelligence and MemoryBoost optimization.
-        
+
+        The ordered strategy chain (multi-vector → MemoryBoost → optimized →
+        context-aware) is resolved once on first call instead of re-probing
+        the memory manager with hasattr on every message. A strategy that
+        fails structurally (missing/incompatible backend API) is dropped from
+        the chain so later messages skip it.
+
         Args:
             message_context: Message context containing user query
             emotional_context: Optional emotional state for emotion-aware memory retrieval
@@ -2546,8 +2882,8 @@ class MessageProcessor:
             return []
 
         try:
-            # Start timing memory retrieval
-            memory_start_time = datetime.now()
+            # Start timing memory retrieval (monotonic clock — immune to wall-clock jumps)
+            memory_start_ns = time.perf_counter_ns()
             
             # 📊 STRATEGIC INTELLIGENCE: Use memory health cache to adapt retrieval
             # Adjust retrieval parameters based on background-computed insights
@@ -2577,156 +2913,227 @@ class MessageProcessor:
             
             # Create platform-agnostic message context classification
             classified_context = self._classify_message_context(message_context)
-            logger.debug("Message context classified: %s", classified_context.context_type.value)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Message context classified: %s", classified_context.context_type.value)
 
-            # 🎯 MULTI-VECTOR INTELLIGENCE: Try intelligent vector routing first if available
-            if hasattr(self.memory_manager, '_multi_vector_coordinator') and self.memory_manager._multi_vector_coordinator:
-                try:
-                    relevant_memories = await self._retrieve_memories_with_multi_vector_intelligence(
-                        message_context,
-                        memory_start_time
-                    )
-                    if relevant_memories:
-                        return relevant_memories
-                    # If multi-vector returns empty, fall through to MemoryBoost
-                    logger.debug("Multi-vector intelligence returned no results, falling back to MemoryBoost")
-                except Exception as e:
-                    logger.warning("Multi-vector intelligence retrieval failed, falling back: %s", str(e))
+            # Resolve the strategy chain once (probes optional backend APIs a single time)
+            if self._memory_retrieval_strategies is None:
+                self._memory_retrieval_strategies = self._resolve_memory_retrieval_strategies()
 
-            # 🚀 MEMORYBOOST: Try enhanced memory retrieval as fallback
-            if hasattr(self.memory_manager, 'retrieve_relevant_memories_with_memoryboost'):
+            for strategy in tuple(self._memory_retrieval_strategies):
                 try:
-                    # Build conversation context for MemoryBoost optimization
-                    conversation_context = self._build_conversation_context_for_memoryboost(message_context)
-                    
-                    # Use MemoryBoost enhanced retrieval with channel privacy filtering
-                    # Apply strategic intelligence adaptations (retrieval_limit adjusted based on memory health)
-                    memoryboost_result = await self.memory_manager.retrieve_relevant_memories_with_memoryboost(
-                        user_id=message_context.user_id,
-                        query=message_context.content,
-                        limit=retrieval_limit,  # 📊 STRATEGIC: Adjusted based on memory health
-                        conversation_context=conversation_context,
-                        apply_quality_scoring=True,
-                        apply_optimizations=True,
-                        channel_type=message_context.channel_type  # 🔒 PRIVACY: Pass channel type for filtering
+                    relevant_memories = await strategy(
+                        message_context=message_context,
+                        classified_context=classified_context,
+                        emotional_context=emotional_context,
+                        retrieval_limit=retrieval_limit,
+                        memory_start_ns=memory_start_ns
                     )
-                    
-                    relevant_memories = memoryboost_result.get('memories', [])
-                    optimization_metadata = memoryboost_result.get('optimization_metadata', {})
-                    performance_metrics = memoryboost_result.get('performance_metrics', {})
-                    
-                    # Calculate actual retrieval timing
-                    memory_end_time = datetime.now()
-                    retrieval_time_ms = int((memory_end_time - memory_start_time).total_seconds() * 1000)
-                    
-                    logger.info("🚀 MEMORYBOOST: Enhanced retrieval returned %d memories in %dms (optimizations: %d, improvement: %.2f%%)", 
-                               len(relevant_memories), 
-                               retrieval_time_ms,
-                               optimization_metadata.get('optimizations_count', 0),
-                               optimization_metadata.get('performance_improvement', 0.0) * 100)
-                    
-                    # Record MemoryBoost metrics to InfluxDB
-                    if self.fidelity_metrics and relevant_memories:
-                        self._record_memoryboost_metrics(
-                            message_context=message_context,
-                            memories=relevant_memories,
-                            optimization_metadata=optimization_metadata,
-                            performance_metrics=performance_metrics,
-                            retrieval_time_ms=retrieval_time_ms
-                        )
-                    
-                    return relevant_memories
-                    
+                except (AttributeError, TypeError) as e:
+                    # Structural failure — the backend lacks this API; skip it
+                    # for the rest of the process lifetime
+                    logger.warning("Memory retrieval strategy %s unavailable, disabling: %s",
+                                   strategy.__name__, str(e))
+                    if len(self._memory_retrieval_strategies) > 1:
+                        self._memory_retrieval_strategies.remove(strategy)
+                    continue
                 except Exception as e:
-                    logger.warning("MemoryBoost retrieval failed, falling back to optimized retrieval: %s", str(e))
-                    # Continue to optimized retrieval fallback
+                    # Transient failure — fall through but keep the strategy
+                    logger.warning("Memory retrieval strategy %s failed, falling back: %s",
+                                   strategy.__name__, str(e))
+                    continue
 
-            # Try optimized memory retrieval as fallback if MemoryBoost is not available
-            if hasattr(self.memory_manager, 'retrieve_relevant_memories_optimized'):
-                try:
-                    query_type = self._classify_query_type(message_context.content)
-                    user_preferences = self._build_user_preferences(message_context.user_id, classified_context)
-                    filters = self._build_memory_filters(classified_context)
-                    
-                    # Add recency boost and meta-conversation filtering
-                    filters["prefer_recent_conversation"] = True
-                    filters["recency_hours"] = 2
-                    filters["exclude_content_patterns"] = [
-                        "your prompt", "your system prompt", "how you're programmed",
-                        "your character file", "cdl_ai_integration.py", "fix the bot's",
-                        "bot is announcing wrong time", "bot should speak like",
-                        "testing bot response", "bot container",
-                        "bot's speaking style", "bot's detection"
-                    ]
-                    
-                    relevant_memories = await self.memory_manager.retrieve_relevant_memories_optimized(
-                        user_id=message_context.user_id,
-                        query=message_context.content,
-                        query_type=query_type,
-                        user_history=user_preferences,
-                        filters=filters,
-                        limit=20
-                    )
-                    
-                    # Calculate actual retrieval timing
-                    memory_end_time = datetime.now()
-                    retrieval_time_ms = int((memory_end_time - memory_start_time).total_seconds() * 1000)
-                    
-                    logger.info("🚀 MEMORY: Optimized retrieval returned %d memories in %dms", len(relevant_memories), retrieval_time_ms)
-                    
-                    # Record memory quality metrics to InfluxDB with ACTUAL timing
-                    if self.fidelity_metrics and relevant_memories:
-                        # Calculate average relevance score (if available)
-                        relevance_scores = [mem.get('relevance_score', 0.7) for mem in relevant_memories]
-                        avg_relevance = sum(relevance_scores) / len(relevance_scores) if relevance_scores else 0.7
-                        
-                        # Calculate average vector similarity (if available)
-                        vector_similarities = [mem.get('vector_similarity', 0.8) for mem in relevant_memories]
-                        avg_similarity = sum(vector_similarities) / len(vector_similarities) if vector_similarities else 0.8
-                        
-                        self.fidelity_metrics.record_memory_quality(
-                            user_id=message_context.user_id,
-                            operation="optimized_retrieval",
-                            relevance_score=avg_relevance,
-                            retrieval_time_ms=retrieval_time_ms,  # ACTUAL timing
-                            memory_count=len(relevant_memories),
-                            vector_similarity=avg_similarity
-                        )
-                    
+                if relevant_memories is not None:
                     return relevant_memories
-                    
-                except (AttributeError, ValueError, TypeError) as e:
-                    logger.warning("Optimized memory retrieval failed, using fallback: %s", str(e))
-            
-            # Fallback to context-aware retrieval with channel privacy filtering
-            # 🎭 EMOTIONAL MEMORY TRIGGERING: Pass actual emotion instead of "general conversation"
-            effective_emotional_context = emotional_context or "general conversation"
-            
-            relevant_memories = await self.memory_manager.retrieve_context_aware_memories(
-                user_id=message_context.user_id,
-                query=message_context.content,
-                max_memories=20,
-                context=classified_context,
-                emotional_context=effective_emotional_context,  # 🎭 FIX: Use actual detected emotion!
-                channel_type=message_context.channel_type  # 🔒 PRIVACY: Pass channel type for filtering
-            )
-            
-            logger.info("🔍 MEMORY: Retrieved %d memories via context-aware fallback (emotion: %s)", 
-                       len(relevant_memories), effective_emotional_context)
-            
-            # REMOVED: Fake estimated memory metrics for fallback - not useful
-            # Fallback doesn't provide real relevance/similarity scores
-            
-            return relevant_memories
-            
-        except (AttributeError, ValueError, TypeError) as e:
+
+            return []
+
+        except _COMMON_EXC as e:
             logger.error("Memory retrieval failed: %s", str(e))
             return []
 
+    def _resolve_memory_retrieval_strategies(self) -> List[Any]:
+        """Probe the memory manager once and build the ordered retrieval chain."""
+        mm = self.memory_manager
+        self._mb_retrieve_legacy = getattr(mm, 'retrieve_relevant_memories_with_memoryboost', None)
+        self._mb_retrieve_optimized = getattr(mm, 'retrieve_relevant_memories_optimized', None)
+        self._ctx_retrieve = getattr(mm, 'retrieve_context_aware_memories', None)
+
+        strategies: List[Any] = []
+        if getattr(mm, '_multi_vector_coordinator', None):
+            strategies.append(self._retrieve_via_multi_vector)
+        if self._mb_retrieve_legacy is not None:
+            strategies.append(self._retrieve_via_memoryboost)
+        if self._mb_retrieve_optimized is not None:
+            strategies.append(self._retrieve_via_optimized)
+        strategies.append(self._retrieve_via_context_aware)
+        logger.debug("Memory retrieval strategy chain: %s", [s.__name__ for s in strategies])
+        return strategies
+
+    async def _retrieve_via_multi_vector(
+        self,
+        message_context: MessageContext,
+        classified_context,
+        emotional_context: Optional[str],
+        retrieval_limit: int,
+        memory_start_ns: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """🎯 MULTI-VECTOR INTELLIGENCE: Intelligent vector routing (first choice)."""
+        relevant_memories = await self._retrieve_memories_with_multi_vector_intelligence(
+            message_context,
+            memory_start_ns
+        )
+        if relevant_memories:
+            return relevant_memories
+        # If multi-vector returns empty, fall through to MemoryBoost
+        logger.debug("Multi-vector intelligence returned no results, falling back to MemoryBoost")
+        return None
+
+    async def _retrieve_via_memoryboost(
+        self,
+        message_context: MessageContext,
+        classified_context,
+        emotional_context: Optional[str],
+        retrieval_limit: int,
+        memory_start_ns: int
+    ) -> List[Dict[str, Any]]:
+        """🚀 MEMORYBOOST: Enhanced memory retrieval with quality scoring."""
+        # Build conversation context for MemoryBoost optimization
+        conversation_context = self._build_conversation_context_for_memoryboost(message_context)
+
+        # Use MemoryBoost enhanced retrieval with channel privacy filtering
+        # Apply strategic intelligence adaptations (retrieval_limit adjusted based on memory health)
+        memoryboost_result = await self._mb_retrieve_legacy(
+            user_id=message_context.user_id,
+            query=message_context.content,
+            limit=retrieval_limit,  # 📊 STRATEGIC: Adjusted based on memory health
+            conversation_context=conversation_context,
+            apply_quality_scoring=True,
+            apply_optimizations=True,
+            channel_type=message_context.channel_type  # 🔒 PRIVACY: Pass channel type for filtering
+        )
+
+        relevant_memories = memoryboost_result.get('memories', [])
+        optimization_metadata = memoryboost_result.get('optimization_metadata', {})
+        performance_metrics = memoryboost_result.get('performance_metrics', {})
+
+        # Calculate actual retrieval timing
+        retrieval_time_ms = (time.perf_counter_ns() - memory_start_ns) // 1_000_000
+
+        logger.info("🚀 MEMORYBOOST: Enhanced retrieval returned %d memories in %dms (optimizations: %d, improvement: %.2f%%)",
+                   len(relevant_memories),
+                   retrieval_time_ms,
+                   optimization_metadata.get('optimizations_count', 0),
+                   optimization_metadata.get('performance_improvement', 0.0) * 100)
+
+        # Record MemoryBoost metrics to InfluxDB
+        if self.fidelity_metrics and relevant_memories:
+            self._record_memoryboost_metrics(
+                message_context=message_context,
+                memories=relevant_memories,
+                optimization_metadata=optimization_metadata,
+                performance_metrics=performance_metrics,
+                retrieval_time_ms=retrieval_time_ms
+            )
+
+        return relevant_memories
+
+    async def _retrieve_via_optimized(
+        self,
+        message_context: MessageContext,
+        classified_context,
+        emotional_context: Optional[str],
+        retrieval_limit: int,
+        memory_start_ns: int
+    ) -> List[Dict[str, Any]]:
+        """Optimized retrieval with query classification and meta-conversation filtering."""
+        query_type = self._classify_query_type(message_context.content)
+        ctx_type, security_level = self._extract_context_fields(classified_context)
+        user_preferences = self._build_user_preferences(message_context.user_id, ctx_type, security_level)
+
+        # Recency boost and meta-conversation filtering come from the shared
+        # static base; only the per-message classification fields vary
+        filters = {**self._build_memory_filters(ctx_type, security_level), **_STATIC_FILTER_BASE}
+
+        relevant_memories = await self._mb_retrieve_optimized(
+            user_id=message_context.user_id,
+            query=message_context.content,
+            query_type=query_type,
+            user_history=user_preferences,
+            filters=filters,
+            limit=20
+        )
+
+        # Calculate actual retrieval timing
+        retrieval_time_ms = (time.perf_counter_ns() - memory_start_ns) // 1_000_000
+
+        logger.info("🚀 MEMORY: Optimized retrieval returned %d memories in %dms", len(relevant_memories), retrieval_time_ms)
+
+        # Record memory quality metrics to InfluxDB with ACTUAL timing
+        if self.fidelity_metrics and relevant_memories:
+            # Average relevance / vector similarity (if available); for larger
+            # result sets hand the reduction to numpy, below that interpreter
+            # overhead dominates and a fused Python loop wins
+            n = len(relevant_memories)
+            if n >= 16:
+                scores = np.empty((n, 2), dtype=np.float32)
+                for i, mem in enumerate(relevant_memories):
+                    scores[i, 0] = mem.get('relevance_score', 0.7)
+                    scores[i, 1] = mem.get('vector_similarity', 0.8)
+                avg_relevance, avg_similarity = (float(v) for v in scores.mean(axis=0))
+            else:
+                relevance_sum = 0.0
+                similarity_sum = 0.0
+                for mem in relevant_memories:
+                    relevance_sum += mem.get('relevance_score', 0.7)
+                    similarity_sum += mem.get('vector_similarity', 0.8)
+                avg_relevance = relevance_sum / n
+                avg_similarity = similarity_sum / n
+
+            self.fidelity_metrics.record_memory_quality(
+                user_id=message_context.user_id,
+                operation="optimized_retrieval",
+                relevance_score=avg_relevance,
+                retrieval_time_ms=retrieval_time_ms,  # ACTUAL timing
+                memory_count=len(relevant_memories),
+                vector_similarity=avg_similarity
+            )
+
+        return relevant_memories
+
+    async def _retrieve_via_context_aware(
+        self,
+        message_context: MessageContext,
+        classified_context,
+        emotional_context: Optional[str],
+        retrieval_limit: int,
+        memory_start_ns: int
+    ) -> List[Dict[str, Any]]:
+        """Context-aware retrieval with channel privacy filtering (final fallback)."""
+        # 🎭 EMOTIONAL MEMORY TRIGGERING: Pass actual emotion instead of "general conversation"
+        effective_emotional_context = emotional_context or "general conversation"
+
+        relevant_memories = await self._ctx_retrieve(
+            user_id=message_context.user_id,
+            query=message_context.content,
+            max_memories=20,
+            context=classified_context,
+            emotional_context=effective_emotional_context,  # 🎭 FIX: Use actual detected emotion!
+            channel_type=message_context.channel_type  # 🔒 PRIVACY: Pass channel type for filtering
+        )
+
+        logger.info("🔍 MEMORY: Retrieved %d memories via context-aware fallback (emotion: %s)",
+                   len(relevant_memories), effective_emotional_context)
+
+        # REMOVED: Fake estimated memory metrics for fallback - not useful
+        # Fallback doesn't provide real relevance/similarity scores
+
+        return relevant_memories
+
     async def _retrieve_memories_with_multi_vector_intelligence(
         self,
         message_context: MessageContext,
-        start_time: datetime
+        start_ns: int
     ) -> List[Dict[str, Any]]:
         """
         🎯 PHASE 2c: UNIFIED QUERY CLASSIFICATION - Single authoritative memory routing.
@@ -2739,7 +3146,7 @@ class MessageProcessor:
         
         Args:
             message_context: Message context with user query
-            start_time: Start time for performance tracking
+            start_ns: perf_counter_ns() captured at retrieval start for performance tracking
             
         Returns:
             List of relevant memories from intelligent unified vector search
@@ -2814,9 +3221,8 @@ class MessageProcessor:
                         )
                     
                     # Calculate retrieval time
-                    end_time = datetime.now()
-                    retrieval_time_ms = int((end_time - start_time).total_seconds() * 1000)
-                    
+                    retrieval_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
                     logger.info(
                         "✅ UNIFIED: Retrieved %d memories in %dms using %s strategy",
                         len(memories),
@@ -2891,9 +3297,8 @@ class MessageProcessor:
                             limit=20
                         )
                     
-                    end_time = datetime.now()
-                    retrieval_time_ms = int((end_time - start_time).total_seconds() * 1000)
-                    
+                    retrieval_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
                     logger.info(
                         "✅ FALLBACK: Retrieved %d memories in %dms using %s strategy",
                         len(memories),
@@ -2954,29 +3359,35 @@ class MessageProcessor:
     def _classify_query_type(self, content: str) -> str:
         """Classify the type of query for memory optimization."""
         content_lower = content.lower()
-        
-        if any(word in content_lower for word in ['remember', 'recall', 'what did', 'told you']):
+        tokens = set(_QUERY_TOKEN_RE.findall(content_lower))
+
+        if tokens & _RECALL_WORDS or 'what did' in content_lower:
             return 'recall'
-        elif any(word in content_lower for word in ['how', 'what', 'why', 'when', 'where']):
+        if tokens & _QUESTION_WORDS:
             return 'question'
-        elif any(word in content_lower for word in ['feel', 'emotion', 'mood', 'sad', 'happy', 'angry']):
+        if tokens & _EMOTION_WORDS:
             return 'emotional'
-        else:
-            return 'general'
+        return 'general'
+
+    @staticmethod
+    def _extract_context_fields(context) -> tuple:
+        """Resolve the classification fields shared by the retrieval filter builders."""
+        return (getattr(context, 'context_type', None),
+                getattr(context, 'security_level', None))
 
-    def _build_user_preferences(self, user_id: str, context) -> Dict[str, Any]:
+    def _build_user_preferences(self, user_id: str, context_type, security_level) -> Dict[str, Any]:
         """Build user preferences for memory filtering."""
         return {
             'user_id': user_id,
-            'context_type': getattr(context, 'context_type', None),
-            'security_level': getattr(context, 'security_level', None)
+            'context_type': context_type,
+            'security_level': security_level
         }
 
-    def _build_memory_filters(self, context) -> Dict[str, Any]:
+    def _build_memory_filters(self, context_type, security_level) -> Dict[str, Any]:
         """Build memory filters from message context."""
         return {
-            'context_type': getattr(context, 'context_type', None),
-            'security_level': getattr(context, 'security_level', None)
+            'context_type': context_type,
+            'security_level': security_level
         }
 
     def _build_conversation_context_for_memoryboost(self, message_context: MessageContext) -> str:
@@ -2987,35 +3398,40 @@ class MessageProcessor:
         memory retrieval based on conversation patterns and user intent.
         """
         try:
-            context_parts = []
-            
-            # Add message content and intent
-            context_parts.append(f"User query: {message_context.content}")
-            
-            # Add platform context
-            if hasattr(message_context, 'platform') and message_context.platform:
-                context_parts.append(f"Platform: {message_context.platform}")
-            
-            # Add channel type context
-            if hasattr(message_context, 'channel_type') and message_context.channel_type:
-                context_parts.append(f"Context: {message_context.channel_type}")
-            
-            # Classify query type for context
+            platform = getattr(message_context, 'platform', None)
+            channel_type = getattr(message_context, 'channel_type', None)
             query_type = self._classify_query_type(message_context.content)
-            context_parts.append(f"Query type: {query_type}")
-            
-            # Add temporal context
-            context_parts.append(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-            
-            # Add user context if available
-            context_parts.append(f"User: {message_context.user_id}")
-            
-            return " | ".join(context_parts)
-            
+
+            platform_part = f"Platform: {platform} | " if platform else ""
+            channel_part = f"Context: {channel_type} | " if channel_type else ""
+
+            return (
+                f"User query: {message_context.content} | "
+                f"{platform_part}{channel_part}"
+                f"Query type: {query_type} | "
+                f"Time: {self._minute_timestamp()} | "
+                f"User: {message_context.user_id}"
+            )
+
         except Exception as e:
             logger.warning("Error building MemoryBoost conversation context: %s", str(e))
             return message_context.content  # Fallback to just the message content
 
+    def _minute_timestamp(self) -> str:
+        """Human-readable timestamp at 1-minute resolution, cached between calls."""
+        minute_key = int(time.monotonic() // 60)
+        if minute_key != self._cached_minute_key:
+            self._cached_minute_key = minute_key
+            self._cached_minute_ts = datetime.now().strftime('%Y-%m-%d %H:%M')
+        return self._cached_minute_ts
+
+    def _get_enhanced_cdl_manager(self, pool):
+        """Lazily create and cache the enhanced CDL manager for the given pool."""
+        if self._enhanced_cdl_manager is None or self._enhanced_cdl_manager.pool is not pool:
+            from src.characters.cdl.enhanced_cdl_manager import create_enhanced_cdl_manager
+            self._enhanced_cdl_manager = create_enhanced_cdl_manager(pool)
+        return self._enhanced_cdl_manager
+
     def _record_memoryboost_metrics(
         self,
         message_context: MessageContext,
@@ -3023,26 +3439,69 @@ class MessageProcessor:
         optimization_metadata: Dict[str, Any],
         performance_metrics: Dict[str, Any],
         retrieval_time_ms: int
+    ) -> None:
+        """
+        🚀 MEMORYBOOST: Queue memory optimization metrics for background recording.
+
+        The InfluxDB write API is synchronous, so aggregation and emission run
+        in a drain task off the hot request path; the caller only pays for a
+        put_nowait. Samples are dropped (with a debug log) if the queue backs
+        up rather than blocking message processing.
+        """
+        if not self.fidelity_metrics:
+            return
+
+        if self._metrics_drain_task is None or self._metrics_drain_task.done():
+            self._metrics_drain_task = asyncio.create_task(self._metrics_drain_loop())
+
+        try:
+            self._metrics_queue.put_nowait((
+                message_context.user_id, memories, optimization_metadata,
+                performance_metrics, retrieval_time_ms
+            ))
+        except asyncio.QueueFull:
+            logger.debug("MemoryBoost metrics queue full; dropping sample")
+
+    async def _metrics_drain_loop(self) -> None:
+        """Drain queued MemoryBoost metric samples and emit them to InfluxDB."""
+        while True:
+            item = await self._metrics_queue.get()
+            try:
+                # The InfluxDB write API is SYNCHRONOUS (blocking HTTP); run it
+                # in a worker thread so the drain doesn't stall the event loop
+                await asyncio.to_thread(self._emit_memoryboost_metrics, *item)
+            finally:
+                self._metrics_queue.task_done()
+
+    def _emit_memoryboost_metrics(
+        self,
+        user_id: str,
+        memories: List[Dict[str, Any]],
+        optimization_metadata: Dict[str, Any],
+        performance_metrics: Dict[str, Any],
+        retrieval_time_ms: int
     ) -> None:
         """
         🚀 MEMORYBOOST: Record memory optimization metrics to InfluxDB for analytics.
-        
+
         Records detailed metrics about MemoryBoost performance including
         optimization effectiveness, quality scoring results, and performance impact.
         """
         try:
             if not self.fidelity_metrics:
                 return
-            
-            # Record standard memory quality metrics
-            relevance_scores = [mem.get('quality_score', mem.get('score', 0.7)) for mem in memories]
-            avg_relevance = sum(relevance_scores) / len(relevance_scores) if relevance_scores else 0.7
-            
-            vector_similarities = [mem.get('score', 0.8) for mem in memories]
-            avg_similarity = sum(vector_similarities) / len(vector_similarities) if vector_similarities else 0.8
-            
+
+            # Record standard memory quality metrics (single pass over memories)
+            relevance_sum = 0.0
+            similarity_sum = 0.0
+            for mem in memories:
+                relevance_sum += mem.get('quality_score', mem.get('score', 0.7))
+                similarity_sum += mem.get('score', 0.8)
+            avg_relevance = relevance_sum / len(memories) if memories else 0.7
+            avg_similarity = similarity_sum / len(memories) if memories else 0.8
+
             self.fidelity_metrics.record_memory_quality(
-                user_id=message_context.user_id,
+                user_id=user_id,
                 operation="memoryboost_retrieval",
                 relevance_score=avg_relevance,
                 retrieval_time_ms=retrieval_time_ms,
@@ -3055,7 +3514,7 @@ class MessageProcessor:
                 # Record optimization metrics
                 self.fidelity_metrics.record_custom_metric(
                     metric_name="memoryboost_optimizations",
-                    user_id=message_context.user_id,
+                    user_id=user_id,
                     tags={
                         'quality_scoring_applied': optimization_metadata.get('quality_scoring_applied', False),
                         'optimizations_applied': optimization_metadata.get('optimizations_applied', False),
@@ -3071,23 +3530,31 @@ class MessageProcessor:
                     }
                 )
                 
-                # Record quality distribution
+                # Record quality distribution via numpy reductions: one C-level
+                # pass per statistic instead of interpreter loops over the list
                 if memories:
-                    quality_scores = [mem.get('quality_score', 0.7) for mem in memories]
-                    boost_factors = [mem.get('boost_factor', 1.0) for mem in memories]
-                    
+                    n = len(memories)
+                    quality = np.fromiter(
+                        (mem.get('quality_score', 0.7) for mem in memories),
+                        dtype=np.float32, count=n
+                    )
+                    boost = np.fromiter(
+                        (mem.get('boost_factor', 1.0) for mem in memories),
+                        dtype=np.float32, count=n
+                    )
+
                     self.fidelity_metrics.record_custom_metric(
                         metric_name="memoryboost_quality_distribution",
-                        user_id=message_context.user_id,
+                        user_id=user_id,
                         tags={'operation': 'quality_analysis'},
                         fields={
-                            'avg_quality_score': sum(quality_scores) / len(quality_scores),
-                            'max_quality_score': max(quality_scores),
-                            'min_quality_score': min(quality_scores),
-                            'avg_boost_factor': sum(boost_factors) / len(boost_factors),
-                            'max_boost_factor': max(boost_factors),
-                            'memories_boosted': len([b for b in boost_factors if b > 1.0]),
-                            'memories_penalized': len([b for b in boost_factors if b < 1.0])
+                            'avg_quality_score': float(quality.mean()),
+                            'max_quality_score': float(quality.max()),
+                            'min_quality_score': float(quality.min()),
+                            'avg_boost_factor': float(boost.mean()),
+                            'max_boost_factor': float(boost.max()),
+                            'memories_boosted': int((boost > 1.0).sum()),
+                            'memories_penalized': int((boost < 1.0).sum())
                         }
                     )
             
@@ -3138,8 +3605,14 @@ class MessageProcessor:
         
         Returns: List of messages in OpenAI chat format (role + content)
         """
-        logger.info(f"🚀 STRUCTURED CONTEXT: Building for user {message_context.user_id}")
-        
+        logger.info("🚀 STRUCTURED CONTEXT: Building for user %s", message_context.user_id)
+
+        # Kick off the conversation-history fetch now — it only needs the user id,
+        # so its Qdrant round-trip overlaps the CDL/Postgres component building below
+        recent_messages_task = asyncio.create_task(
+            self._get_recent_messages_structured(message_context.user_id)
+        )
+
         # Initialize assembler with token budget (approximate - converted to chars in components)
         # Phase 2B: Upgraded to 20K tokens (~80K chars) for CDL integration
         # Previous: 16K tokens for basic prompts
@@ -3152,7 +3625,6 @@ class MessageProcessor:
         # CDL COMPONENTS 1-2: Character Identity & Mode (Priorities 1-2)
         # ================================
         # 🎭 CDL CHARACTER: Load character identity and mode from database
-        from src.memory.vector_memory_system import get_normalized_bot_name_from_env
         from src.prompts.cdl_component_factories import (
             create_character_identity_component,
             create_character_mode_component,
@@ -3164,20 +3636,19 @@ class MessageProcessor:
             create_response_mode_component,
             create_final_response_guidance_component,
         )
-        from src.characters.cdl.enhanced_cdl_manager import create_enhanced_cdl_manager
         from src.database.postgres_pool_manager import get_postgres_pool
         from src.prompts.cdl_component_factories import create_final_response_guidance_component
         from src.prompts.prompt_components import is_component_enabled, PromptComponent, PromptComponentType
         
         try:
-            bot_name = get_normalized_bot_name_from_env()
+            bot_name = self.character_name
             pool = await get_postgres_pool()
             
             if not pool:
                 logger.error(f"❌ STRUCTURED CONTEXT: PostgreSQL pool not available for {bot_name} - CDL components will be skipped. This may indicate database connection failure on bot startup.")
             
             if pool:
-                enhanced_manager = create_enhanced_cdl_manager(pool)
+                enhanced_manager = self._get_enhanced_cdl_manager(pool)
                 
                 # Component 1: Character Identity (Priority 1)
                 if is_component_enabled(PromptComponentType.CHARACTER_IDENTITY):
@@ -3187,11 +3658,11 @@ class MessageProcessor:
                     )
                     if identity_component:
                         assembler.add_component(identity_component)
-                        logger.info(f"✅ STRUCTURED CONTEXT: Added CDL character identity for {bot_name}")
+                        logger.info("✅ STRUCTURED CONTEXT: Added CDL character identity for %s", bot_name)
                     else:
-                        logger.warning(f"⚠️ STRUCTURED CONTEXT: No character identity found for {bot_name}")
+                        logger.warning("⚠️ STRUCTURED CONTEXT: No character identity found for %s", bot_name)
                 else:
-                    logger.debug(f"⏭️  STRUCTURED CONTEXT: Skipped character identity processing (disabled)")
+                    logger.debug("⏭️  STRUCTURED CONTEXT: Skipped character identity processing (disabled)")
                 
                 # Component 2: Character Mode (Priority 2) - AI identity handling
                 if is_component_enabled(PromptComponentType.CHARACTER_MODE):
@@ -3201,11 +3672,11 @@ class MessageProcessor:
                     )
                     if mode_component:
                         assembler.add_component(mode_component)
-                        logger.info(f"✅ STRUCTURED CONTEXT: Added CDL character mode for {bot_name}")
+                        logger.info("✅ STRUCTURED CONTEXT: Added CDL character mode for %s", bot_name)
                     else:
-                        logger.warning(f"⚠️ STRUCTURED CONTEXT: No character mode found for {bot_name}")
+                        logger.warning("⚠️ STRUCTURED CONTEXT: No character mode found for %s", bot_name)
                 else:
-                    logger.debug(f"⏭️  STRUCTURED CONTEXT: Skipped character mode processing (disabled)")
+                    logger.debug("⏭️  STRUCTURED CONTEXT: Skipped character mode processing (disabled)")
                 
                 # Component 3: Response Mode (Priority 1 - HIGHEST!) - Response length constraints & style
                 # CRITICAL: Response mode must be HIGH priority (even higher than character identity!)
@@ -3218,11 +3689,11 @@ class MessageProcessor:
                     )
                     if response_mode_component:
                         assembler.add_component(response_mode_component)
-                        logger.info(f"✅ STRUCTURED CONTEXT: Added response mode guidance (PRIORITY 1) for {bot_name}")
+                        logger.info("✅ STRUCTURED CONTEXT: Added response mode guidance (PRIORITY 1) for %s", bot_name)
                     else:
-                        logger.debug(f"ℹ️ STRUCTURED CONTEXT: No response modes configured for {bot_name} (using defaults)")
+                        logger.debug("ℹ️ STRUCTURED CONTEXT: No response modes configured for %s (using defaults)", bot_name)
                 else:
-                    logger.debug(f"⏭️  STRUCTURED CONTEXT: Skipped response mode processing (disabled)")
+                    logger.debug("⏭️  STRUCTURED CONTEXT: Skipped response mode processing (disabled)")
                 
                 # TODO: Component 4: Character Backstory (Priority 4) - NOT IMPLEMENTED
                 # Reason: Lower priority - backstory provides depth but not critical for basic responses
@@ -3245,10 +3716,10 @@ class MessageProcessor:
                     )
                     if ai_guidance_component:
                         assembler.add_component(ai_guidance_component)
-                        logger.info(f"✅ STRUCTURED CONTEXT: Added AI identity guidance for {bot_name}")
+                        logger.info("✅ STRUCTURED CONTEXT: Added AI identity guidance for %s", bot_name)
                     # Note: No warning if None - this is context-dependent (only when user asks about AI)
                 else:
-                    logger.debug(f"⏭️  STRUCTURED CONTEXT: Skipped AI identity guidance processing (disabled)")
+                    logger.debug("⏭️  STRUCTURED CONTEXT: Skipped AI identity guidance processing (disabled)")
                 
                 # Component 5.5: Character Communication Patterns (Priority 6) - NEW COMPONENT
                 # Communication patterns define HOW character communicates (emoji, speech, behavior)
@@ -3260,11 +3731,11 @@ class MessageProcessor:
                     )
                     if communication_patterns_component:
                         assembler.add_component(communication_patterns_component)
-                        logger.info(f"✅ STRUCTURED CONTEXT: Added communication patterns for {bot_name}")
+                        logger.info("✅ STRUCTURED CONTEXT: Added communication patterns for %s", bot_name)
                     else:
-                        logger.debug(f"ℹ️ STRUCTURED CONTEXT: No communication patterns found for {bot_name}")
+                        logger.debug("ℹ️ STRUCTURED CONTEXT: No communication patterns found for %s", bot_name)
                 else:
-                    logger.debug(f"⏭️  STRUCTURED CONTEXT: Skipped communication patterns processing (disabled)")
+                    logger.debug("⏭️  STRUCTURED CONTEXT: Skipped communication patterns processing (disabled)")
                 
                 # Component 8: Character Personality (Priority 8) - Big Five personality traits
                 if is_component_enabled(PromptComponentType.CHARACTER_PERSONALITY):
@@ -3274,11 +3745,11 @@ class MessageProcessor:
                     )
                     if personality_component:
                         assembler.add_component(personality_component)
-                        logger.info(f"✅ STRUCTURED CONTEXT: Added CDL character personality for {bot_name}")
+                        logger.info("✅ STRUCTURED CONTEXT: Added CDL character personality for %s", bot_name)
                     else:
-                        logger.warning(f"⚠️ STRUCTURED CONTEXT: No character personality found for {bot_name}")
+                        logger.warning("⚠️ STRUCTURED CONTEXT: No character personality found for %s", bot_name)
                 else:
-                    logger.debug(f"⏭️  STRUCTURED CONTEXT: Skipped character personality processing (disabled)")
+                    logger.debug("⏭️  STRUCTURED CONTEXT: Skipped character personality processing (disabled)")
                 
                 # Component 10: Character Voice (Priority 10) - Speaking style and linguistic patterns
                 if is_component_enabled(PromptComponentType.CHARACTER_VOICE):
@@ -3288,11 +3759,11 @@ class MessageProcessor:
                     )
                     if voice_component:
                         assembler.add_component(voice_component)
-                        logger.info(f"✅ STRUCTURED CONTEXT: Added CDL character voice for {bot_name}")
+                        logger.info("✅ STRUCTURED CONTEXT: Added CDL character voice for %s", bot_name)
                     else:
-                        logger.warning(f"⚠️ STRUCTURED CONTEXT: No character voice found for {bot_name}")
+                        logger.warning("⚠️ STRUCTURED CONTEXT: No character voice found for %s", bot_name)
                 else:
-                    logger.debug(f"⏭️  STRUCTURED CONTEXT: Skipped character voice processing (disabled)")
+                    logger.debug("⏭️  STRUCTURED CONTEXT: Skipped character voice processing (disabled)")
                 
                 # ================================
                 # COMPONENT 9: Emotional Intelligence Context (Priority 9)
@@ -3308,7 +3779,7 @@ class MessageProcessor:
                     # TODO: Move emotional intelligence component to _build_conversation_context_with_ai_intelligence
                     logger.debug("ℹ️ STRUCTURED CONTEXT: Emotional intelligence component requires ai_components (added later)")
                 except ImportError as import_err:
-                    logger.warning(f"⚠️ STRUCTURED CONTEXT: Could not import emotional intelligence component: {import_err}")
+                    logger.warning("⚠️ STRUCTURED CONTEXT: Could not import emotional intelligence component: %s", import_err)
                 
                 # Component 9: Character Defined Relationships (Priority 9) - Important people in character's life
                 # This component surfaces relationships defined in the CDL database (character_relationships table)
@@ -3319,9 +3790,9 @@ class MessageProcessor:
                 )
                 if relationships_component:
                     assembler.add_component(relationships_component)
-                    logger.info(f"✅ STRUCTURED CONTEXT: Added CDL character defined relationships for {bot_name}")
+                    logger.info("✅ STRUCTURED CONTEXT: Added CDL character defined relationships for %s", bot_name)
                 else:
-                    logger.debug(f"ℹ️ STRUCTURED CONTEXT: No defined relationships found for {bot_name}")
+                    logger.debug("ℹ️ STRUCTURED CONTEXT: No defined relationships found for %s", bot_name)
                 
                 # TODO: Component 11: User-Character Relationship Dynamics (Priority 11) - NOT IMPLEMENTED
                 # Note: This is DIFFERENT from character_defined_relationships above
@@ -3347,9 +3818,9 @@ class MessageProcessor:
                 )
                 if response_guidelines_component:
                     assembler.add_component(response_guidelines_component)
-                    logger.info(f"✅ STRUCTURED CONTEXT: Added response guidelines for {bot_name}")
+                    logger.info("✅ STRUCTURED CONTEXT: Added response guidelines for %s", bot_name)
                 else:
-                    logger.debug(f"ℹ️ STRUCTURED CONTEXT: No response guidelines found for {bot_name}")
+                    logger.debug("ℹ️ STRUCTURED CONTEXT: No response guidelines found for %s", bot_name)
                 
                 # ================================
                 # FINAL CDL COMPONENT: Response Guidance (Priority 20)
@@ -3368,14 +3839,14 @@ class MessageProcessor:
                 )
                 if final_guidance_component:
                     assembler.add_component(final_guidance_component)
-                    logger.info(f"✅ STRUCTURED CONTEXT: Added final response guidance for {bot_name} addressing '{user_display_name}'")
+                    logger.info("✅ STRUCTURED CONTEXT: Added final response guidance for %s addressing '%s'", bot_name, user_display_name)
                 else:
-                    logger.warning(f"⚠️ STRUCTURED CONTEXT: No final guidance component for {bot_name}")
+                    logger.warning("⚠️ STRUCTURED CONTEXT: No final guidance component for %s", bot_name)
                     
             else:
                 logger.warning("⚠️ STRUCTURED CONTEXT: No database pool - skipping CDL components")
         except Exception as e:
-            logger.warning(f"⚠️ STRUCTURED CONTEXT: Failed to load CDL components: {e}")
+            logger.warning("⚠️ STRUCTURED CONTEXT: Failed to load CDL components: %s", e)
         
         # ================================
         # CDL COMPONENT 6: Temporal Awareness (Priority 6)
@@ -3388,9 +3859,9 @@ class MessageProcessor:
             try:
                 last_interaction_info = await self.memory_manager.get_last_interaction_info(message_context.user_id)
                 if last_interaction_info:
-                    logger.info(f"🕒 LAST INTERACTION: Found interaction from {last_interaction_info.get('time_since')}")
+                    logger.info("🕒 LAST INTERACTION: Found interaction from %s", last_interaction_info.get('time_since'))
             except Exception as e:
-                logger.warning(f"Failed to fetch last interaction info: {e}")
+                logger.warning("Failed to fetch last interaction info: %s", e)
 
         # Check if temporal awareness component is enabled
         if is_component_enabled(PromptComponentType.TEMPORAL_AWARENESS):
@@ -3418,7 +3889,7 @@ class MessageProcessor:
                     logger.warning("⚠️ STRUCTURED CONTEXT: Using legacy time context (CDL temporal component failed)")
             except Exception as e:
                 # Fallback to legacy on exception
-                logger.warning(f"⚠️ STRUCTURED CONTEXT: CDL temporal component error: {e}")
+                logger.warning("⚠️ STRUCTURED CONTEXT: CDL temporal component error: %s", e)
                 # Use CDL factory for temporal awareness
                 from src.prompts.cdl_component_factories import create_temporal_awareness_component
                 time_component = await create_temporal_awareness_component(priority=6)
@@ -3440,7 +3911,7 @@ class MessageProcessor:
         # ================================
         if message_context.attachments and len(message_context.attachments) > 0:
             from src.prompts.prompt_components import create_attachment_guard_component
-            bot_name_for_guard = os.getenv('DISCORD_BOT_NAME', 'Assistant')
+            bot_name_for_guard = self._bot_name_display
             assembler.add_component(
                 create_attachment_guard_component(
                     bot_name=bot_name_for_guard,
@@ -3487,23 +3958,23 @@ class MessageProcessor:
                     
                     if knowledge_component:
                         assembler.add_component(knowledge_component)
-                        logger.info(f"✅ STRUCTURED CONTEXT: Added CDL knowledge context ({len(knowledge_component.content)} chars)")
+                        logger.info("✅ STRUCTURED CONTEXT: Added CDL knowledge context (%s chars)", len(knowledge_component.content))
                     else:
                         # Fallback to legacy user facts component
                         assembler.add_component(create_user_facts_component(
                             user_facts_content,
                             priority=16
                         ))
-                        logger.info(f"✅ STRUCTURED CONTEXT: Added legacy user facts ({len(user_facts_content)} chars)")
+                        logger.info("✅ STRUCTURED CONTEXT: Added legacy user facts (%s chars)", len(user_facts_content))
                         
                 except Exception as e:
                     # Fallback to legacy on error
-                    logger.warning(f"⚠️ STRUCTURED CONTEXT: CDL knowledge component error: {e}")
+                    logger.warning("⚠️ STRUCTURED CONTEXT: CDL knowledge component error: %s", e)
                     assembler.add_component(create_user_facts_component(
                         user_facts_content,
                         priority=16
                     ))
-                    logger.info(f"✅ STRUCTURED CONTEXT: Added legacy user facts ({len(user_facts_content)} chars)")
+                    logger.info("✅ STRUCTURED CONTEXT: Added legacy user facts (%s chars)", len(user_facts_content))
         else:
             logger.debug("⏭️  Skipped user facts processing (USER_FACTS component disabled)")
         
@@ -3522,7 +3993,7 @@ class MessageProcessor:
             
             # Still add semantic memories directly (without choppy narrative formatting)
             if relevant_memories:
-                logger.debug(f"Found {len(relevant_memories)} relevant memories to format")
+                logger.debug("Found %s relevant memories to format", len(relevant_memories))
                 # Format semantic memories cleanly with structure
                 conversation_memories = []
                 user_facts = []
@@ -3530,38 +4001,40 @@ class MessageProcessor:
                 # Get character name for personalized conversation turn labels
                 character_display_name = self.character_name.capitalize() if self.character_name else "Bot"
                 
-                # Separate atomic pairs from separate messages
-                atomic_pairs = []
+                # Separate atomic pairs from separate messages (single pass:
+                # atomic pairs are formatted directly instead of staged in dicts)
+                atomic_pair_count = 0
                 separate_user_messages = []
                 separate_bot_messages = []
-                
+
                 for memory in relevant_memories[:20]:  # Look at top 20 to find pairs
                     content = memory.get('content', '').strip()
                     metadata = memory.get('metadata', {})
-                    
+
                     if not content:
                         continue
-                        
+
                     # Separate user facts from conversation memories
                     if metadata.get("type") == "user_fact":
                         fact = metadata.get("fact", content)[:300]
                         if fact:
                             user_facts.append(fact)
                         continue
-                    
+
                     # Check if this is an atomic pair (NEW format)
                     role = metadata.get('role', 'unknown')
                     source = metadata.get('source', '')
                     bot_response_in_metadata = metadata.get('bot_response', '')
-                    
+
                     if (role == 'conversation_pair' or source == 'conversation_pair') and bot_response_in_metadata:
                         # NEW FORMAT: Atomic pair with both messages in metadata
-                        user_message = metadata.get('user_message', content)
-                        atomic_pairs.append({
-                            'user': user_message,
-                            'bot': bot_response_in_metadata,
-                            'score': memory.get('score', 1.0)
-                        })
+                        # Format immediately — they have full context and lead the list
+                        if atomic_pair_count < 5:  # Top 5 atomic pairs
+                            user_message = metadata.get('user_message', content)
+                            conversation_memories.append(
+                                f"User: {user_message[:300]}\n{character_display_name}: {bot_response_in_metadata[:300]}"
+                            )
+                        atomic_pair_count += 1
                     elif role == 'user' or source == 'user_message':
                         # OLD FORMAT: Separate user message
                         separate_user_messages.append({
@@ -3577,61 +4050,64 @@ class MessageProcessor:
                             'score': memory.get('score', 1.0)
                         })
                 
-                logger.info(f"📊 Memory analysis: {len(atomic_pairs)} atomic pairs, {len(separate_user_messages)} separate user, {len(separate_bot_messages)} separate bot")
-                
-                # Add atomic pairs first (they have full context)
-                for pair in atomic_pairs[:5]:  # Top 5 atomic pairs
-                    conversation_turn = f"User: {pair['user'][:300]}\n{character_display_name}: {pair['bot'][:300]}"
-                    conversation_memories.append(conversation_turn)
-                
+                logger.info("📊 Memory analysis: %s atomic pairs, %s separate user, %s separate bot", atomic_pair_count, len(separate_user_messages), len(separate_bot_messages))
+
                 # For OLD format messages, pair them by timestamp
                 # Sort by score (relevance) first
                 separate_user_messages.sort(key=lambda x: x.get('score', 0), reverse=True)
                 separate_bot_messages.sort(key=lambda x: x.get('score', 0), reverse=True)
                 
+                # Parse bot timestamps once instead of re-parsing them for
+                # every user message in the pairing loop below
+                bot_candidates = []
+                for bot_msg in separate_bot_messages:
+                    bot_ts = bot_msg.get('timestamp', '')
+                    if not bot_ts:
+                        continue
+                    try:
+                        bot_candidates.append((_parse_iso_timestamp(bot_ts), bot_msg))
+                    except Exception as e:
+                        logger.debug("Timestamp pairing failed: %s", e)
+
                 for user_msg in separate_user_messages[:10]:  # Top 10 relevant user messages
                     user_content = user_msg['content']
                     user_ts = user_msg.get('timestamp', '')
-                    
+
                     # Try to find matching bot response by timestamp proximity
                     matching_bot = None
-                    if separate_bot_messages and user_ts:
+                    if bot_candidates and user_ts:
                         try:
-                            from datetime import datetime
-                            user_dt = datetime.fromisoformat(user_ts.replace('Z', '+00:00'))
-                            
-                            best_match = None
+                            user_dt = _parse_iso_timestamp(user_ts)
+
+                            best_idx = -1
                             best_time_diff = float('inf')
-                            
-                            for bot_msg in separate_bot_messages:
-                                bot_ts = bot_msg.get('timestamp', '')
-                                if bot_ts:
-                                    bot_dt = datetime.fromisoformat(bot_ts.replace('Z', '+00:00'))
-                                    time_diff = abs((bot_dt - user_dt).total_seconds())
-                                    
-                                    # Bot response should be within 30 seconds of user message
-                                    if time_diff <= 30 and time_diff < best_time_diff:
-                                        best_time_diff = time_diff
-                                        best_match = bot_msg
-                            
-                            matching_bot = best_match
+
+                            for idx, (bot_dt, _) in enumerate(bot_candidates):
+                                time_diff = abs((bot_dt - user_dt).total_seconds())
+
+                                # Bot response should be within 30 seconds of user message
+                                if time_diff <= 30 and time_diff < best_time_diff:
+                                    best_time_diff = time_diff
+                                    best_idx = idx
+
+                            if best_idx >= 0:
+                                # Remove matched bot message so it's not reused
+                                matching_bot = bot_candidates.pop(best_idx)[1]
                         except Exception as e:
-                            logger.debug(f"Timestamp pairing failed: {e}")
-                    
+                            logger.debug("Timestamp pairing failed: %s", e)
+
                     # Format conversation turn
                     if matching_bot:
                         bot_content = matching_bot['content']
                         conversation_turn = f"User: {user_content[:300]}\n{character_display_name}: {bot_content[:300]}"
-                        # Remove matched bot message so it's not reused
-                        if matching_bot in separate_bot_messages:
-                            separate_bot_messages.remove(matching_bot)
                     else:
                         # No matching bot response - just show user message
                         conversation_turn = f"User: {user_content[:500]}"
-                    
+
                     conversation_memories.append(conversation_turn)
                 
-                logger.info(f"✅ Formatted {len(conversation_memories)} conversation turns ({len(atomic_pairs)} from atomic pairs, {len(conversation_memories) - len(atomic_pairs)} from pairing)")
+                atomic_turns = min(atomic_pair_count, 5)
+                logger.info("✅ Formatted %s conversation turns (%s from atomic pairs, %s from pairing)", len(conversation_memories), atomic_turns, len(conversation_memories) - atomic_turns)
                 
                 # Build RELEVANT MEMORIES section
                 memory_parts = []
@@ -3647,7 +4123,7 @@ class MessageProcessor:
                         semantic_memories_text,
                         priority=13  # Priority 13: Episodic memories from CDL mapping
                     ))
-                    logger.info(f"✅ STRUCTURED CONTEXT: Added {len(conversation_memories)} conversations + {len(user_facts)} facts (enriched mode)")
+                    logger.info("✅ STRUCTURED CONTEXT: Added %s conversations + %s facts (enriched mode)", len(conversation_memories), len(user_facts))
                     has_semantic_memories = True
                 else:
                     has_semantic_memories = False
@@ -3665,7 +4141,7 @@ class MessageProcessor:
                     f"RELEVANT MEMORIES: {memory_narrative}",
                     priority=13  # Priority 13: Episodic memories from CDL mapping
                 ))
-                logger.info(f"✅ STRUCTURED CONTEXT: Added memory narrative ({len(memory_narrative)} chars)")
+                logger.info("✅ STRUCTURED CONTEXT: Added memory narrative (%s chars)", len(memory_narrative))
                 has_semantic_memories = True
             else:
                 has_semantic_memories = False
@@ -3676,7 +4152,9 @@ class MessageProcessor:
         # When user asks to recall/remember past events AND we have high-confidence memories,
         # inject an explicit episodic context so the bot knows it CAN reference those events
         # This overrides AI ethics "no memory" disclaimers when memories are actually retrieved
-        logger.debug(f"🧠 EPISODIC RECALL: Checking recall intent for '{message_context.content[:50]}...' with {len(relevant_memories)} memories")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🧠 EPISODIC RECALL: Checking recall intent for '%s...' with %s memories",
+                         message_context.content[:50], len(relevant_memories))
         
         # Get classification result if available (ai_components may be None in Phase 4)
         unified_classification = ai_components.get('unified_classification') if ai_components else None
@@ -3695,10 +4173,13 @@ class MessageProcessor:
                 token_cost=150,
                 required=False
             ))
-            logger.info(f"✅ EPISODIC RECALL: Injected explicit recall context ({len(episodic_context)} chars)")
+            logger.info("✅ EPISODIC RECALL: Injected explicit recall context (%s chars)", len(episodic_context))
             has_episodic_recall = True
         else:
-            logger.debug(f"⏭️  EPISODIC RECALL: No context generated (intent={any(k in message_context.content.lower() for k in ['remember', 'recall', 'when'])}, memories={len(relevant_memories)})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("⏭️  EPISODIC RECALL: No context generated (intent=%s, memories=%s)",
+                             any(k in message_context.content.lower() for k in ['remember', 'recall', 'when']),
+                             len(relevant_memories))
         
         # ================================
         # ANTI-HALLUCINATION WARNING (only if NO memories AND NO episodic recall)
@@ -3707,9 +4188,9 @@ class MessageProcessor:
         # If episodic recall is triggered, the bot SHOULD reference those memories - warning would contradict that
         if not has_semantic_memories and not has_episodic_recall:
             assembler.add_component(create_anti_hallucination_component(priority=13))
-            logger.info(f"⚠️ STRUCTURED CONTEXT: Added anti-hallucination warning (no memories and no episodic recall)")
+            logger.info("⚠️ STRUCTURED CONTEXT: Added anti-hallucination warning (no memories and no episodic recall)")
         elif has_episodic_recall:
-            logger.info(f"✅ STRUCTURED CONTEXT: Skipped anti-hallucination warning (episodic recall active)")
+            logger.info("✅ STRUCTURED CONTEXT: Skipped anti-hallucination warning (episodic recall active)")
         
         # ================================
         # COMPONENT 8: Conversation Summary - REMOVED (October 2025)
@@ -3742,22 +4223,21 @@ class MessageProcessor:
         # Feature flagged for testing and gradual rollout
         
         # Check if conversation summary component is enabled before processing
-        logger.info(f"🔍 ENRICHED CHECK: CONVERSATION_SUMMARY enabled={is_component_enabled(PromptComponentType.CONVERSATION_SUMMARY)}, ENABLE_ENRICHED_SUMMARIES={os.getenv('ENABLE_ENRICHED_SUMMARIES', 'false')}")
+        logger.info("🔍 ENRICHED CHECK: CONVERSATION_SUMMARY enabled=%s, ENABLE_ENRICHED_SUMMARIES=%s", is_component_enabled(PromptComponentType.CONVERSATION_SUMMARY), os.getenv('ENABLE_ENRICHED_SUMMARIES', 'false'))
         if is_component_enabled(PromptComponentType.CONVERSATION_SUMMARY) and os.getenv('ENABLE_ENRICHED_SUMMARIES', 'false').lower() == 'true':
             try:
-                from src.memory.vector_memory_system import get_normalized_bot_name_from_env
-                bot_name = get_normalized_bot_name_from_env()
+                bot_name = self.character_name
                 
                 # Check conversation history length to determine if tiered context needed
                 recent_messages = await self._get_recent_messages_structured(
                     user_id=message_context.user_id
                 )
                 recent_message_count = len(recent_messages)
-                logger.info(f"🔍 ENRICHED SUMMARIES: Checking conversation length - {recent_message_count} messages (threshold: >10)")
+                logger.info("🔍 ENRICHED SUMMARIES: Checking conversation length - %s messages (threshold: >10)", recent_message_count)
                 
                 # Apply tiered context for conversations with >10 messages
                 if recent_message_count > 10:
-                    logger.info(f"📚 Long conversation detected ({recent_message_count} messages) - using tiered context")
+                    logger.info("📚 Long conversation detected (%s messages) - using tiered context", recent_message_count)
                     
                     # TIER 1: Add enriched summary from last 7 days (older messages)
                     # 🧠 RECALL ENHANCEMENT: Extract keywords directly from query text
@@ -3773,23 +4253,14 @@ class MessageProcessor:
                     if recall_patterns_detected:
                         # Extract keywords from query using simple heuristic
                         # Query pattern: "we talked about X" → extract X
-                        import re
-                        
-                        # Extract content after recall patterns
-                        recall_patterns = [
-                            r'we (?:talked|discussed|were talking) about (.+)',
-                            r'remember when we (?:talked|discussed) (.+)',
-                            r'recall (?:our discussion|talking) about (.+)'
-                        ]
-                        
-                        for pattern in recall_patterns:
-                            match = re.search(pattern, query_lower)
+                        for pattern in _RECALL_QUERY_RES:
+                            match = pattern.search(query_lower)
                             if match:
                                 keyword_text = match.group(1).strip()
                                 # Split on common separators
-                                keywords = [kw.strip() for kw in re.split(r'[,;]|\band\b', keyword_text)]
+                                keywords = [kw.strip() for kw in _RECALL_SPLIT_RE.split(keyword_text)]
                                 search_keywords = [kw for kw in keywords if len(kw) > 2]  # Filter short words
-                                logger.info(f"🔍 RECALL KEYWORDS: Extracted {search_keywords} from query")
+                                logger.info("🔍 RECALL KEYWORDS: Extracted %s from query", search_keywords)
                                 break
                     
                     enriched_summaries = await self._retrieve_enriched_summaries(
@@ -3822,18 +4293,18 @@ class MessageProcessor:
                         )
                         if summary_component:
                             assembler.add_component(summary_component)
-                            logger.info(f"✅ TIERED CONTEXT: Added conversation summary component ({timeframe}, {summary['message_count']} messages)")
+                            logger.info("✅ TIERED CONTEXT: Added conversation summary component (%s, %s messages)", timeframe, summary['message_count'])
                     
                     # TIER 2: Recent detailed memories are already added at priority 13
                     # This gives us two-tier context: summary (older) + detailed (recent)
-                    logger.info(f"✅ TIERED CONTEXT: Using two-tier system - summary + recent {min(recent_message_count, 30)} detailed messages")
+                    logger.info("✅ TIERED CONTEXT: Using two-tier system - summary + recent %s detailed messages", min(recent_message_count, 30))
                     
                 else:
                     # Short conversation: Use recent memories only (already added at priority 13)
-                    logger.debug(f"📚 Short conversation ({recent_message_count} messages) - using recent memories only")
+                    logger.debug("📚 Short conversation (%s messages) - using recent memories only", recent_message_count)
                     
             except Exception as e:
-                logger.warning(f"⚠️ Failed to add enriched summaries to context: {e}")
+                logger.warning("⚠️ Failed to add enriched summaries to context: %s", e)
         elif not is_component_enabled(PromptComponentType.CONVERSATION_SUMMARY):
             logger.debug("⏭️  Skipped conversation summary processing (CONVERSATION_SUMMARY component disabled)")
         else:
@@ -3845,10 +4316,10 @@ class MessageProcessor:
         # CDL RESPONSE_STYLE component (Priority 17) - replaces legacy hardcoded create_guidance_component
         from src.prompts.cdl_component_factories import create_response_style_component
         try:
-            bot_name = get_normalized_bot_name_from_env()
+            bot_name = self.character_name
             pool = await get_postgres_pool()
             if pool:
-                enhanced_manager = create_enhanced_cdl_manager(pool)
+                enhanced_manager = self._get_enhanced_cdl_manager(pool)
                 response_style_component = await create_response_style_component(
                     enhanced_manager=enhanced_manager,
                     character_name=bot_name,
@@ -3862,7 +4333,7 @@ class MessageProcessor:
             else:
                 logger.warning("⚠️ No PostgreSQL pool - skipping CDL RESPONSE_STYLE component")
         except Exception as e:
-            logger.warning(f"⚠️ Failed to add CDL RESPONSE_STYLE component: {e}")
+            logger.warning("⚠️ Failed to add CDL RESPONSE_STYLE component: %s", e)
         
         # ================================
         # ASSEMBLE SYSTEM MESSAGE
@@ -3870,11 +4341,11 @@ class MessageProcessor:
         system_message_content = assembler.assemble(model_type="generic")
         assembly_metrics = assembler.get_assembly_metrics()
         
-        logger.info(f"📊 STRUCTURED ASSEMBLY METRICS:")
-        logger.info(f"  - Components: {assembly_metrics['total_components']}")
-        logger.info(f"  - Tokens: {assembly_metrics['total_tokens']}")
-        logger.info(f"  - Characters: {assembly_metrics['total_chars']}")
-        logger.info(f"  - Within budget: {assembly_metrics['within_budget']}")
+        logger.info("📊 STRUCTURED ASSEMBLY METRICS:")
+        logger.info("  - Components: %s", assembly_metrics['total_components'])
+        logger.info("  - Tokens: %s", assembly_metrics['total_tokens'])
+        logger.info("  - Characters: %s", assembly_metrics['total_chars'])
+        logger.info("  - Within budget: %s", assembly_metrics['within_budget'])
         
         # Build conversation messages array
         conversation_context = [
@@ -3884,10 +4355,10 @@ class MessageProcessor:
         # ================================
         # ADD RECENT CONVERSATION HISTORY
         # ================================
-        recent_messages = await self._get_recent_messages_structured(message_context.user_id)
+        recent_messages = await recent_messages_task
         if recent_messages:
             conversation_context.extend(recent_messages)
-            logger.info(f"✅ STRUCTURED CONTEXT: Added {len(recent_messages)} recent messages")
+            logger.info("✅ STRUCTURED CONTEXT: Added %s recent messages", len(recent_messages))
         
         # ================================
         # ADD CURRENT USER MESSAGE
@@ -3897,7 +4368,7 @@ class MessageProcessor:
             "content": message_context.content
         })
         
-        logger.info(f"✅ STRUCTURED CONTEXT: Final context has {len(conversation_context)} messages")
+        logger.info("✅ STRUCTURED CONTEXT: Final context has %s messages", len(conversation_context))
         return conversation_context
     
     def _build_episodic_recall_context(
@@ -3967,17 +4438,17 @@ class MessageProcessor:
         recall_lines.append("📝 CONVERSATION RECORDS: The user is asking about past conversations. Here's what was discussed:")
         recall_lines.append("")
         
+        current_year = datetime.now().year
         for i, mem in enumerate(high_conf_memories[:5], 1):  # Top 5 memories
             content = mem['content'][:200]
             timestamp = mem['timestamp']
-            
+
             # Format date if available
             date_str = "previously"
             try:
                 if timestamp:
-                    from datetime import datetime
-                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    date_str = dt.strftime('%B %d' if dt.year == datetime.now().year else '%B %d, %Y')
+                    dt = _parse_iso_timestamp(timestamp)
+                    date_str = dt.strftime('%B %d' if dt.year == current_year else '%B %d, %Y')
             except Exception:
                 pass
             
@@ -4020,7 +4491,10 @@ class MessageProcessor:
         
         # Get character name for personalized conversation turn labels
         character_display_name = self.character_name.capitalize() if self.character_name else "Bot"
-        
+
+        # Reference time fetched once for the whole batch
+        now_utc = datetime.now(timezone.utc)
+
         # Separate facts from conversation memories and extract timestamps
         for memory in relevant_memories[:15]:  # Increased from 10 to 15 for richer semantic context
             content = memory.get("content", "")
@@ -4039,14 +4513,12 @@ class MessageProcessor:
                     # Format as full conversation turn with character's name
                     conversation_turn = f"User: {content[:300]}\n   {character_display_name}: {bot_response[:300]}"
                 else:
-                    # Fallback: Check if already formatted with labels, or just use content
-                    if "User:" in content and ("Bot:" in content or character_display_name in content):
-                        conversation_turn = f"{content[:500]}"
-                    else:
-                        conversation_turn = f"{content[:500]}"
+                    # Fallback: content is used as-is whether or not it already
+                    # carries User:/Bot: labels, so no marker scan is needed
+                    conversation_turn = content[:500]
                 
                 # Calculate age in hours for temporal bucketing
-                age_hours = self._calculate_memory_age_hours(timestamp_str)
+                age_hours = self._calculate_memory_age_hours(timestamp_str, now_utc)
                 conversation_memories_with_time.append((conversation_turn, age_hours))
         
         # Build USER FACTS section (not time-bucketed - facts are persistent)
@@ -4061,19 +4533,26 @@ class MessageProcessor:
         
         return " || ".join(memory_parts) if memory_parts else ""
     
-    def _calculate_memory_age_hours(self, timestamp_str: str) -> float:
-        """Calculate how many hours ago a memory occurred."""
+    def _calculate_memory_age_hours(self, timestamp_str: str, now_utc: Optional[datetime] = None) -> float:
+        """Calculate how many hours ago a memory occurred.
+
+        Callers iterating a batch of memories should pass ``now_utc`` once so
+        the reference time isn't re-fetched per memory.
+        """
         try:
             if not timestamp_str:
                 return 999999.0  # Very old if no timestamp
-            
-            from datetime import datetime
+
+            if now_utc is None:
+                now_utc = datetime.now(timezone.utc)
+
             # Parse ISO format timestamp
-            memory_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            age_seconds = (datetime.utcnow().replace(tzinfo=memory_time.tzinfo) - memory_time).total_seconds()
+            memory_time = _parse_iso_timestamp(timestamp_str)
+            reference = now_utc if memory_time.tzinfo else now_utc.replace(tzinfo=None)
+            age_seconds = (reference - memory_time).total_seconds()
             return age_seconds / 3600  # Convert to hours
         except Exception as e:
-            logger.warning(f"Failed to parse timestamp '{timestamp_str}': {e}")
+            logger.warning("Failed to parse timestamp '%s': %s", timestamp_str, e)
             return 999999.0  # Treat as very old on error
     
     def _build_temporal_conversation_narrative(self, memories_with_time: List[tuple]) -> str:
@@ -4092,8 +4571,7 @@ class MessageProcessor:
             Formatted temporal narrative string with human-readable timestamps
         """
         from src.utils.time_utils import format_relative_time_short
-        from datetime import datetime, timedelta, timezone
-        
+
         # Organize memories into time buckets with timestamps
         recent = []      # < 24 hours
         this_week = []   # 24 hours - 7 days (168 hours)
@@ -4440,16 +4918,18 @@ class MessageProcessor:
             if not recent_messages:
                 return []
             
-            logger.info(f"🔍 CONVERSATION HISTORY DEBUG: Retrieved {len(recent_messages)} messages from memory")
-            for idx, msg in enumerate(recent_messages):
-                role = msg.get('role', 'unknown')
-                content_preview = msg.get('content', '')[:80]
-                timestamp = msg.get('timestamp', 'no-timestamp')
-                logger.debug(f"  [{idx}] role={role}, ts={timestamp}, content='{content_preview}...'")
+            logger.info("🔍 CONVERSATION HISTORY DEBUG: Retrieved %s messages from memory", len(recent_messages))
+            if logger.isEnabledFor(logging.DEBUG):
+                for idx, msg in enumerate(recent_messages):
+                    role = msg.get('role', 'unknown')
+                    content_preview = msg.get('content', '')[:80]
+                    timestamp = msg.get('timestamp', 'no-timestamp')
+                    logger.debug("  [%s] role=%s, ts=%s, content='%s...'", idx, role, timestamp, content_preview)
             
             formatted_messages = []
+            append_message = formatted_messages.append  # bound once for the loops below
             skip_next_bot_response = False
-            
+
             # Split into older (truncated) vs recent (detailed)
             # 🚨 FIX: Increased from 6 to 10 to match increased limit of 30
             # Last 10 messages get full content, older ones truncated to 500 chars
@@ -4457,14 +4937,13 @@ class MessageProcessor:
             older_messages = recent_messages[:-recent_full_count] if len(recent_messages) > recent_full_count else []
             recent_full_messages = recent_messages[-recent_full_count:] if len(recent_messages) > recent_full_count else recent_messages
             
-            logger.info(f"🔍 MESSAGE SPLIT: {len(older_messages)} older (truncated), {len(recent_full_messages)} recent (full)")
+            logger.info("🔍 MESSAGE SPLIT: %s older (truncated), %s recent (full)", len(older_messages), len(recent_full_messages))
             
             # Process older messages (truncated to 500 chars)
             for msg in older_messages:
                 content = msg.get('content', '')
                 # 🚨 FIX: Check 'role' field, not 'bot' field - memory returns role='bot' or role='user'
-                role_value = msg.get('role', 'user')
-                is_bot = role_value in ['bot', 'assistant']
+                is_bot = msg.get('role', 'user') in _BOT_ROLES
                 
                 if content.startswith("!"):
                     skip_next_bot_response = True
@@ -4484,30 +4963,30 @@ class MessageProcessor:
                 timestamp = msg.get('timestamp')
                 if timestamp:
                     try:
-                        dt = datetime.fromisoformat(str(timestamp).replace('Z', '+00:00'))
+                        dt = _parse_iso_timestamp(timestamp)
                         time_str = dt.strftime("%Y-%m-%d %H:%M")
                         truncated = f"[{time_str}] {truncated}"
                     except Exception:
                         pass
                 
                 role = "assistant" if is_bot else "user"
-                formatted_messages.append({"role": role, "content": truncated})
-                logger.debug(f"  ✅ ADDED older message: role={role}, len={len(truncated)}")
+                append_message({"role": role, "content": truncated})
+                logger.debug("  ✅ ADDED older message: role=%s, len=%s", role, len(truncated))
             
             # Process recent messages (tiered: last 3 full, others 400 chars)
             for idx, msg in enumerate(recent_full_messages):
                 content = msg.get('content', '')
                 # 🚨 FIX: Check 'role' field, not 'bot' field - memory returns role='bot' or role='user'
                 role_value = msg.get('role', 'user')
-                is_bot = role_value in ['bot', 'assistant']
+                is_bot = role_value in _BOT_ROLES
                 
                 if content.startswith("!"):
-                    logger.debug(f"  ⏭️  SKIPPED (command): role={role_value}, content='{content[:50]}...'")
+                    logger.debug("  ⏭️  SKIPPED (command): role=%s, content='%s...'", role_value, content[:50])
                     skip_next_bot_response = True
                     continue
                 
                 if is_bot and skip_next_bot_response:
-                    logger.debug(f"  ⏭️  SKIPPED (after command): role={role_value}, content='{content[:50]}...'")
+                    logger.debug("  ⏭️  SKIPPED (after command): role=%s, content='%s...'", role_value, content[:50])
                     skip_next_bot_response = False
                     continue
                 
@@ -4526,17 +5005,17 @@ class MessageProcessor:
                 timestamp = msg.get('timestamp')
                 if timestamp:
                     try:
-                        dt = datetime.fromisoformat(str(timestamp).replace('Z', '+00:00'))
+                        dt = _parse_iso_timestamp(timestamp)
                         time_str = dt.strftime("%Y-%m-%d %H:%M")
                         message_content = f"[{time_str}] {message_content}"
                     except Exception:
                         pass
                 
                 role = "assistant" if is_bot else "user"
-                formatted_messages.append({"role": role, "content": message_content})
-                logger.debug(f"  ✅ ADDED recent message [{idx}]: role={role}, is_most_recent={is_most_recent}, len={len(message_content)}")
+                append_message({"role": role, "content": message_content})
+                logger.debug("  ✅ ADDED recent message [%s]: role=%s, is_most_recent=%s, len=%s", idx, role, is_most_recent, len(message_content))
             
-            logger.info(f"🔍 FINAL RESULT: {len(formatted_messages)} messages added to conversation context")
+            logger.info("🔍 FINAL RESULT: %s messages added to conversation context", len(formatted_messages))
             return formatted_messages
             
         except Exception as e:
@@ -4560,40 +5039,16 @@ class MessageProcessor:
         Uses a two-pass assembly:
         1. Phase 4 builds base prompt with CDL components and memory
         2. Phase 5.5 (here) adds AI intelligence components using proper priority system
+
+        PROMPT CACHE OPTIMIZATION: the character system prompt built in Phase 4
+        (always index 0) is left byte-identical across turns so provider prompt
+        caches keep hitting the static prefix. Per-turn intelligence guidance is
+        delivered as a separate system message inserted before the final user
+        message instead of being spliced into the cached prefix.
         """
-        from src.prompts.prompt_assembler import PromptAssembler
-        from src.prompts.prompt_components import (
-            PromptComponent, 
-            PromptComponentType,
-            create_ai_intelligence_component
-        )
-        
-        # Create a second-pass assembler for AI intelligence components
-        ai_assembler = PromptAssembler(max_tokens=None)
-        
-        # Extract existing system prompt and parse out the final "Respond as" line
-        system_message_content = None
-        final_respond_line = None
-        base_system_content = None
-        
-        for i, msg in enumerate(conversation_context):
-            if msg.get("role") == "system":
-                system_message_content = msg["content"]
-                
-                # Extract the final "Respond as [character] to [user]:" line
-                respond_as_pattern = "\nRespond as "
-                last_respond_index = system_message_content.rfind(respond_as_pattern)
-                
-                if last_respond_index != -1:
-                    base_system_content = system_message_content[:last_respond_index]
-                    final_respond_line = system_message_content[last_respond_index:].strip()
-                    logger.debug("🔧 REFACTOR: Extracted final 'Respond as' line for re-assembly")
-                else:
-                    # No "Respond as" line found - use full content as base
-                    base_system_content = system_message_content
-                    logger.warning("🔧 REFACTOR: No 'Respond as' line found in system prompt")
-                break
-        
+        # Create a second-pass assembler for AI intelligence components
+        ai_assembler = PromptAssembler(max_tokens=None)
+
         # REMOVED: COMPONENT 1 TrendWise ConfidenceAdapter (was contaminating personalities)
         
         # ================================
@@ -4604,7 +5059,7 @@ class MessageProcessor:
             try:
                 from src.prompts.emotional_intelligence_component import create_emotional_intelligence_component
                 
-                bot_name = get_normalized_bot_name_from_env()
+                bot_name = self.character_name
                 
                 # Create emotional intelligence component with InfluxDB trajectory data
                 emotional_component, trajectory_metadata = await create_emotional_intelligence_component(
@@ -4776,40 +5231,23 @@ class MessageProcessor:
             ai_assembler.add_component(ai_intelligence_component)
             logger.info("🤖 AI INTELLIGENCE: Added guidance component (priority 19)")
         
-        # ================================
-        # COMPONENT 4: Final Response Guidance (Priority 20 - ALWAYS LAST)
-        # ================================
-        if final_respond_line:
-            final_guidance_component = PromptComponent(
-                type=PromptComponentType.GUIDANCE,
-                content=final_respond_line,
-                priority=20,
-                required=True,
-                metadata={'cdl_type': 'FINAL_RESPONSE_GUIDANCE'}
-            )
-            ai_assembler.add_component(final_guidance_component)
-            logger.debug("🎯 FINAL GUIDANCE: Re-added 'Respond as' line (priority 20)")
-        
         # ================================
         # ASSEMBLE AI INTELLIGENCE ADDITIONS
         # ================================
         ai_additions = ai_assembler.assemble(model_type="generic")
-        
-        # Combine base content with AI intelligence additions
-        if base_system_content is None:
-            base_system_content = ""
-        
-        enhanced_system_content = base_system_content
+
+        # Deliver the dynamic guidance as its own system message so the static
+        # character prompt at index 0 stays byte-identical (prompt-cache hit).
+        # Insert just before the final user message so the guidance stays
+        # adjacent to the turn it applies to.
         if ai_additions.strip():
-            enhanced_system_content += "\n\n" + ai_additions
-        
-        # Update the system message in conversation_context
-        for i, msg in enumerate(conversation_context):
-            if msg.get("role") == "system":
-                conversation_context[i]["content"] = enhanced_system_content
-                logger.info("✅ AI INTELLIGENCE REFACTOR: Re-assembled system prompt with proper component ordering")
-                break
-        
+            dynamic_context_msg = {"role": "system", "content": ai_additions}
+            if conversation_context and conversation_context[-1].get("role") == "user":
+                conversation_context.insert(len(conversation_context) - 1, dynamic_context_msg)
+            else:
+                conversation_context.append(dynamic_context_msg)
+            logger.info("✅ AI INTELLIGENCE: Added dynamic guidance message (static system prompt untouched)")
+
         return conversation_context
 
     def _summarize_memories(self, memories: List[Dict[str, Any]]) -> str:
@@ -4829,26 +5267,18 @@ class MessageProcessor:
     def _extract_conversation_topics(self, conversation_parts: List[str]) -> List[str]:
         """Extract meaningful topics from conversation memory parts."""
         topics = []
-        
-        # Topic extraction patterns - look for meaningful content
-        topic_keywords = {
-            'food': ['pizza', 'burger', 'sandwich', 'taco', 'food', 'eat', 'meal', 'cook', 'recipe'],
-            'activities': ['beach', 'swim', 'dive', 'hike', 'travel', 'visit', 'explore', 'adventure'],
-            'greetings': ['hi', 'hello', 'good morning', 'good afternoon', 'good evening', 'hey'],
-            'emotions': ['excited', 'happy', 'sad', 'worried', 'curious', 'interested'],
-            'work': ['project', 'research', 'study', 'work', 'job', 'career'],
-            'creativity': ['dream', 'creative', 'art', 'music', 'write', 'design', 'imagine'],
-            'science': ['research', 'experiment', 'discover', 'analysis', 'data', 'ocean', 'marine']
-        }
-        
+
         # Combine all conversation parts into text for analysis
         text = " ".join(conversation_parts).lower()
-        
-        # Find topics based on keywords
-        for topic, keywords in topic_keywords.items():
-            if any(keyword in text for keyword in keywords):
+
+        # Find topics based on keywords (precompiled alternation per category);
+        # stop scanning once the five-topic cap is reached
+        for topic, pattern in _CONVERSATION_TOPIC_RES.items():
+            if pattern.search(text):
                 topics.append(f"{topic.title()} discussion")
-        
+                if len(topics) == 5:
+                    return topics
+
         # If no specific topics found, create generic topics from content
         if not topics and conversation_parts:
             # Try to extract meaningful phrases
@@ -4864,23 +5294,19 @@ class MessageProcessor:
         """Extract a meaningful topic from a single memory part."""
         # Clean up memory formatting
         clean_content = memory_part.replace('[Memory:', '').replace('[Fact:', '').replace(']', '').strip()
-        
+        lower_content = clean_content.lower()
+
         # Skip very short or greeting-only content
-        if len(clean_content) < 10 or clean_content.lower() in ['hi', 'hello', 'hey', 'good afternoon']:
+        if len(clean_content) < 10 or lower_content in ['hi', 'hello', 'hey', 'good afternoon']:
             return ""  # Return empty string instead of None
-        
+
         # Try to create a meaningful topic summary
-        if 'food' in clean_content.lower() or any(word in clean_content.lower() for word in ['pizza', 'burger', 'sandwich']):
-            return "Food preferences"
-        elif 'beach' in clean_content.lower() or 'swim' in clean_content.lower():
-            return "Beach activities"
-        elif any(word in clean_content.lower() for word in ['dream', 'creative', 'art']):
-            return "Creative discussions"
-        elif any(word in clean_content.lower() for word in ['research', 'science', 'ocean']):
-            return "Science topics"
-        else:
-            # Generic topic from content
-            return f"Conversation about {clean_content[:25]}..."
+        for pattern, topic in _MEMORY_TOPIC_RES:
+            if pattern.search(lower_content):
+                return topic
+
+        # Generic topic from content
+        return f"Conversation about {clean_content[:25]}..."
 
     def _create_conversation_summary(self, memory_part: str) -> str:
         """Create an actual summary of older conversation, not just a topic label.
@@ -4898,97 +5324,58 @@ class MessageProcessor:
             
         # Clean up memory formatting
         clean_content = memory_part.replace('[Memory:', '').replace('[Previous conversation:', '').replace(']', '').strip()
-        
+        lower_content = clean_content.lower()
+
         # Skip very short or greeting-only content
-        if len(clean_content) < 15 or clean_content.lower() in ['hi', 'hello', 'hey', 'good afternoon', 'good morning']:
+        if len(clean_content) < 15 or lower_content in ['hi', 'hello', 'hey', 'good afternoon', 'good morning']:
             return ""
-        
-        # Create contextual summary based on content keywords
-        lower_content = clean_content.lower()
-        
+
         # Extract meaningful content (up to 400 chars for context)
         content_preview = clean_content[:400]
         
         # Try to create semantic summaries based on content
-        if any(word in lower_content for word in ['coffee', 'meet', 'dinner', 'lunch', 'hang out', 'get together']):
-            return f"Discussed meeting/social plans: {content_preview}"
-        elif any(word in lower_content for word in ['food', 'pizza', 'burger', 'sandwich', 'taco', 'meal', 'eat', 'cook']):
-            return f"Talked about food/meals: {content_preview}"
-        elif any(word in lower_content for word in ['beach', 'ocean', 'swim', 'dive', 'surf', 'water', 'sea']):
-            return f"Discussed beach/ocean activities: {content_preview}"
-        elif any(word in lower_content for word in ['dream', 'creative', 'art', 'music', 'imagine', 'poetry', 'write']):
-            return f"Creative/artistic conversation: {content_preview}"
-        elif any(word in lower_content for word in ['research', 'science', 'marine', 'biology', 'experiment', 'study']):
-            return f"Science/research discussion: {content_preview}"
-        elif any(word in lower_content for word in ['work', 'job', 'career', 'project', 'profession', 'business']):
-            return f"Work/career conversation: {content_preview}"
-        elif any(word in lower_content for word in ['family', 'parent', 'mother', 'father', 'sibling', 'relative', 'background']):
-            return f"Family/background discussion: {content_preview}"
-        elif any(word in lower_content for word in ['adventure', 'travel', 'explore', 'journey', 'trek', 'expedition']):
-            return f"Adventure/travel conversation: {content_preview}"
-        elif any(word in lower_content for word in ['photography', 'photo', 'camera', 'picture', 'shoot', 'lens']):
-            return f"Photography discussion: {content_preview}"
-        else:
-            # Generic but informative summary with full context
-            return f"Previous exchange: {content_preview}"
+        for pattern, label in _SUMMARY_TOPIC_RES:
+            if pattern.search(lower_content):
+                return f"{label}: {content_preview}"
+
+        # Generic but informative summary with full context
+        return f"Previous exchange: {content_preview}"
 
     def _extract_user_facts_from_memories(self, memories: List[Dict[str, Any]]) -> List[str]:
         """Extract important user facts from raw memories with enhanced Discord name handling."""
         facts = []
-        
-        # Enhanced pattern matching for preferred names
-        name_patterns = [
-            r"(?:my name is|call me|i'm|i am)\s+([A-Z][a-z]+)",
-            r"(?:name is|called)\s+([A-Z][a-z]+)",
-            r"just (?:call me|use)\s+([A-Z][a-z]+)",
-            r"prefer (?:to be called|being called)\s+([A-Z][a-z]+)"
-        ]
-        
+
         # Enhanced food and activity detection
         food_likes = set()
         activity_likes = set()
-        
-        food_categories = {
-            'pizza': ['pizza', 'pizzas'],
-            'burgers': ['burger', 'burgers'],
-            'sandwiches': ['sandwich', 'sandwiches'],
-            'tacos': ['taco', 'tacos']
-        }
-        
-        activity_categories = {
-            'beach activities': ['beach', 'ocean', 'surf'],
-            'swimming': ['swim', 'swimming'],
-            'diving': ['dive', 'diving', 'scuba'],
-            'travel': ['travel', 'traveling']
-        }
-        
+
         for memory in memories:
             content = memory.get("content", "")
             metadata = memory.get("metadata", {})
-            
+            content_lower = content.lower()
+
             # Check for preferred name facts
             if metadata.get("preferred_name"):
                 preferred_name = metadata.get("preferred_name")
                 facts.append(f"[Preferred name: {preferred_name}]")
-            
+
             # Check for explicit name mentions in content
-            elif "name is" in content.lower() or "call me" in content.lower():
-                for pattern in name_patterns:
-                    match = re.search(pattern, content, re.IGNORECASE)
+            elif "name is" in content_lower or "call me" in content_lower:
+                for pattern in _NAME_PATTERN_RES:
+                    match = pattern.search(content)
                     if match:
                         name = match.group(1)
                         facts.append(f"[Preferred name: {name}]")
                         break
-            
+
             # Enhanced food preference detection
-            content_lower = content.lower()
-            for food_category, keywords in food_categories.items():
-                if any(keyword in content_lower for keyword in keywords):
+            for food_category, pattern in _FOOD_CATEGORY_RES:
+                if food_category not in food_likes and pattern.search(content_lower):
                     food_likes.add(food_category)
-            
+
             # Enhanced activity detection
-            for activity_category, keywords in activity_categories.items():
-                if any(keyword in content_lower for keyword in keywords):
+            for activity_category, pattern in _ACTIVITY_CATEGORY_RES:
+                if activity_category not in activity_likes and pattern.search(content_lower):
                     activity_likes.add(activity_category)
         
         # Add aggregated preferences
@@ -4997,15 +5384,8 @@ class MessageProcessor:
         if activity_likes:
             facts.append(f"[Activities: {', '.join(sorted(activity_likes))}]")
         
-        # Remove duplicates while preserving order
-        unique_facts = []
-        seen = set()
-        for fact in facts:
-            if fact not in seen:
-                unique_facts.append(fact)
-                seen.add(fact)
-        
-        return unique_facts[:7]  # Increased from 5 to 7
+        # Remove duplicates while preserving order (dict.fromkeys runs in C)
+        return list(dict.fromkeys(facts))[:7]  # Increased from 5 to 7
 
     async def _get_user_facts_from_postgres(
         self,
@@ -5021,70 +5401,97 @@ class MessageProcessor:
         
         Returns formatted fact strings for prompt building.
         Example: "[pizza (likes)]", "[Mark (preferred_name)]"
-        
+
+        Results are cached per (user_id, bot_name) for _FACTS_CACHE_TTL_SECONDS
+        and formatted deterministically (sorted by entity/preference name) so
+        repeated builds within the window are byte-identical - cache hits skip
+        both DB roundtrips and keep the prompt prefix stable for upstream
+        prompt caching.
+
         Args:
             user_id: User identifier
             bot_name: Bot name for character-aware fact retrieval
             limit: Maximum number of facts to retrieve
-            
+
         Returns:
             List of formatted fact strings
         """
         if not hasattr(self.bot_core, 'knowledge_router') or not self.bot_core.knowledge_router:
             logger.debug("🔍 POSTGRES FACTS: Knowledge router not available, falling back to legacy")
             return []
-        
+
+        cache_key = (user_id, bot_name)
+        cached = self._facts_cache.get(cache_key)
+        if cached is not None:
+            cached_at, version_hash, cached_facts = cached
+            if time.time() - cached_at < _FACTS_CACHE_TTL_SECONDS:
+                logger.debug("🔍 POSTGRES FACTS: Cache hit for user %s (version %s)", user_id, version_hash)
+                return cached_facts
+            # Expired - drop it so inactive users don't accumulate forever
+            del self._facts_cache[cache_key]
+
         try:
             formatted_facts = []
-            
-            # Get character-aware facts from PostgreSQL
-            facts = await self.bot_core.knowledge_router.get_character_aware_facts(
-                user_id=user_id,
-                character_name=bot_name,
-                limit=limit
+
+            # Facts and preferences are independent queries - run them
+            # concurrently. The confidence floor is applied in SQL so
+            # low-confidence rows are never transferred.
+            facts, preferences = await asyncio.gather(
+                self.bot_core.knowledge_router.get_character_aware_facts(
+                    user_id=user_id,
+                    character_name=bot_name,
+                    limit=limit,
+                    min_confidence=0.5
+                ),
+                self.bot_core.knowledge_router.get_all_user_preferences(
+                    user_id=user_id
+                )
             )
-            
+
             # Format facts: "[entity_name (relationship_type)]"
-            for fact in facts:
+            # Sorted by entity name so repeated builds are byte-identical
+            for fact in sorted(facts, key=lambda f: f.get('entity_name', '')):
                 entity_name = fact.get('entity_name', '')
                 relationship_type = fact.get('relationship_type', 'knows')
                 entity_type = fact.get('entity_type', '')
-                confidence = fact.get('confidence', 0.0)
-                
-                # Only include high-confidence facts
-                if confidence >= 0.5:
-                    # Add entity type context for clarity
-                    if entity_type:
-                        formatted_facts.append(f"[{entity_name} ({relationship_type}, {entity_type})]")
-                    else:
-                        formatted_facts.append(f"[{entity_name} ({relationship_type})]")
-            
-            # Get user preferences from PostgreSQL
-            preferences = await self.bot_core.knowledge_router.get_all_user_preferences(
-                user_id=user_id
-            )
-            
+
+                # Add entity type context for clarity
+                if entity_type:
+                    formatted_facts.append(f"[{entity_name} ({relationship_type}, {entity_type})]")
+                else:
+                    formatted_facts.append(f"[{entity_name} ({relationship_type})]")
+
             # Format preferences: "[preference_key: preference_value]"
             # preferences is a dict like {"preferred_name": {"value": "Mark", "confidence": 0.9}}
-            for pref_key, pref_data in preferences.items():
+            for pref_key in sorted(preferences):
+                pref_data = preferences[pref_key]
                 if isinstance(pref_data, dict):
                     pref_value = pref_data.get('value', '')
                     confidence = pref_data.get('confidence', 0.0)
-                    
+
                     # Only include high-confidence preferences
                     if confidence >= 0.5 and pref_value:
                         formatted_facts.append(f"[{pref_key}: {pref_value}]")
-            
+
+            # Version-tag and cache the pack for reuse across calls; wholesale
+            # clear on overflow mirrors _context_analysis_cache - entries are
+            # cheap to rebuild and the TTL is short
+            version_hash = hashlib.md5("\n".join(formatted_facts).encode()).hexdigest()[:8]
+            if len(self._facts_cache) >= _FACTS_CACHE_MAX_ENTRIES:
+                self._facts_cache.clear()
+            self._facts_cache[cache_key] = (time.time(), version_hash, formatted_facts)
+
             if formatted_facts:
-                logger.info(f"✅ POSTGRES FACTS: Retrieved {len(formatted_facts)} facts/preferences from PostgreSQL "
-                          f"(facts: {len(facts)}, preferences: {len(preferences)})")
+                logger.info("✅ POSTGRES FACTS: Retrieved %d facts/preferences from PostgreSQL "
+                            "(facts: %d, preferences: %d, version: %s)",
+                            len(formatted_facts), len(facts), len(preferences), version_hash)
             else:
-                logger.debug(f"🔍 POSTGRES FACTS: No facts/preferences found in PostgreSQL for user {user_id}")
-            
+                logger.debug("🔍 POSTGRES FACTS: No facts/preferences found in PostgreSQL for user %s", user_id)
+
             return formatted_facts
-            
+
         except Exception as e:
-            logger.error(f"❌ POSTGRES FACTS: Failed to retrieve from PostgreSQL: {e}", exc_info=True)
+            logger.error("❌ POSTGRES FACTS: Failed to retrieve from PostgreSQL: %s", e, exc_info=True)
             return []
 
     def _extract_preferred_name_from_discord(self, discord_name: str) -> Optional[str]:
@@ -5094,7 +5501,7 @@ class MessageProcessor:
             
         # Handle compound names like "MarkAnthony" -> "Mark"
         # Look for capital letters that indicate word boundaries
-        matches = re.findall(r'[A-Z][a-z]+', discord_name)
+        matches = _DISCORD_NAME_RE.findall(discord_name)
         if len(matches) >= 2:
             # Take the first name from compound names
             return matches[0]
@@ -5107,58 +5514,70 @@ class MessageProcessor:
         
         return None
 
+    @staticmethod
+    def _format_engagement_guidance(analysis: Dict[str, Any]) -> Optional[str]:
+        """Format proactive engagement analysis (Phase 4.3) as guidance text."""
+        intervention_needed = analysis.get('intervention_needed', False)
+        engagement_strategy = analysis.get('recommended_strategy')
+        if intervention_needed and engagement_strategy:
+            strategy_instruction = _ENGAGEMENT_STRATEGY_GUIDANCE.get(
+                engagement_strategy, 'Enhance conversation quality naturally')
+            return f"🎯 ENGAGEMENT: {strategy_instruction}"
+        return None
+
+    @staticmethod
+    def _format_conversation_guidance(analysis: Dict[str, Any]) -> Optional[str]:
+        """Format conversation analysis with response guidance."""
+        response_guidance = analysis.get('response_guidance')
+        if response_guidance:
+            conversation_mode = analysis.get('conversation_mode', 'standard')
+            relationship_level = analysis.get('relationship_level', 'acquaintance')
+            return f"💬 CONVERSATION: Mode={conversation_mode}, Level={relationship_level} - {response_guidance}"
+        return None
+
+    @staticmethod
+    def _format_memory_guidance(analysis: Dict[str, Any]) -> Optional[str]:
+        """Format human-like memory optimization insights."""
+        memory_insights = analysis.get('memory_insights')
+        if memory_insights:
+            return f"🧠 MEMORY: {memory_insights}"
+        return None
+
+    # comprehensive_context key -> formatter; adding a new intelligence block
+    # is one entry here plus its formatter
+    _AI_GUIDANCE_SPECS = (
+        ('proactive_engagement_analysis', _format_engagement_guidance),
+        ('conversation_analysis', _format_conversation_guidance),
+        ('human_like_memory_optimization', _format_memory_guidance),
+    )
+
     def _build_ai_intelligence_guidance(self, ai_components: Dict[str, Any]) -> str:
         """Build AI intelligence guidance from comprehensive context for system prompts."""
-        guidance_parts = []
-        
         comprehensive_context = ai_components.get('comprehensive_context', {})
         if not comprehensive_context:
             return ""
-        
-        # Proactive Engagement Analysis (Phase 4.3)
-        proactive_engagement_analysis = comprehensive_context.get('proactive_engagement_analysis')
-        if proactive_engagement_analysis and isinstance(proactive_engagement_analysis, dict):
-            intervention_needed = proactive_engagement_analysis.get('intervention_needed', False)
-            engagement_strategy = proactive_engagement_analysis.get('recommended_strategy')
-            if intervention_needed and engagement_strategy:
-                # Translate internal strategy names into clear LLM instructions
-                strategy_guidance_map = {
-                    'curiosity_prompt': 'Ask an open, curious question to spark deeper conversation',
-                    'topic_suggestion': 'Suggest a new topic related to shared interests',
-                    'memory_connection': 'Reference a past conversation naturally to deepen connection',
-                    'emotional_check_in': 'Gently check in on their emotional state with empathy',
-                    'follow_up_question': 'Ask a thoughtful follow-up about the current topic',
-                    'shared_interest': 'Connect around shared interests authentically',
-                    'celebration': 'Celebrate their achievements with genuine enthusiasm',
-                    'support_offer': 'Offer support or encouragement naturally'
-                }
-                strategy_instruction = strategy_guidance_map.get(engagement_strategy, 
-                                                                  'Enhance conversation quality naturally')
-                guidance_parts.append(f"🎯 ENGAGEMENT: {strategy_instruction}")
-        
-        # Conversation Analysis with Response Guidance
-        conversation_analysis = comprehensive_context.get('conversation_analysis')
-        if conversation_analysis and isinstance(conversation_analysis, dict):
-            response_guidance = conversation_analysis.get('response_guidance')
-            conversation_mode = conversation_analysis.get('conversation_mode', 'standard')
-            relationship_level = conversation_analysis.get('relationship_level', 'acquaintance')
-            
-            if response_guidance:
-                guidance_parts.append(f"💬 CONVERSATION: Mode={conversation_mode}, Level={relationship_level} - {response_guidance}")
-        
-        # Human-like Memory Optimization
-        human_like_optimization = comprehensive_context.get('human_like_memory_optimization')
-        if human_like_optimization and isinstance(human_like_optimization, dict):
-            memory_insights = human_like_optimization.get('memory_insights')
-            if memory_insights:
-                guidance_parts.append(f"🧠 MEMORY: {memory_insights}")
-        
+
+        guidance_parts = []
+        for key, formatter in self._AI_GUIDANCE_SPECS:
+            value = comprehensive_context.get(key)
+            if value and isinstance(value, dict):
+                part = formatter(value)
+                if part:
+                    guidance_parts.append(part)
+
         if guidance_parts:
-            return "\n\n🤖 AI INTELLIGENCE GUIDANCE:\n" + "\n".join(f"• {part}" for part in guidance_parts)
-        
+            return _AI_GUIDANCE_HEADER + "\n".join(_GUIDANCE_BULLET + part for part in guidance_parts)
+
         return ""
 
-    async def _process_ai_components_parallel(self, message_context: MessageContext, 
+    def _phase2_integration_available(self) -> bool:
+        """Memoized capability probe - phase2_integration is set once at boot."""
+        if self._has_phase2_integration is None:
+            self._has_phase2_integration = bool(
+                self.bot_core and hasattr(self.bot_core, 'phase2_integration'))
+        return self._has_phase2_integration
+
+    async def _process_ai_components_parallel(self, message_context: MessageContext,
                                             conversation_context: List[Dict[str, str]]) -> Dict[str, Any]:
         """
         🚀 SOPHISTICATED AI COMPONENT PROCESSING 🚀
@@ -5177,7 +5596,7 @@ class MessageProcessor:
         8. Conversation analysis
         9. Context switch detection
         """
-        logger.info(f"🚀 AI COMPONENTS DEBUG: Starting parallel processing for user {message_context.user_id}")
+        logger.info("🚀 AI COMPONENTS DEBUG: Starting parallel processing for user %s", message_context.user_id)
         ai_components = {}
         
         try:
@@ -5191,7 +5610,7 @@ class MessageProcessor:
             task_names = []
             
             # Task 1: Vector-native emotion analysis using existing infrastructure
-            if self.bot_core and hasattr(self.bot_core, 'phase2_integration'):
+            if self._phase2_integration_available():
                 emotion_task = self._analyze_emotion_vector_native(
                     message_context.user_id, 
                     message_context.content,
@@ -5213,20 +5632,19 @@ class MessageProcessor:
             # - Conversation Pattern Analysis (Task 8)
             # - Proactive Engagement (Task 7 - conditional, moved to background)
             
-            # Task 2: Enhanced context analysis using hybrid detector
-            context_task = self._analyze_enhanced_context(
+            # Task 2: Enhanced context analysis using hybrid detector.
+            # Purely synchronous (no awaits inside) - run inline rather than
+            # paying coroutine + Task scheduling overhead in the gather
+            ai_components['context_analysis'] = self._analyze_enhanced_context(
                 message_context.content,
                 conversation_context,
                 message_context.user_id
             )
-            tasks.append(context_task)
-            task_names.append("context_analysis")
             
             # Task 4: Phase 4 human-like intelligence processing
-            logger.debug(f"🎯 TASK DEBUG: bot_core exists: {self.bot_core is not None}")
-            if self.bot_core:
-                logger.debug(f"🎯 TASK DEBUG: has phase2_integration: {hasattr(self.bot_core, 'phase2_integration')}")
-            if self.bot_core and hasattr(self.bot_core, 'phase2_integration'):
+            logger.debug("🎯 TASK DEBUG: bot_core exists: %s, has phase2_integration: %s",
+                         self.bot_core is not None, self._has_phase2_integration)
+            if self._phase2_integration_available():
                 logger.debug("🎯 TASK DEBUG: Creating conversation_intelligence task")
                 conversation_intelligence_task = self._process_conversation_intelligence_sophisticated(
                     message_context.user_id,
@@ -5269,10 +5687,17 @@ class MessageProcessor:
             # Task 10: REMOVED - Context switch detection (moved to background)
             # Context switches can be detected by background worker analyzing conversation flow.
             
-            logger.info(f"🧠 SOPHISTICATED AI PROCESSING: Executing {len(tasks)} components in parallel")
-            
-            # 🚀 PARALLEL EXECUTION: Use asyncio.gather for maximum efficiency
-            import asyncio
+            logger.info("🧠 SOPHISTICATED AI PROCESSING: Executing %d components in parallel", len(tasks))
+
+            # 🚀 PARALLEL EXECUTION: Use asyncio.gather for maximum efficiency.
+            # Components that finish without suspending (guard-clause early
+            # returns) skip event-loop scheduling when started eagerly
+            # (Python 3.12+). Eager start is scoped to this fan-out only -
+            # mutating the loop's task factory would change create_task
+            # semantics for the whole application.
+            if getattr(asyncio, 'eager_task_factory', None) is not None:
+                loop = asyncio.get_running_loop()
+                tasks = [asyncio.Task(coro, loop=loop, eager_start=True) for coro in tasks]
             results = await asyncio.gather(*tasks, return_exceptions=True)
             
             # Process results and handle exceptions gracefully
@@ -5282,10 +5707,10 @@ class MessageProcessor:
                     result = results[idx]
                     if not isinstance(result, Exception):
                         ai_components[task_name] = result
-                        logger.debug(f"✅ {task_name}: Successfully processed")
+                        logger.debug("✅ %s: Successfully processed", task_name)
                     else:
                         ai_components[task_name] = None
-                        logger.warning(f"⚠️ {task_name}: Failed with {type(result).__name__}: {result}")
+                        logger.warning("⚠️ %s: Failed with %s: %s", task_name, type(result).__name__, result)
                     idx += 1
             
             # 🚀 SOPHISTICATED RESULT INTEGRATION: Merge components with intelligent prioritization
@@ -5295,19 +5720,27 @@ class MessageProcessor:
             if basic_emotion_result:
                 logger.info("🎭 SERIAL EMOTION: Running advanced emotion analysis with basic results")
                 try:
-                    advanced_emotion_result = await self._analyze_advanced_emotion_intelligence_with_basic(
-                        message_context.user_id,
-                        message_context.content,
-                        message_context,
-                        basic_emotion_result  # Pass the basic analysis result
+                    # Bounded await: a stalled RoBERTa inference must not delay
+                    # the whole response pipeline
+                    advanced_emotion_result = await asyncio.wait_for(
+                        self._analyze_advanced_emotion_intelligence_with_basic(
+                            message_context.user_id,
+                            message_context.content,
+                            message_context,
+                            basic_emotion_result  # Pass the basic analysis result
+                        ),
+                        timeout=2.0
                     )
                     if advanced_emotion_result:
                         ai_components['advanced_emotion_intelligence'] = advanced_emotion_result
                         logger.info("🎭 SERIAL EMOTION: Advanced analysis completed successfully")
                     else:
                         logger.warning("🎭 SERIAL EMOTION: Advanced analysis returned None")
+                except asyncio.TimeoutError:
+                    logger.warning("🎭 SERIAL EMOTION TIMEOUT: Advanced analysis exceeded 2.0s - continuing with basic results")
+                    ai_components['advanced_emotion_intelligence'] = None
                 except Exception as e:
-                    logger.warning(f"🎭 SERIAL EMOTION: Advanced analysis failed: {e}")
+                    logger.warning("🎭 SERIAL EMOTION: Advanced analysis failed: %s", e)
                     ai_components['advanced_emotion_intelligence'] = None
             else:
                 logger.warning("🎭 SERIAL EMOTION: No basic emotion analysis available for advanced processing")
@@ -5321,13 +5754,14 @@ class MessageProcessor:
             
             # Bridge Phase 3 context switches from OLD path to NEW path structure for test compatibility
             conversation_intelligence = ai_components.get('conversation_intelligence')
-            logger.debug(f"🌉 BRIDGE DEBUG: conversation_intelligence type: {type(conversation_intelligence)}")
+            logger.debug("🌉 BRIDGE DEBUG: conversation_intelligence type: %s", type(conversation_intelligence))
             if conversation_intelligence and isinstance(conversation_intelligence, dict):
                 conversation_context_switches = conversation_intelligence.get('conversation_context_switches')
-                logger.debug(f"🌉 BRIDGE DEBUG: conversation_context_switches: {len(conversation_context_switches) if conversation_context_switches else 'None'}")
+                logger.debug("🌉 BRIDGE DEBUG: conversation_context_switches: %s",
+                             len(conversation_context_switches) if conversation_context_switches else 'None')
                 if conversation_context_switches:
                     ai_components['context_switches'] = conversation_context_switches
-                    logger.debug(f"✅ Bridged {len(conversation_context_switches)} context switches from OLD to NEW path")
+                    logger.debug("✅ Bridged %d context switches from OLD to NEW path", len(conversation_context_switches))
                 else:
                     logger.warning("🌉 BRIDGE WARNING: No conversation_context_switches found in conversation_intelligence")
             else:
@@ -5337,24 +5771,25 @@ class MessageProcessor:
             advanced_emotion = ai_components.get('advanced_emotion_intelligence')
             if advanced_emotion:
                 # Enhance existing emotion_data with advanced insights
-                if ai_components['emotion_data']:
+                emotion_data = ai_components['emotion_data']
+                if emotion_data:
                     # Merge advanced data with existing RoBERTa analysis
-                    ai_components['emotion_data'].update({
-                        'advanced_analysis': advanced_emotion,
-                        'multi_modal': True,
-                        'secondary_emotions': advanced_emotion.get('secondary_emotions', []),
-                        'emotional_trajectory': advanced_emotion.get('emotional_trajectory', []),
-                        'cultural_context': advanced_emotion.get('cultural_context')
-                    })
+                    # (direct assignment - no throwaway merge dict per message)
+                    emotion_data['advanced_analysis'] = advanced_emotion
+                    emotion_data['multi_modal'] = True
+                    emotion_data['secondary_emotions'] = advanced_emotion.get('secondary_emotions', [])
+                    emotion_data['emotional_trajectory'] = advanced_emotion.get('emotional_trajectory', [])
+                    emotion_data['cultural_context'] = advanced_emotion.get('cultural_context')
                 else:
                     # Use advanced analysis as primary emotion data
                     ai_components['emotion_data'] = advanced_emotion
             
             # 🎭 NEW: Tactical Big Five Emotional Adaptation
             # Create emotional adaptation strategy based on user's emotional state
-            logger.info(f"🎭 TACTICAL BIG FIVE DEBUG: emotional_context_engine exists: {self.emotional_context_engine is not None}")
-            logger.info(f"🎭 TACTICAL BIG FIVE DEBUG: emotion_analysis in ai_components: {'emotion_analysis' in ai_components}")
-            logger.info(f"🎭 TACTICAL BIG FIVE DEBUG: ai_components keys at this point: {list(ai_components.keys())}")
+            logger.info("🎭 TACTICAL BIG FIVE DEBUG: emotional_context_engine exists: %s", self.emotional_context_engine is not None)
+            logger.info("🎭 TACTICAL BIG FIVE DEBUG: emotion_analysis in ai_components: %s", 'emotion_analysis' in ai_components)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("🎭 TACTICAL BIG FIVE DEBUG: ai_components keys at this point: %s", list(ai_components.keys()))
             if self.emotional_context_engine and ai_components.get('emotion_analysis'):
                 try:
                     emotion_analysis = ai_components['emotion_analysis']
@@ -5408,12 +5843,12 @@ class MessageProcessor:
                             'tone_adjustments': adaptation_strategy.tone_adjustments,
                             'empathy_emphasis': adaptation_strategy.empathy_emphasis
                         }
-                        logger.info(f"🎭 Tactical Big Five adaptation enabled: {adaptation_strategy.big_five_tactical_shifts}")
-                    
+                        logger.info("🎭 Tactical Big Five adaptation enabled: %s", adaptation_strategy.big_five_tactical_shifts)
+
                 except Exception as e:
-                    logger.warning(f"🎭 Emotional adaptation processing failed: {e}")
-                    import traceback
-                    logger.debug(f"🎭 Traceback: {traceback.format_exc()}")
+                    logger.warning("🎭 Emotional adaptation processing failed: %s", e)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("🎭 Traceback: %s", traceback.format_exc())
                     ai_components['emotional_adaptation'] = None
                 logger.info("🎭 Enhanced emotion analysis with advanced multi-modal intelligence")
             
@@ -5421,94 +5856,114 @@ class MessageProcessor:
             memory_aging = ai_components.get('memory_aging_intelligence')
             if memory_aging:
                 # Add memory health context for AI conversation optimization
+                health_status = memory_aging.get('health_status', 'unknown')
+                total_memories = memory_aging.get('total_memories', 0)
+                flagged_ratio = memory_aging.get('flagged_ratio', 0)
                 ai_components['memory_health'] = {
-                    'status': memory_aging.get('health_status', 'unknown'),
-                    'optimization_needed': memory_aging.get('health_status') in ['poor', 'fair'],
-                    'total_memories': memory_aging.get('total_memories', 0),
-                    'prunable_ratio': memory_aging.get('flagged_ratio', 0),
+                    'status': health_status,
+                    'optimization_needed': health_status in ['poor', 'fair'],
+                    'total_memories': total_memories,
+                    'prunable_ratio': flagged_ratio,
                     'analysis_time': memory_aging.get('processing_time', 0)
                 }
                 logger.info("🧠 Added memory aging intelligence: %s health (%d memories, %.1f%% prunable)",
-                           memory_aging.get('health_status', 'unknown'),
-                           memory_aging.get('total_memories', 0),
-                           memory_aging.get('flagged_ratio', 0) * 100)
+                           health_status, total_memories, flagged_ratio * 100)
             
             # Character Performance Intelligence integration
             character_performance = ai_components.get('character_performance_intelligence')
             if character_performance:
                 # Add character optimization insights for conversation enhancement
+                performance_status = character_performance.get('performance_status', 'unknown')
+                overall_score = character_performance.get('overall_score', 0.5)
+                optimization_opportunities = character_performance.get('optimization_opportunities', [])
                 ai_components['character_optimization'] = {
-                    'performance_status': character_performance.get('performance_status', 'unknown'),
-                    'overall_score': character_performance.get('overall_score', 0.5),
-                    'optimization_opportunities': character_performance.get('optimization_opportunities', []),
+                    'performance_status': performance_status,
+                    'overall_score': overall_score,
+                    'optimization_opportunities': optimization_opportunities,
                     'trait_correlations': character_performance.get('trait_correlations', {}),
-                    'needs_optimization': character_performance.get('performance_status') in ['fair', 'needs_improvement']
+                    'needs_optimization': performance_status in ['fair', 'needs_improvement']
                 }
                 logger.info("🎭 Added character performance intelligence: %s performance (%.3f score, %d opportunities)",
-                           character_performance.get('performance_status', 'unknown'),
-                           character_performance.get('overall_score', 0.5),
-                           len(character_performance.get('optimization_opportunities', [])))
-            
-            # Build comprehensive context from all AI components
-            comprehensive_context = {}
-            
-            # Add conversation intelligence context
-            if ai_components.get('conversation_intelligence'):
-                conversation_context = ai_components['conversation_intelligence']
-                if hasattr(conversation_context, '__dict__'):
-                    comprehensive_context.update({
-                        'conversation_context': conversation_context,
-                        'interaction_type': getattr(conversation_context, 'interaction_type', None),
-                        'conversation_mode': getattr(conversation_context, 'conversation_mode', None),
-                    })
+                           performance_status, overall_score, len(optimization_opportunities))
             
-            # Add thread management results (Advanced Thread Analysis)
+            # Build comprehensive context from all AI components: collect the
+            # conditional field groups first, then merge with a single dict
+            # constructor (one allocation, one rehash per message)
+
+            # Conversation intelligence context: fetch __dict__ once and read
+            # both fields from it instead of two getattr-with-default calls
+            # (each of which attempts the descriptor protocol and swallows
+            # AttributeError)
+            conv_fields = {}
+            conversation_intel = ai_components.get('conversation_intelligence')
+            intel_dict = getattr(conversation_intel, '__dict__', None) if conversation_intel else None
+            if intel_dict is not None:
+                conv_fields = {
+                    'conversation_context': conversation_intel,
+                    'interaction_type': intel_dict.get('interaction_type'),
+                    'conversation_mode': intel_dict.get('conversation_mode'),
+                }
+
+            # Thread management results (Advanced Thread Analysis)
+            thread_fields = {}
             if ai_components.get('thread_management'):
-                comprehensive_context['conversation_thread_analysis'] = ai_components['thread_management']
+                thread_fields = {'conversation_thread_analysis': ai_components['thread_management']}
                 logger.info("🧠 Added Advanced Thread Management results to context")
-            
-            # Add proactive engagement results (Phase 4.3)
+
+            # Proactive engagement results (Phase 4.3)
+            engagement_fields = {}
             if ai_components.get('proactive_engagement'):
-                comprehensive_context['proactive_engagement_analysis'] = ai_components['proactive_engagement']
+                engagement_fields = {'proactive_engagement_analysis': ai_components['proactive_engagement']}
                 logger.info("🧠 Added Phase 4.3 Proactive Engagement results to context")
-            
-            # Add human-like memory optimization
-            if ai_components.get('human_like_memory'):
-                human_like_context = ai_components['human_like_memory']
-                if isinstance(human_like_context, dict):
-                    comprehensive_context.update({
-                        'human_like_context': human_like_context.get('human_context', {}),
-                        'human_like_memories': human_like_context.get('memories', []),
-                        'human_like_performance': human_like_context.get('search_performance', {})
-                    })
-                    logger.info("🧠 Added human-like memory optimization to context")
-            
-            # Add conversation analysis for enhanced response guidance
-            if ai_components.get('conversation_analysis'):
-                conversation_analysis = ai_components['conversation_analysis']
-                if isinstance(conversation_analysis, dict):
-                    comprehensive_context.update({
-                        'conversation_analysis': conversation_analysis,
-                        'response_guidance': conversation_analysis.get('response_guidance', ''),
-                        'conversation_mode': conversation_analysis.get('mode', 'standard'),
-                        'interaction_type': conversation_analysis.get('interaction_type', 'general'),
-                        'personality_type': conversation_analysis.get('personality_type', 'default'),
-                        'relationship_level': conversation_analysis.get('relationship_level', 'acquaintance')
-                    })
-                    logger.info("🧠 Added conversation analysis for enhanced response guidance")
-            
-            # Add context switches for conversation flow
+
+            # Human-like memory optimization
+            human_fields = {}
+            human_like_context = ai_components.get('human_like_memory')
+            if human_like_context and isinstance(human_like_context, dict):
+                human_fields = {
+                    'human_like_context': human_like_context.get('human_context', {}),
+                    'human_like_memories': human_like_context.get('memories', []),
+                    'human_like_performance': human_like_context.get('search_performance', {})
+                }
+                logger.info("🧠 Added human-like memory optimization to context")
+
+            # Conversation analysis for enhanced response guidance
+            analysis_fields = {}
+            conversation_analysis = ai_components.get('conversation_analysis')
+            if conversation_analysis and isinstance(conversation_analysis, dict):
+                analysis_fields = {
+                    'conversation_analysis': conversation_analysis,
+                    'response_guidance': conversation_analysis.get('response_guidance', ''),
+                    'conversation_mode': conversation_analysis.get('mode', 'standard'),
+                    'interaction_type': conversation_analysis.get('interaction_type', 'general'),
+                    'personality_type': conversation_analysis.get('personality_type', 'default'),
+                    'relationship_level': conversation_analysis.get('relationship_level', 'acquaintance')
+                }
+                logger.info("🧠 Added conversation analysis for enhanced response guidance")
+
+            # Context switches for conversation flow
+            switch_fields = {}
             if ai_components.get('context_switches'):
-                comprehensive_context['context_switches'] = ai_components['context_switches']
+                switch_fields = {'context_switches': ai_components['context_switches']}
                 logger.info("🧠 Added context switch detection to comprehensive context")
-            
+
+            # Merge order matters: conversation_analysis intentionally
+            # overrides conversation_mode/interaction_type from conv_fields
+            comprehensive_context = {
+                **conv_fields, **thread_fields, **engagement_fields,
+                **human_fields, **analysis_fields, **switch_fields
+            }
+
             # Store comprehensive context in ai_components
-            ai_components['comprehensive_context'] = comprehensive_context if comprehensive_context else None
+            ai_components['comprehensive_context'] = comprehensive_context or None
             ai_components['enhanced_system_prompt'] = None  # Generated later in CDL enhancement
             
-            logger.info(f"✅ SOPHISTICATED AI PROCESSING: Completed {len(task_names)} components with comprehensive integration")
-            logger.info(f"🧠 Final comprehensive context size: {len(str(comprehensive_context))} chars")
-            logger.info(f"🧠 Final comprehensive context keys: {list(comprehensive_context.keys())}")
+            logger.info("✅ SOPHISTICATED AI PROCESSING: Completed %d components with comprehensive integration", len(task_names))
+            if logger.isEnabledFor(logging.INFO):
+                # str() of the nested context can be kilobytes - only pay for
+                # the serialization when the record will actually be emitted
+                logger.info("🧠 Final comprehensive context size: %d chars", len(str(comprehensive_context)))
+                logger.info("🧠 Final comprehensive context keys: %s", list(comprehensive_context.keys()))
             
             # 🌟 CHARACTER LEARNING MOMENT DETECTION: Add learning visibility to user experience
             try:
@@ -5553,7 +6008,7 @@ class MessageProcessor:
                 logger.warning("🧠 Character reasoning transparency failed: %s", str(e))
                 ai_components['character_reasoning'] = None
             
-        except (AttributeError, ValueError, TypeError) as e:
+        except _COMMON_EXC as e:
             logger.error("Sophisticated AI component processing failed: %s", str(e))
             # Fallback to basic components
             ai_components = {
@@ -5638,9 +6093,33 @@ class MessageProcessor:
             logger.warning(f"Failed to build character reasoning: {e}")
             return None
     
-    async def _analyze_enhanced_context(self, content: str, conversation_context: List[Dict[str, str]], 
-                                      user_id: str) -> Dict[str, Any]:
-        """Enhanced context analysis with vector boost and confidence scoring."""
+    @staticmethod
+    def _conversation_context_digest(content: str,
+                                     conversation_context: Optional[List[Dict[str, str]]]) -> bytes:
+        """Fingerprint a message plus its recent history tail.
+
+        Computed once per turn and shared by any helper that caches on
+        conversation state, so consumers don't each re-traverse the
+        context list.
+        """
+        tail = "\x00".join(m.get("content", "") for m in conversation_context[-3:]) if conversation_context else ""
+        return hashlib.blake2b(f"{content}\x00{tail}".encode(), digest_size=16).digest()
+
+    def _analyze_enhanced_context(self, content: str, conversation_context: List[Dict[str, str]],
+                                  user_id: str) -> Dict[str, Any]:
+        """Enhanced context analysis with vector boost and confidence scoring.
+
+        Detection is deterministic in (message, recent history tail), so
+        results are cached for a short TTL - retries, edits, and repeated
+        turns skip the hybrid detector entirely. Cached dicts are shared by
+        reference and treated as immutable.
+        """
+        cache_key = self._conversation_context_digest(content, conversation_context)
+        cached = self._context_analysis_cache.get(cache_key)
+        if cached is not None and time.time() - cached[0] < _CONTEXT_CACHE_TTL_SECONDS:
+            logger.debug("Enhanced context analysis cache hit for user %s", user_id)
+            return cached[1]
+
         try:
             # Use the hybrid context detector for sophisticated analysis
             context_result = self.detect_context_patterns(
@@ -5649,10 +6128,13 @@ class MessageProcessor:
                 vector_boost=True,
                 confidence_threshold=0.7
             )
-            logger.debug(f"Enhanced context analysis successful for user {user_id}")
+            if len(self._context_analysis_cache) >= _CONTEXT_CACHE_MAX_ENTRIES:
+                self._context_analysis_cache.clear()
+            self._context_analysis_cache[cache_key] = (time.time(), context_result)
+            logger.debug("Enhanced context analysis successful for user %s", user_id)
             return context_result
         except Exception as e:
-            logger.debug(f"Enhanced context analysis failed: {e}")
+            logger.debug("Enhanced context analysis failed: %s", e)
             return {
                 'needs_ai_guidance': True,
                 'needs_memory_context': True,
@@ -5670,7 +6152,7 @@ class MessageProcessor:
         """Sophisticated Phase 4 intelligence processing with full integration."""
         logger.debug(f"🎯 STARTING SOPHISTICATED PHASE 4 PROCESSING for user {user_id}")
         try:
-            if not self.bot_core or not hasattr(self.bot_core, 'phase2_integration'):
+            if not self._phase2_integration_available():
                 logger.debug("🔍 Bot core or phase2_integration not available")
                 # Create adapter for Discord-specific component first
                 discord_message = create_discord_message_adapter(message_context)
@@ -5743,7 +6225,7 @@ class MessageProcessor:
                 return None
             
             # Get character name from environment (bot-specific)
-            character_name = get_normalized_bot_name_from_env()
+            character_name = self.character_name
             if not character_name:
                 logger.warning("🧠 Character name not available from environment")
                 return None
@@ -5795,7 +6277,7 @@ class MessageProcessor:
                 return None
             
             # Get character name from environment
-            character_name = get_normalized_bot_name_from_env()
+            character_name = self.character_name
             if not character_name:
                 logger.warning("🌟 Character name not available from environment")
                 return None
@@ -5926,15 +6408,14 @@ class MessageProcessor:
                 return
             
             # Get character_id from database
-            from src.characters.cdl.enhanced_cdl_manager import create_enhanced_cdl_manager
             from src.database.postgres_pool_manager import get_postgres_pool
-            
+
             pool = await get_postgres_pool()
             if not pool:
                 logger.warning("📚 PostgreSQL pool not available - cannot persist insights")
                 return
             
-            enhanced_manager = create_enhanced_cdl_manager(pool)
+            enhanced_manager = self._get_enhanced_cdl_manager(pool)
             character_data = await enhanced_manager.get_character_by_name(character_name)
             
             if not character_data or 'id' not in character_data:
@@ -6027,14 +6508,16 @@ class MessageProcessor:
     async def _process_attachments(self, message_context: MessageContext, 
                                  conversation_context: List[Dict[str, str]]) -> List[Dict[str, str]]:
         """Process message attachments (images, etc.)."""
-        if not self.image_processor:
-            logger.warning("📎 No image_processor available - skipping attachments")
-            return conversation_context
-            
+        # Cheap check first: return the context untouched (no allocation, no
+        # warning) when there is simply nothing to process
         if not message_context.attachments:
             logger.debug("📎 No attachments in message_context")
             return conversation_context
-        
+
+        if not self.image_processor:
+            logger.warning("📎 No image_processor available - skipping attachments")
+            return conversation_context
+
         try:
             # Process images and add to context using existing image processing logic
             logger.info(f"📎 _process_attachments: Processing {len(message_context.attachments)} attachment(s)")
@@ -6059,7 +6542,7 @@ class MessageProcessor:
             logger.info(f"📎 Enhanced context returned with {len(enhanced_context)} messages")
             return enhanced_context
             
-        except (AttributeError, ValueError, TypeError) as e:
+        except _COMMON_EXC as e:
             logger.error(f"📎 Attachment processing failed with {type(e).__name__}: {str(e)}", exc_info=True)
         
         return conversation_context
@@ -6067,19 +6550,13 @@ class MessageProcessor:
     async def _analyze_emotion_vector_native(self, user_id: str, content: str, message_context: MessageContext) -> Optional[Dict[str, Any]]:
         """Analyze emotions using vector-native approach."""
         try:
-            if not self.bot_core or not hasattr(self.bot_core, 'phase2_integration'):
+            if not self._phase2_integration_available():
                 return None
             
-            # Use the enhanced vector emotion analyzer from the bot core
-            from src.intelligence.enhanced_vector_emotion_analyzer import EnhancedVectorEmotionAnalyzer
-            
-            # Store analyzer in instance variable for later reuse (bot emotion analysis)
-            async with self._shared_analyzer_lock:
-                self._shared_emotion_analyzer = EnhancedVectorEmotionAnalyzer(
-                    vector_memory_manager=self.memory_manager
-                )
-                analyzer = self._shared_emotion_analyzer
-            
+            # Use the shared enhanced vector emotion analyzer (created once,
+            # reused for user and bot emotion analysis)
+            analyzer = await self._get_shared_emotion_analyzer()
+
             # Analyze emotion with vector intelligence (use the correct method name)
             emotion_results = await analyzer.analyze_emotion(
                 content=content,
@@ -6105,7 +6582,25 @@ class MessageProcessor:
         
         return None
 
-    async def _analyze_bot_emotion(self, response: str, message_context: MessageContext, 
+    async def _get_shared_emotion_analyzer(self):
+        """Create the shared EnhancedVectorEmotionAnalyzer once (double-checked lock).
+
+        The analyzer used to be rebuilt per message, defeating the sharing and
+        paying constructor cost every call. Only construction needs the lock -
+        analyze_emotion itself is already used concurrently elsewhere (the
+        single-flight map handles duplicate bot-emotion passes).
+        """
+        if self._shared_emotion_analyzer is None:
+            async with self._shared_analyzer_lock:
+                if self._shared_emotion_analyzer is None:
+                    # Local import: the analyzer pulls in heavy model dependencies
+                    from src.intelligence.enhanced_vector_emotion_analyzer import EnhancedVectorEmotionAnalyzer
+                    self._shared_emotion_analyzer = EnhancedVectorEmotionAnalyzer(
+                        vector_memory_manager=self.memory_manager
+                    )
+        return self._shared_emotion_analyzer
+
+    async def _analyze_bot_emotion(self, response: str, message_context: MessageContext,
                                    analyzer = None) -> Optional[Dict[str, Any]]:
         """
         Analyze bot's emotional state from generated response text.
@@ -6134,7 +6629,7 @@ class MessageProcessor:
             # Analyze bot's response text to detect character emotion
             emotion_results = await analyzer.analyze_emotion(
                 content=response,
-                user_id=f"bot_{get_normalized_bot_name_from_env()}",  # Bot-specific ID
+                user_id=f"bot_{self.character_name}",  # Bot-specific ID
                 conversation_context=[],
                 recent_emotions=None
             )
@@ -6150,7 +6645,7 @@ class MessageProcessor:
                     'intensity': emotion_results.intensity,
                     'confidence': emotion_results.confidence,
                     'analysis_method': 'vector_native',
-                    'analyzed_text': response[:100] + '...' if len(response) > 100 else response,  # Sample for debugging
+                    'analyzed_text': _trunc(response, 100),  # Sample for debugging
                     # Phase 7.5 Enhancement: Mixed emotions for bot (same as user)
                     'mixed_emotions': mixed_emotions_list,
                     'all_emotions': all_emotions_dict,
@@ -6195,19 +6690,42 @@ class MessageProcessor:
         Returns:
             Dict with primary_emotion, intensity, confidence, analysis_method
         """
+        # Single-flight: if another coroutine is already analyzing this exact
+        # response text, await its result instead of serializing on the analyzer
+        key = hashlib.blake2b(response.encode('utf-8'), digest_size=16).hexdigest()
+        inflight = self._inflight_emotion.get(key)
+        if inflight is not None:
+            logger.debug("🎭 BOT EMOTION: Joining in-flight analysis for identical response")
+            try:
+                return await inflight
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    # We were cancelled, not the owner - propagate
+                    raise
+                # The owner task was cancelled; don't let its cancellation leak
+                # into this unrelated request - run the analysis ourselves
+                logger.debug("🎭 BOT EMOTION: In-flight owner cancelled; running own analysis")
+                return await self._run_bot_emotion_analysis(response)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight_emotion[key] = future
         try:
-            # Use shared analyzer if available (from user emotion analysis)
-            async with self._shared_analyzer_lock:
-                if self._shared_emotion_analyzer:
-                    logger.debug("🎭 BOT EMOTION: Using shared emotion analyzer")
-                    analyzer = self._shared_emotion_analyzer
-                else:
-                    logger.debug("🎭 BOT EMOTION: Creating new analyzer (no shared analyzer available)")
-                    from src.intelligence.enhanced_vector_emotion_analyzer import EnhancedVectorEmotionAnalyzer
-                    analyzer = EnhancedVectorEmotionAnalyzer(
-                        vector_memory_manager=self.memory_manager
-                    )
-            
+            result = await self._run_bot_emotion_analysis(response)
+            future.set_result(result)
+            return result
+        finally:
+            # If the owner task was cancelled mid-analysis the future is still
+            # pending - cancel it so joined waiters resolve instead of hanging
+            if not future.done():
+                future.cancel()
+            self._inflight_emotion.pop(key, None)
+
+    async def _run_bot_emotion_analysis(self, response: str) -> Optional[Dict[str, Any]]:
+        """Run the actual shared-analyzer emotion pass for a bot response (never raises)."""
+        try:
+            # Use the shared analyzer (created once, shared with user emotion analysis)
+            analyzer = await self._get_shared_emotion_analyzer()
+
             # 🎭 BOT EMOTION DEBUG: Log what text is actually being analyzed for bot emotion
             logger.info(f"🎭 BOT EMOTION DEBUG: Analyzing bot response text: '{response[:100]}{'...' if len(response) > 100 else ''}'")
             logger.info(f"🎭 BOT EMOTION DEBUG: Response length: {len(response)} chars")
@@ -6215,7 +6733,7 @@ class MessageProcessor:
             # Analyze bot's response text to detect character emotion
             emotion_results = await analyzer.analyze_emotion(
                 content=response,
-                user_id=f"bot_{get_normalized_bot_name_from_env()}",  # Bot-specific ID
+                user_id=f"bot_{self.character_name}",  # Bot-specific ID
                 conversation_context=[],
                 recent_emotions=None
             )
@@ -6231,7 +6749,7 @@ class MessageProcessor:
                     'intensity': emotion_results.intensity,
                     'confidence': emotion_results.confidence,
                     'analysis_method': 'vector_native_shared_analyzer',
-                    'analyzed_text': response[:100] + '...' if len(response) > 100 else response,  # Sample for debugging
+                    'analyzed_text': _trunc(response, 100),  # Sample for debugging
                     # Phase 7.5 Enhancement: Mixed emotions for bot (same as user)
                     'mixed_emotions': mixed_emotions_list,
                     'all_emotions': all_emotions_dict,
@@ -6483,21 +7001,20 @@ class MessageProcessor:
                 )
                 
                 # Record memory aging metrics to InfluxDB for temporal analysis
-                if hasattr(self, 'temporal_client') and self.temporal_client:
-                    try:
-                        await self.temporal_client.record_memory_aging_metrics(
-                            bot_name=os.getenv('DISCORD_BOT_NAME', 'unknown'),
-                            user_id=user_id,
-                            health_status=memory_aging_data['health_status'],
-                            total_memories=memory_aging_data['total_memories'],
-                            memories_flagged=memory_aging_data['memories_flagged'],
-                            flagged_ratio=memory_aging_data['flagged_ratio'],
-                            processing_time=memory_aging_data['processing_time']
-                        )
-                        logger.debug("📊 TEMPORAL: Recorded memory aging metrics to InfluxDB")
-                    except AttributeError:
-                        # record_memory_aging_metrics method doesn't exist yet - log for now
-                        logger.debug("Memory aging metrics recording not yet implemented in TemporalIntelligenceClient")
+                if self._tc_record_memory_aging is not None:
+                    await self._tc_record_memory_aging(
+                        bot_name=self._bot_name,
+                        user_id=user_id,
+                        health_status=memory_aging_data['health_status'],
+                        total_memories=memory_aging_data['total_memories'],
+                        memories_flagged=memory_aging_data['memories_flagged'],
+                        flagged_ratio=memory_aging_data['flagged_ratio'],
+                        processing_time=memory_aging_data['processing_time']
+                    )
+                    logger.debug("📊 TEMPORAL: Recorded memory aging metrics to InfluxDB")
+                else:
+                    # record_memory_aging_metrics method doesn't exist yet - log for now
+                    logger.debug("Memory aging metrics recording not yet implemented in TemporalIntelligenceClient")
                 
                 return memory_aging_data
                 
@@ -6545,9 +7062,16 @@ class MessageProcessor:
         try:
             if not self.memory_manager:
                 return None
-            
-            bot_name = get_normalized_bot_name_from_env()
-            
+
+            # Fast path: negative cache - a previous lookup for this user found no
+            # emotion history, so skip the network round trip until one is recorded
+            if message_context.user_id in self._users_without_bot_emotion_history:
+                logger.debug("🎭 Skipping trajectory analysis for user %s (no emotion history cached)",
+                             message_context.user_id)
+                return None
+
+            bot_name = self.character_name
+
             # PRIMARY: Try InfluxDB for chronological time-series (if available)
             recent_emotions = []
             if self.temporal_client and self.temporal_client.enabled:
@@ -6586,8 +7110,9 @@ class MessageProcessor:
                 )
                 
                 if not recent_bot_memories:
+                    self._users_without_bot_emotion_history.add(message_context.user_id)
                     return None
-                
+
                 # Extract bot emotions from memory metadata
                 for memory in recent_bot_memories:
                     if isinstance(memory, dict):
@@ -6603,8 +7128,9 @@ class MessageProcessor:
                             })
                 
                 logger.debug("🎭 Retrieved %d bot emotions from Qdrant (fallback)", len(recent_emotions))
-            
+
             if not recent_emotions:
+                self._users_without_bot_emotion_history.add(message_context.user_id)
                 return None
             
             # Calculate emotional trajectory
@@ -6678,7 +7204,7 @@ class MessageProcessor:
             if not trajectory_data:
                 return None
             
-            bot_name = get_normalized_bot_name_from_env()
+            bot_name = self.character_name
             
             # Build comprehensive emotional state
             emotional_state = {
@@ -6757,7 +7283,7 @@ class MessageProcessor:
     async def _process_conversation_intelligence(self, user_id: str, content: str, message_context: MessageContext, emotion_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """Process Phase 4 human-like intelligence if available."""
         try:
-            if not self.bot_core or not hasattr(self.bot_core, 'phase2_integration'):
+            if not self._phase2_integration_available():
                 return None
             
             # Create adapter for Discord-specific component
@@ -6816,14 +7342,15 @@ class MessageProcessor:
                 from src.intelligence.empathy_calibrator import EmotionalResponseType
                 
                 # Use a simple emotion detection based on message content
+                content_lower = content.lower()
                 detected_emotion = EmotionalResponseType.CONTENTMENT  # Default neutral emotion
-                if any(word in content.lower() for word in ['sad', 'upset', 'angry', 'frustrated']):
+                if any(word in content_lower for word in ['sad', 'upset', 'angry', 'frustrated']):
                     detected_emotion = EmotionalResponseType.STRESS
-                elif any(word in content.lower() for word in ['happy', 'excited', 'joy', 'great']):
+                elif any(word in content_lower for word in ['happy', 'excited', 'joy', 'great']):
                     detected_emotion = EmotionalResponseType.JOY
-                elif any(word in content.lower() for word in ['worried', 'anxious', 'nervous']):
+                elif any(word in content_lower for word in ['worried', 'anxious', 'nervous']):
                     detected_emotion = EmotionalResponseType.ANXIETY
-                elif any(word in content.lower() for word in ['confused', 'lost', 'don\'t understand']):
+                elif any(word in content_lower for word in ['confused', 'lost', 'don\'t understand']):
                     detected_emotion = EmotionalResponseType.CONFUSION
 
                 # Calibrate empathy
@@ -6948,11 +7475,9 @@ class MessageProcessor:
             
             # 🧹 CLEANUP: Remove timestamp echoes if the model mimics the input format
             # Pattern: [2025-11-21 18:26] or similar at start of message
-            import re
-            timestamp_pattern = r'^\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}\]\s*'
-            if re.match(timestamp_pattern, response):
+            if _TIMESTAMP_ECHO_RE.match(response):
                 original_len = len(response)
-                response = re.sub(timestamp_pattern, '', response)
+                response = _TIMESTAMP_ECHO_RE.sub('', response)
                 logger.info(f"🧹 CLEANUP: Removed timestamp echo from response (saved {original_len - len(response)} chars)")
             
             # Store LLM timing in ai_components for footer display
@@ -6968,7 +7493,7 @@ class MessageProcessor:
             # Current emoji system still uses JSON files - needs database integration
             try:
                 # Use bot name from environment (database-only approach)
-                bot_name = get_normalized_bot_name_from_env()
+                bot_name = self.character_name
                 if bot_name:
                     # TODO: Update emoji system to use database character data instead of JSON files
                     # For now, skip emoji enhancement during CDL migration
@@ -7068,7 +7593,7 @@ class MessageProcessor:
                 lines = response.splitlines()
                 natural_parts = []
                 for line in lines:
-                    if any(p in line for p in patterns) or re.match(r"^[A-Z][A-Za-z &]+:\s*$", line.strip()):
+                    if any(p in line for p in patterns) or _SECTION_HEADER_RE.match(line.strip()):
                         break
                     if line.strip():
                         natural_parts.append(line.strip())
@@ -7087,42 +7612,31 @@ class MessageProcessor:
 
     async def _detect_and_fix_recursive_patterns(self, response: str, message_context: MessageContext) -> str:
         """Detect and fix LLM recursive failures that could poison memory."""
-        import re
-        from src.memory.vector_memory_system import get_normalized_bot_name_from_env
-        
+
         try:
-            bot_name = get_normalized_bot_name_from_env()
-            
+            bot_name = self.character_name
+
             # 🚨 CRITICAL PATTERNS: Known recursive failure indicators
-            recursive_patterns = [
-                r'remember that you can remember',
-                r'(\b\w+\b)(\s+\1){24,}',  # FIXED: Same word repeating 25+ times (word + 24 more repetitions)
-                r'(that you can\s+){5,}',  # "that you can" repeating
-                r'(\b\w+\s+\w+\b)(\s+\1){19,}',  # FIXED: Same two-word phrase repeating 20+ times
-                r'(being able to\s+){3,}',  # "being able to" repeating
-                r'EEREE|Eternalized Eternally',  # Specific nonsense patterns from Ryan
-                r'(processing data.*entertainment.*){3,}',  # Recursive tech explanations
-                r'(.{20,})\1{3,}',  # Any 20+ char phrase repeating 3+ times (NEW: more precise)
-            ]
-            
+            # (precompiled at module level in _RECURSIVE_PATTERN_RES)
+
             # Length-based detection
             if len(response) > 10000:  # Raised from 8000 - Ryan's broken response was 14,202 chars
-                logger.warning("🚨 RECURSIVE PATTERN: Response length excessive (%d chars) for user %s", 
+                logger.warning("🚨 RECURSIVE PATTERN: Response length excessive (%d chars) for user %s",
                              len(response), message_context.user_id)
-                
+
                 # Check for any recursive patterns
-                for pattern in recursive_patterns:
-                    if re.search(pattern, response, re.IGNORECASE):
-                        logger.error("🚨 RECURSIVE PATTERN DETECTED: %s pattern found in %s response", 
-                                   pattern, bot_name)
+                for pattern in _RECURSIVE_PATTERN_RES:
+                    if pattern.search(response):
+                        logger.error("🚨 RECURSIVE PATTERN DETECTED: %s pattern found in %s response",
+                                   pattern.pattern, bot_name)
                         return await self._generate_fallback_response(message_context, "recursive_pattern")
-            
+
             # Pattern-based detection (regardless of length)
-            for pattern in recursive_patterns:
-                match = re.search(pattern, response, re.IGNORECASE)
+            for pattern in _RECURSIVE_PATTERN_RES:
+                match = pattern.search(response)
                 if match:
-                    logger.error("🚨 RECURSIVE PATTERN DETECTED: %s pattern found in %s response", 
-                               pattern, bot_name)
+                    logger.error("🚨 RECURSIVE PATTERN DETECTED: %s pattern found in %s response",
+                               pattern.pattern, bot_name)
                     logger.error("🚨 PATTERN CONTEXT: ...%s...", response[max(0, match.start()-50):match.end()+50])
                     return await self._generate_fallback_response(message_context, "recursive_pattern")
             
@@ -7148,9 +7662,8 @@ class MessageProcessor:
 
     async def _generate_fallback_response(self, message_context: MessageContext, failure_type: str) -> str:
         """Generate a safe fallback response when recursive patterns are detected."""
-        from src.memory.vector_memory_system import get_normalized_bot_name_from_env
         
-        bot_name = get_normalized_bot_name_from_env()
+        bot_name = self.character_name
         
         # Get user display name using the same preference hierarchy
         user_name = await self._get_user_display_name(message_context)
@@ -7498,25 +8011,8 @@ class MessageProcessor:
             preferences_detected = []
             
             # 1. PREFERRED NAME PATTERNS
-            name_patterns = [
-                # "My name is Mark" - captures capitalized names
-                r"(?:my|My)\s+name\s+is\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-                # "Call me Mark"
-                r"(?:call|Call)\s+me\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-                # "I prefer to be called Mark" or "I prefer Mark"
-                r"(?:i|I)\s+prefer\s+(?:to\s+be\s+called\s+)?([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-                # "I go by Mark"
-                r"(?:i|I)\s+go\s+by\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-                # "You can call me Mark"
-                r"(?:you|You)\s+can\s+call\s+me\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-                # "Just call me Mark"
-                r"(?:just|Just)\s+call\s+me\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-                # "I'm Mark" (less formal)
-                r"(?:i|I)[''']m\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-            ]
-            
-            for pattern in name_patterns:
-                match = re.search(pattern, content)
+            for pattern in _PREF_NAME_RES:
+                match = pattern.search(content)
                 if match:
                     detected_name = match.group(1).strip()
                     if 2 <= len(detected_name) <= 50:  # Validate name length
@@ -7524,46 +8020,28 @@ class MessageProcessor:
                             'type': 'preferred_name',
                             'value': detected_name,
                             'confidence': 0.95,
-                            'pattern': pattern
+                            'pattern': pattern.pattern
                         })
                         logger.debug(f"🔍 PREFERENCE: Detected name '{detected_name}'")
                         break
-            
+
             # 2. TIMEZONE PATTERNS
-            timezone_patterns = [
-                # "I'm in EST", "I'm in Pacific time"
-                r"(?:i|I)[''']?m\s+in\s+([A-Z]{2,4}|Pacific|Eastern|Central|Mountain|GMT|UTC)(?:\s+time)?",
-                # "My timezone is EST"
-                r"(?:my|My)\s+(?:timezone|time\s+zone)\s+is\s+([A-Z]{2,4}|Pacific|Eastern|Central|Mountain|GMT|UTC)",
-                # "I live in EST", "I'm on PST"
-                r"(?:i|I)\s+(?:live\s+in|am\s+on|use)\s+([A-Z]{2,4}|Pacific|Eastern|Central|Mountain|GMT|UTC)(?:\s+time)?",
-            ]
-            
-            for pattern in timezone_patterns:
-                match = re.search(pattern, content, re.IGNORECASE)
+            for pattern in _PREF_TIMEZONE_RES:
+                match = pattern.search(content)
                 if match:
                     timezone = match.group(1).upper()
                     preferences_detected.append({
                         'type': 'timezone',
                         'value': timezone,
                         'confidence': 0.90,
-                        'pattern': pattern
+                        'pattern': pattern.pattern
                     })
                     logger.debug(f"🔍 PREFERENCE: Detected timezone '{timezone}'")
                     break
-            
+
             # 3. LOCATION PATTERNS
-            location_patterns = [
-                # "I live in Seattle", "I'm from Chicago"
-                r"(?:i|I)\s+(?:live\s+in|am\s+from|reside\s+in)\s+([A-Z][a-zA-Z\s]{2,30})",
-                # "I'm in New York", "I'm located in Boston"
-                r"(?:i|I)[''']?m\s+(?:in|located\s+in)\s+([A-Z][a-zA-Z\s]{2,30})",
-                # "My location is Seattle"
-                r"(?:my|My)\s+location\s+is\s+([A-Z][a-zA-Z\s]{2,30})",
-            ]
-            
-            for pattern in location_patterns:
-                match = re.search(pattern, content)
+            for pattern in _PREF_LOCATION_RES:
+                match = pattern.search(content)
                 if match:
                     location = match.group(1).strip()
                     # Basic validation - exclude common false positives
@@ -7572,30 +8050,21 @@ class MessageProcessor:
                             'type': 'location',
                             'value': location,
                             'confidence': 0.85,
-                            'pattern': pattern
+                            'pattern': pattern.pattern
                         })
                         logger.debug(f"🔍 PREFERENCE: Detected location '{location}'")
                         break
-            
+
             # 4. COMMUNICATION STYLE PATTERNS
-            comm_style_patterns = [
-                # "I prefer short responses", "I like detailed explanations"
-                r"(?:i|I)\s+(?:prefer|like)\s+(short|brief|long|detailed|simple|technical)\s+(?:responses|answers|explanations)",
-                # "Keep it brief", "Make it detailed"
-                r"(?:keep\s+it|make\s+it)\s+(brief|short|detailed|simple|technical)",
-                # "I want concise answers"
-                r"(?:i|I)\s+want\s+(concise|brief|detailed|thorough)\s+(?:answers|responses)",
-            ]
-            
-            for pattern in comm_style_patterns:
-                match = re.search(pattern, content, re.IGNORECASE)
+            for pattern in _PREF_COMM_STYLE_RES:
+                match = pattern.search(content)
                 if match:
                     style = match.group(1).lower()
                     preferences_detected.append({
                         'type': 'communication_style',
                         'value': style,
                         'confidence': 0.80,
-                        'pattern': pattern
+                        'pattern': pattern.pattern
                     })
                     logger.debug(f"🔍 PREFERENCE: Detected communication style '{style}'")
                     break
@@ -7741,6 +8210,9 @@ class MessageProcessor:
                 bot_metadata = {}
                 if bot_emotion:
                     bot_metadata['bot_emotion'] = bot_emotion
+                    # This memory makes the Qdrant fallback lookup non-empty, so
+                    # re-enable trajectory analysis even on InfluxDB-less deployments
+                    self._users_without_bot_emotion_history.discard(message_context.user_id)
                     logger.info(
                         "🎭 BOT EMOTION: Storing bot emotion '%s' (intensity: %.2f, confidence: %.2f)",
                         bot_emotion.get('primary_emotion', 'unknown'),
@@ -7793,32 +8265,23 @@ class MessageProcessor:
                               message_context.user_id)
                 return False
                 
-        except (AttributeError, ValueError, TypeError) as e:
+        except _COMMON_EXC as e:
             logger.error("Memory storage failed: %s", str(e))
             return False
 
     def _is_response_safe_to_store(self, response: str) -> bool:
         """Final safety check before storing response in memory."""
-        import re
-        
-        # Block obviously broken responses from being stored
-        unsafe_patterns = [
-            r'remember that you can remember',
-            r'EEREE|Eternalized Eternally',
-            r'(\w+\s+){20,}',  # 20+ repeated words
-        ]
-        
         # Length check - responses over 6000 chars are suspicious
         if len(response) > 6000:
             logger.warning("🛡️ MEMORY SAFETY: Response length suspicious (%d chars)", len(response))
             return False
-        
-        # Pattern check
-        for pattern in unsafe_patterns:
-            if re.search(pattern, response, re.IGNORECASE):
-                logger.warning("🛡️ MEMORY SAFETY: Unsafe pattern detected: %s", pattern)
+
+        # Block obviously broken responses from being stored
+        for pattern in _UNSAFE_RESPONSE_RES:
+            if pattern.search(response):
+                logger.warning("🛡️ MEMORY SAFETY: Unsafe pattern detected: %s", pattern.pattern)
                 return False
-        
+
         return True
     
     def _is_technical_debugging_conversation(self, user_message: str, bot_response: str) -> bool:
@@ -7839,28 +8302,14 @@ class MessageProcessor:
         Returns:
             True if this is technical debugging that should NOT be stored
         """
-        import re
-        
-        # ONLY technical debugging patterns (not general meta-queries)
-        debug_patterns = [
-            # Memory corruption/system issues
-            r'\b(corrupt|corrupted|fragmenting)\s+(your\s+)?(memory|context)',
-            r'\b(reset|restart|reboot)\s+(your\s+memory|your\s+context|your\s+system)',
-            r'\b(stuck|frozen)\s+(context|conversation|memory)',
-            r'\bprompt.*\blog\b',  # Discussions about prompt logging
-            
-            # Explicit technical commands
-            r'\bclear\s+(your\s+)?(cache|context|memory)',
-            r'\bfix\s+(your\s+)?(memory|context|system)',
-        ]
-        
         combined_text = f"{user_message} {bot_response}".lower()
-        
-        for pattern in debug_patterns:
-            if re.search(pattern, combined_text, re.IGNORECASE):
-                logger.debug(f"🔍 TECHNICAL DEBUG: Detected pattern '{pattern}' in conversation")
+
+        # ONLY technical debugging patterns (not general meta-queries)
+        for pattern in _DEBUG_CONVERSATION_RES:
+            if pattern.search(combined_text):
+                logger.debug("🔍 TECHNICAL DEBUG: Detected pattern '%s' in conversation", pattern.pattern)
                 return True
-        
+
         return False
     
     def _classify_message_context(self, message_context: MessageContext):
@@ -7957,7 +8406,7 @@ class MessageProcessor:
                     except:
                         return f"<non-serializable: {type(obj).__name__}>"
             
-            bot_name = os.getenv('DISCORD_BOT_NAME', 'unknown')
+            bot_name = self._bot_name
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
             # Create filename: /app/logs/prompts/botname_YYYYMMDD_HHMMSS_userid.json
@@ -8002,9 +8451,9 @@ class MessageProcessor:
             # Check if prompt logging is enabled (disabled by default for production)
             if not os.getenv('ENABLE_PROMPT_LOGGING', 'false').lower() == 'true':
                 return
-            
-            bot_name = os.getenv('DISCORD_BOT_NAME', 'unknown')
-            
+
+            bot_name = self._bot_name
+
             # Find the most recent prompt file for this user and bot
             prompt_dir = "/app/logs/prompts"
             if not os.path.exists(prompt_dir):
@@ -8069,7 +8518,7 @@ class MessageProcessor:
         relevant_memories: List[Dict[str, Any]],
         knowledge_stored: bool,
         memory_stored: bool,
-        validation_result: Dict[str, Any],
+        validation_result: SecurityValidation,
         processing_time_ms: int
     ) -> Dict[str, Any]:
         """
@@ -8104,7 +8553,7 @@ class MessageProcessor:
             "memory_count": len(relevant_memories) if relevant_memories else 0,
             "knowledge_stored": knowledge_stored,
             "ai_components": ai_components,
-            "security_validation": validation_result
+            "security_validation": validation_result._asdict()
         }
         
         # Add workflow data if available (from message_context.metadata)
@@ -8150,7 +8599,7 @@ class MessageProcessor:
         if self.confidence_analyzer:
             try:
                 # Get bot name for queries
-                bot_name = os.getenv('DISCORD_BOT_NAME', 'unknown')
+                bot_name = self._bot_name
                 
                 # Get confidence metrics from analyzer
                 confidence_metrics = self.confidence_analyzer.calculate_confidence_metrics(
@@ -8207,7 +8656,7 @@ class MessageProcessor:
         
         # 4. CDL Character Context
         character_file = os.getenv('CDL_DEFAULT_CHARACTER', 'characters/examples/default_assistant.json')
-        bot_name = os.getenv('DISCORD_BOT_NAME', 'Assistant')
+        bot_name = self._bot_name_display
         
         metadata["character_context"] = {
             "character_name": bot_name,
@@ -8286,7 +8735,7 @@ class MessageProcessor:
             return
         
         try:
-            bot_name = get_normalized_bot_name_from_env()
+            bot_name = self.character_name
             
             # 1. Predictive Adaptation - Analyze patterns and predict user needs
             if self.predictive_engine:
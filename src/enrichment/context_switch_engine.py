@@ -458,19 +458,17 @@ class ContextSwitchEngine:
                     "explicit_ratio": 0.0
                 }
             
-            # Count transition types
-            explicit_count = sum(1 for s in switches if s.get("switch_type") == "explicit")
-            abrupt_count = sum(1 for s in switches if s.get("switch_type") == "abrupt")
-            gradual_count = sum(1 for s in switches if s.get("switch_type") == "gradual")
-            
+            # Count transition types in a single pass
+            type_counts = {"explicit": 0, "abrupt": 0, "gradual": 0}
+            for s in switches:
+                switch_type = s.get("switch_type")
+                if switch_type in type_counts:
+                    type_counts[switch_type] += 1
+            explicit_count = type_counts["explicit"]
+            abrupt_count = type_counts["abrupt"]
+            gradual_count = type_counts["gradual"]
+
             total_switches = len(switches)
-            
-            # Determine dominant type
-            type_counts = {
-                "explicit": explicit_count,
-                "abrupt": abrupt_count,
-                "gradual": gradual_count
-            }
             dominant_type = max(type_counts.items(), key=lambda x: x[1])[0]
             
             # Classify transition style
@@ -50,7 +50,6 @@ from src.utils.helpers import (
     add_debug_info_to_response,
     extract_text_for_memory_storage,
     fix_message_alternation,
-    generate_conversation_summary,
     get_current_time_context,
     get_message_content,
     message_equals_bot_user,
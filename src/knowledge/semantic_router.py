@@ -784,24 +784,27 @@ class SemanticKnowledgeRouter:
         user_id: str,
         character_name: str,
         entity_type: Optional[str] = None,
-        limit: int = 20
+        limit: int = 20,
+        min_confidence: Optional[float] = None
     ) -> List[Dict[str, Any]]:
         """
         Get facts with character-specific context.
-        
+
         Args:
             user_id: User identifier
             character_name: Character name (e.g., "elena", "marcus")
             entity_type: Optional entity type filter
             limit: Maximum results
-            
+            min_confidence: Optional confidence floor applied in SQL so
+                low-confidence rows are never transferred
+
         Returns:
             List of character-aware facts
         """
         async with self.postgres.acquire() as conn:
             # Simplified query without character_interactions table (not yet implemented)
             query = """
-                SELECT 
+                SELECT
                     fe.entity_name,
                     fe.entity_type,
                     fe.category,
@@ -810,7 +813,7 @@ class SemanticKnowledgeRouter:
                     ufr.emotional_context,
                     1 as mention_count,
                     ufr.created_at as last_mentioned,
-                    CASE WHEN ufr.emotional_context IN ('happy', 'excited', 'joy') THEN 1.0 
+                    CASE WHEN ufr.emotional_context IN ('happy', 'excited', 'joy') THEN 1.0
                          ELSE 0.5 END as happiness_score
                 FROM user_fact_relationships ufr
                 JOIN fact_entities fe ON ufr.entity_id = fe.id
@@ -819,11 +822,12 @@ class SemanticKnowledgeRouter:
                   AND ufr.relationship_type NOT LIKE '_enrichment%'
                   AND ($3::TEXT IS NULL OR fe.entity_type = $3)
                   AND (ufr.mentioned_by_character = $2 OR ufr.mentioned_by_character IS NULL)
+                  AND ($5::FLOAT IS NULL OR ufr.confidence >= $5)
                 ORDER BY ufr.confidence DESC, ufr.created_at DESC
                 LIMIT $4
             """
-            
-            rows = await conn.fetch(query, user_id, character_name, entity_type, limit)
+
+            rows = await conn.fetch(query, user_id, character_name, entity_type, limit, min_confidence)
             
             facts = []
             for row in rows:
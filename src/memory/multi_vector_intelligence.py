@@ -736,23 +736,27 @@ class MultiVectorSearchCoordinator:
             query, user_id, semantic_limit, classification, memory_types
         )
         
-        # Combine with weight-based prioritization
+        # Combine with weight-based prioritization (id sets computed once,
+        # instead of rescanning the source lists per candidate)
+        content_ids = {r.get('id') for r in content_results}
+        emotion_ids = {r.get('id') for r in emotion_results}
+
         all_results = []
         # Add content results with high priority
         all_results.extend(content_results)
         # Add emotion results, avoiding duplicates
-        all_results.extend([r for r in emotion_results if r.get('id') not in [cr.get('id') for cr in content_results]])
+        all_results.extend([r for r in emotion_results if r.get('id') not in content_ids])
         # Add semantic results, avoiding duplicates
-        existing_ids = [r.get('id') for r in all_results]
+        existing_ids = {r.get('id') for r in all_results}
         all_results.extend([r for r in semantic_results if r.get('id') not in existing_ids])
-        
+
         # Limit to requested count
         final_results = all_results[:limit]
-        
+
         vector_contributions = {
-            'content': len([r for r in final_results if r in content_results]),
-            'emotion': len([r for r in final_results if r in emotion_results and r not in content_results]),
-            'semantic': len([r for r in final_results if r in semantic_results and r not in content_results and r not in emotion_results])
+            'content': len([r for r in final_results if r.get('id') in content_ids]),
+            'emotion': len([r for r in final_results if r.get('id') in emotion_ids and r.get('id') not in content_ids]),
+            'semantic': len([r for r in final_results if r.get('id') not in content_ids and r.get('id') not in emotion_ids])
         }
         
         return final_results, vector_contributions
@@ -233,7 +233,8 @@ class QdrantQueryOptimizer:
             query=query,
             user_id=user_id,
             qdrant_filters=qdrant_filters,
-            limit=50  # Get more results for re-ranking
+            limit=50,  # Get more results for re-ranking
+            exclude_regex=filters.get('exclude_content_regex') if filters else None
         )
         
         logger.debug("🔍 Hybrid search: %d results after Qdrant-native filtering", len(semantic_results))
@@ -318,16 +319,19 @@ class QdrantQueryOptimizer:
         }
     
     async def _search_with_qdrant_filters(self, query: str, user_id: str,
-                                        qdrant_filters: Dict, limit: int = 10) -> List[Dict]:
+                                        qdrant_filters: Dict, limit: int = 10,
+                                        exclude_regex=None) -> List[Dict]:
         """
         Execute search with Qdrant's native filtering capabilities.
-        
+
         Args:
             query: Search query
             user_id: User identifier
             qdrant_filters: Prepared Qdrant filters
             limit: Maximum results to return
-            
+            exclude_regex: Optional precompiled pattern matched once per result
+                           (faster than looping substring conditions)
+
         Returns:
             List of filtered search results
         """
@@ -346,9 +350,13 @@ class QdrantQueryOptimizer:
             filtered_results = []
             for result in semantic_results:
                 should_exclude = False
-                
+
+                # Single-pass regex scan covers all exclusion patterns at once
+                if exclude_regex is not None and exclude_regex.search(result.get('content', '')):
+                    should_exclude = True
+
                 # Check if content matches any exclusion patterns
-                if 'must_not' in qdrant_filters:
+                if not should_exclude and 'must_not' in qdrant_filters:
                     for condition in qdrant_filters['must_not']:
                         if isinstance(condition, dict):
                             pattern = condition.get('match', {}).get('text', '')
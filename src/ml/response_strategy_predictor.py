@@ -323,8 +323,17 @@ class ResponseStrategyPredictor:
         if not recommended:
             recommended = ['balanced', 'adaptive']
         
-        # Return top 3 unique recommendations
-        return list(dict.fromkeys(recommended))[:3]
+        # Return top 3 unique recommendations (early-exit dedup, order preserved)
+        seen = set()
+        top_modes = []
+        for mode in recommended:
+            if mode in seen:
+                continue
+            seen.add(mode)
+            top_modes.append(mode)
+            if len(top_modes) == 3:
+                break
+        return top_modes
 
 
 def create_response_strategy_predictor(model_path: Optional[str] = None, influxdb_client=None):
@@ -5,13 +5,28 @@ Calculates confidence metrics from conversation data and AI components
 
 import logging
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, NamedTuple, Optional
 
 from .temporal_intelligence_client import ConfidenceMetrics, RelationshipMetrics, ConversationQualityMetrics
 
 logger = logging.getLogger(__name__)
 
 
+class _SharedFields(NamedTuple):
+    """Sub-fields of ai_components that multiple metric calculations read."""
+    emotion_data: Optional[Dict[str, Any]]
+    context_data: Optional[Dict[str, Any]]
+    context_confidence: Optional[float]  # Averaged confidence_scores, None if unavailable
+    conversation_data: Optional[Dict[str, Any]]
+
+
+class AllMetrics(NamedTuple):
+    """Bundle of the three per-message metric objects computed in one pass."""
+    confidence: ConfidenceMetrics
+    relationship: RelationshipMetrics
+    quality: ConversationQualityMetrics
+
+
 class ConfidenceAnalyzer:
     """
     Analyzes conversation data to calculate confidence metrics for temporal tracking
@@ -20,13 +35,36 @@ class ConfidenceAnalyzer:
     def __init__(self, knowledge_router=None):
         """
         Initialize confidence analyzer
-        
+
         Args:
             knowledge_router: Optional PostgreSQL knowledge router for actual relationship scores
         """
         self.logger = logging.getLogger(__name__)
         self.knowledge_router = knowledge_router
 
+    @staticmethod
+    def _extract_shared_fields(ai_components: Dict[str, Any]) -> _SharedFields:
+        """Extract the ai_components sub-dicts shared by all three metric calculations."""
+        emotion_data = ai_components.get('emotion_analysis')
+        if not isinstance(emotion_data, dict):
+            emotion_data = None
+
+        context_data = ai_components.get('context_analysis')
+        if not isinstance(context_data, dict):
+            context_data = None
+
+        context_confidence = None
+        if context_data:
+            confidence_scores = context_data.get('confidence_scores', {})
+            if confidence_scores:
+                context_confidence = sum(confidence_scores.values()) / len(confidence_scores)
+
+        conversation_data = ai_components.get('conversation_intelligence')
+        if not isinstance(conversation_data, dict):
+            conversation_data = None
+
+        return _SharedFields(emotion_data, context_data, context_confidence, conversation_data)
+
     def calculate_confidence_metrics(
         self,
         ai_components: Dict[str, Any],
@@ -35,42 +73,40 @@ class ConfidenceAnalyzer:
     ) -> ConfidenceMetrics:
         """
         Calculate confidence metrics from AI components and conversation data
-        
+
         Args:
             ai_components: AI pipeline results (emotion, context, phase4, etc.)
             memory_count: Number of memories retrieved
             processing_time_ms: Processing time in milliseconds (reserved for future use)
-            
+
         Returns:
             ConfidenceMetrics: Calculated confidence measurements
         """
         # Note: processing_time_ms reserved for future confidence calculations based on response speed
         _ = processing_time_ms  # Acknowledge parameter for future use
-        
+
+        shared = self._extract_shared_fields(ai_components)
+        return self._confidence_from_shared(shared, memory_count)
+
+    @staticmethod
+    def _confidence_from_shared(shared: _SharedFields, memory_count: int) -> ConfidenceMetrics:
+        """Compute ConfidenceMetrics from pre-extracted shared fields."""
         # Extract emotion analysis confidence
         emotion_confidence = 0.5  # Default
-        emotion_data = ai_components.get('emotion_analysis')
-        if emotion_data and isinstance(emotion_data, dict):
-            emotion_confidence = emotion_data.get('confidence', 0.5)
-            
+        if shared.emotion_data:
+            emotion_confidence = shared.emotion_data.get('confidence', 0.5)
+
         # Extract context analysis confidence
-        context_confidence = 0.5  # Default
-        context_data = ai_components.get('context_analysis')
-        if context_data and isinstance(context_data, dict):
-            confidence_scores = context_data.get('confidence_scores', {})
-            if confidence_scores:
-                # Average of all context confidence scores
-                context_confidence = sum(confidence_scores.values()) / len(confidence_scores)
-                
+        context_confidence = shared.context_confidence if shared.context_confidence is not None else 0.5
+
         # Calculate user fact confidence based on memory availability
         user_fact_confidence = min(0.9, 0.3 + (memory_count * 0.1))  # More memories = higher confidence
-        
+
         # Calculate relationship confidence from Phase 4 data
         relationship_confidence = 0.5  # Default
-        conversation_intelligence_data = ai_components.get('conversation_intelligence')
-        if conversation_intelligence_data and isinstance(conversation_intelligence_data, dict):
+        if shared.conversation_data:
             # Use relationship level as confidence indicator
-            relationship_level = conversation_intelligence_data.get('relationship_level', 'acquaintance')
+            relationship_level = shared.conversation_data.get('relationship_level', 'acquaintance')
             relationship_mapping = {
                 'stranger': 0.2,
                 'acquaintance': 0.4,
@@ -78,7 +114,7 @@ class ConfidenceAnalyzer:
                 'close_friend': 0.9
             }
             relationship_confidence = relationship_mapping.get(relationship_level, 0.5)
-            
+
         # Calculate overall confidence as weighted average
         overall_confidence = (
             emotion_confidence * 0.25 +
@@ -86,7 +122,7 @@ class ConfidenceAnalyzer:
             user_fact_confidence * 0.25 +
             relationship_confidence * 0.25
         )
-        
+
         return ConfidenceMetrics(
             user_fact_confidence=user_fact_confidence,
             relationship_confidence=relationship_confidence,
@@ -103,97 +139,101 @@ class ConfidenceAnalyzer:
     ) -> RelationshipMetrics:
         """
         Calculate relationship progression metrics using actual PostgreSQL scores
-        
+
         CRITICAL: Queries PostgreSQL for ACTUAL relationship scores (trust, affection, attunement)
         instead of using estimates. This ensures InfluxDB temporal tracking reflects real data.
-        
+
         Args:
             user_id: User identifier for PostgreSQL query
             ai_components: AI pipeline results
             conversation_history_length: Length of conversation history
-            
+
         Returns:
             RelationshipMetrics: Calculated relationship measurements using actual scores
         """
-        
+        shared = self._extract_shared_fields(ai_components)
+        return await self._relationship_from_shared(shared, user_id, conversation_history_length)
+
+    async def _relationship_from_shared(
+        self,
+        shared: _SharedFields,
+        user_id: str,
+        conversation_history_length: int
+    ) -> RelationshipMetrics:
+        """Compute RelationshipMetrics from pre-extracted shared fields."""
         # Try to get ACTUAL relationship scores from PostgreSQL
         trust_level = 0.5  # Fallback baseline
         affection_level = 0.4  # Fallback baseline
         attunement_level = 0.5  # Fallback baseline
-        
+
         if self.knowledge_router:
             try:
                 bot_name = os.getenv('DISCORD_BOT_NAME', 'assistant').lower()
-                
+
                 # Query PostgreSQL for actual relationship scores
                 actual_scores = await self.knowledge_router.get_relationship_scores(
                     user_id=user_id,
                     bot_name=bot_name
                 )
-                
+
                 if actual_scores:
                     # PostgreSQL stores 0-100 scale, convert to 0-1 for InfluxDB
                     trust_level = actual_scores.get('trust', 40.0) / 100.0
                     affection_level = actual_scores.get('affection', 35.0) / 100.0
                     attunement_level = actual_scores.get('attunement', 45.0) / 100.0
-                    
+
                     self.logger.debug(
                         "✅ Using ACTUAL PostgreSQL relationship scores for %s: trust=%.2f, affection=%.2f, attunement=%.2f",
                         user_id, trust_level, affection_level, attunement_level
                     )
                 else:
                     self.logger.debug("No PostgreSQL scores found for %s, using fallback estimates", user_id)
-                    
+
             except Exception as e:
                 self.logger.warning("Could not fetch actual relationship scores from PostgreSQL: %s", e)
                 # Continue with fallback estimates below
         else:
             self.logger.debug("No knowledge_router available, using estimate-based relationship metrics")
-        
+
         # If PostgreSQL scores not available, fall back to estimates
         if trust_level == 0.5 and affection_level == 0.4:  # Still using defaults
             # Base trust on emotion analysis and conversation length
-            emotion_data = ai_components.get('emotion_analysis')
-            if emotion_data and isinstance(emotion_data, dict):
-                primary_emotion = emotion_data.get('primary_emotion', 'neutral')
-                intensity = emotion_data.get('intensity', 0.5)
-                
+            if shared.emotion_data:
+                primary_emotion = shared.emotion_data.get('primary_emotion', 'neutral')
+                intensity = shared.emotion_data.get('intensity', 0.5)
+
                 # Positive emotions increase trust
                 if primary_emotion in ['joy', 'surprise']:
                     trust_level += intensity * 0.2
                 elif primary_emotion in ['anger', 'fear', 'disgust']:
                     trust_level -= intensity * 0.1
-                    
+
             # Longer conversations indicate higher trust
             trust_level += min(0.3, conversation_history_length * 0.02)
             trust_level = max(0.1, min(0.9, trust_level))  # Clamp to reasonable range
-            
+
             # Affection based on emotional resonance and interaction quality
-            conversation_data = ai_components.get('conversation_intelligence')
-            if conversation_data and isinstance(conversation_data, dict):
-                interaction_type = conversation_data.get('interaction_type', 'general')
-                
+            if shared.conversation_data:
+                interaction_type = shared.conversation_data.get('interaction_type', 'general')
+
                 # Personal interactions indicate higher affection
                 if interaction_type in ['personal', 'emotional_support']:
                     affection_level += 0.2
                 elif interaction_type == 'general':
                     affection_level += 0.1
-                    
+
             # Attunement based on context understanding and response appropriateness
-            context_data = ai_components.get('context_analysis')
-            if context_data and isinstance(context_data, dict):
-                confidence_scores = context_data.get('confidence_scores', {})
-                if confidence_scores:
-                    attunement_level = sum(confidence_scores.values()) / len(confidence_scores)
-                    
+            if shared.context_confidence is not None:
+                attunement_level = shared.context_confidence
+
         # Interaction quality based on overall system performance
         interaction_quality = (trust_level + affection_level + attunement_level) / 3
-        
+
         # Communication comfort based on conversation flow
         communication_comfort = 0.6  # Default baseline
         if conversation_history_length > 5:  # Established conversation
             communication_comfort = min(0.9, 0.5 + (conversation_history_length * 0.01))
-            
+
         return RelationshipMetrics(
             trust_level=trust_level,
             affection_level=affection_level,
@@ -210,39 +250,48 @@ class ConfidenceAnalyzer:
     ) -> ConversationQualityMetrics:
         """
         Calculate conversation quality metrics
-        
+
         Args:
             ai_components: AI pipeline results
             response_length: Length of bot response
             processing_time_ms: Time to process and respond
-            
+
         Returns:
             ConversationQualityMetrics: Quality measurements with emoji reaction priority
         """
-        
+        shared = self._extract_shared_fields(ai_components)
+        return self._quality_from_shared(shared, ai_components, response_length, processing_time_ms)
+
+    @staticmethod
+    def _quality_from_shared(
+        shared: _SharedFields,
+        ai_components: Dict[str, Any],
+        response_length: int,
+        processing_time_ms: float
+    ) -> ConversationQualityMetrics:
+        """Compute ConversationQualityMetrics from pre-extracted shared fields."""
         # Check for emoji reaction data (REAL user feedback - highest priority!)
         emoji_reaction_data = ai_components.get('emoji_reaction_data')
         user_reaction_score = None
         reaction_emoji = None
         has_user_feedback = False
-        
+
         # Engagement score based on emotion and interaction type
         engagement_score = 0.5  # Default
-        emotion_data_engagement = ai_components.get('emotion_analysis')
-        if emotion_data_engagement and isinstance(emotion_data_engagement, dict):
-            intensity = emotion_data_engagement.get('intensity', 0.5)
+        if shared.emotion_data:
+            intensity = shared.emotion_data.get('intensity', 0.5)
             engagement_score = max(0.3, min(0.9, intensity))
-            
+
         # Satisfaction: PRIORITIZE emoji reactions (real feedback) over heuristics
         satisfaction_score = 0.6  # Default heuristic
-        
+
         if emoji_reaction_data and isinstance(emoji_reaction_data, dict):
             # User gave emoji feedback - use it as PRIMARY satisfaction signal!
             reaction_type = emoji_reaction_data.get('reaction_type', '')
             confidence = emoji_reaction_data.get('confidence_score', 0.8)
             reaction_emoji = emoji_reaction_data.get('emoji', '')
             has_user_feedback = True
-            
+
             if 'POSITIVE_STRONG' in reaction_type:
                 satisfaction_score = 0.95
                 user_reaction_score = 1.0
@@ -262,10 +311,10 @@ class ConfidenceAnalyzer:
                 # Other reaction types (surprise, confusion, etc.)
                 satisfaction_score = 0.6
                 user_reaction_score = 0.5
-                
+
             # Adjust by confidence
             satisfaction_score = satisfaction_score * confidence + (1 - confidence) * 0.6
-            
+
         else:
             # No emoji reaction - fall back to heuristic (response length)
             if 50 <= response_length <= 500:  # Optimal response length
@@ -274,7 +323,7 @@ class ConfidenceAnalyzer:
                 satisfaction_score = 0.7  # Slightly verbose
             elif response_length < 50:
                 satisfaction_score = 0.5  # Too brief
-            
+
         # Natural flow based on processing time (faster = more natural)
         natural_flow_score = 0.7  # Default
         if processing_time_ms < 1000:  # Very fast
@@ -283,21 +332,15 @@ class ConfidenceAnalyzer:
             natural_flow_score = 0.8
         elif processing_time_ms > 5000:  # Slow
             natural_flow_score = 0.5
-            
+
         # Emotional resonance from emotion analysis confidence
         emotional_resonance = 0.6  # Default
-        emotion_data_resonance = ai_components.get('emotion_analysis')
-        if emotion_data_resonance and isinstance(emotion_data_resonance, dict):
-            emotional_resonance = emotion_data_resonance.get('confidence', 0.6)
-            
+        if shared.emotion_data:
+            emotional_resonance = shared.emotion_data.get('confidence', 0.6)
+
         # Topic relevance based on context analysis
-        topic_relevance = 0.7  # Default
-        context_data_relevance = ai_components.get('context_analysis')
-        if context_data_relevance and isinstance(context_data_relevance, dict):
-            confidence_scores = context_data_relevance.get('confidence_scores', {})
-            if confidence_scores:
-                topic_relevance = sum(confidence_scores.values()) / len(confidence_scores)
-                
+        topic_relevance = shared.context_confidence if shared.context_confidence is not None else 0.7
+
         return ConversationQualityMetrics(
             engagement_score=engagement_score,
             satisfaction_score=satisfaction_score,
@@ -309,6 +352,39 @@ class ConfidenceAnalyzer:
             has_user_feedback=has_user_feedback
         )
 
+    async def calculate_all(
+        self,
+        user_id: str,
+        ai_components: Dict[str, Any],
+        memory_count: int = 0,
+        response_length: int = 0,
+        processing_time_ms: float = 0.0
+    ) -> AllMetrics:
+        """
+        Calculate confidence, relationship, and conversation quality metrics in one pass.
+
+        Extracts the shared ai_components sub-fields (emotion, context confidence,
+        conversation intelligence) once instead of re-walking the dict per metric -
+        this runs on every message, so the hot path uses this instead of the three
+        individual calculate_* methods.
+
+        Args:
+            user_id: User identifier for PostgreSQL relationship query
+            ai_components: AI pipeline results (emotion, context, phase4, etc.)
+            memory_count: Number of memories retrieved (also used as history length)
+            response_length: Length of bot response
+            processing_time_ms: Time to process and respond
+
+        Returns:
+            AllMetrics: NamedTuple of (confidence, relationship, quality) metrics
+        """
+        shared = self._extract_shared_fields(ai_components)
+        return AllMetrics(
+            confidence=self._confidence_from_shared(shared, memory_count),
+            relationship=await self._relationship_from_shared(shared, user_id, memory_count),
+            quality=self._quality_from_shared(shared, ai_components, response_length, processing_time_ms)
+        )
+
 
 
 
@@ -316,10 +392,10 @@ class ConfidenceAnalyzer:
 def create_confidence_analyzer(knowledge_router=None) -> ConfidenceAnalyzer:
     """
     Create and return confidence analyzer instance
-    
+
     Args:
         knowledge_router: Optional PostgreSQL knowledge router for actual relationship scores
-        
+
     Returns:
         ConfidenceAnalyzer: Configured analyzer instance
     """
@@ -141,16 +141,19 @@ def truncate_context(
     
     logger.warning("⚠️ Context over budget: %d tokens > %d limit - applying adaptive truncation", current_tokens, max_tokens)
     
-    # Separate system messages from conversation messages
+    # Separate the LEADING system block from conversation messages.
+    # Mid-stream system messages (e.g. per-turn AI guidance inserted next to
+    # the latest user message) keep their position so their placement relative
+    # to the turn they apply to survives truncation.
     system_messages = []
     conversation_messages = []
-    
+
     for msg in conversation_context:
-        if msg.get('role') == 'system':
+        if msg.get('role') == 'system' and not conversation_messages:
             system_messages.append(msg)
         else:
             conversation_messages.append(msg)
-    
+
     # Calculate tokens used by system messages (NEVER truncate these - character personality is sacred)
     system_tokens = count_context_tokens(system_messages)
     available_tokens = max_tokens - system_tokens
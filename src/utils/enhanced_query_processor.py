@@ -464,8 +464,17 @@ class EnhancedQueryProcessor:
                 relevant_keywords = [kw for kw in keywords if kw in message_words]
                 topic_terms.extend(relevant_keywords[:2])  # Limit to 2 per category
 
-        # Remove duplicates
-        return list(dict.fromkeys(topic_terms))[:6]  # Limit to 6 terms
+        # Remove duplicates, stopping once the 6-term limit is reached
+        seen = set()
+        unique_terms = []
+        for term in topic_terms:
+            if term in seen:
+                continue
+            seen.add(term)
+            unique_terms.append(term)
+            if len(unique_terms) == 6:
+                break
+        return unique_terms
 
     def _create_fallback_query(self, cleaned_message: str) -> str:
         """Create a fallback query by cleaning the original message"""
@@ -5,6 +5,7 @@ Contains common functionality used across multiple modules.
 
 import logging
 import os
+import time
 from datetime import UTC, datetime
 from typing import List
 
@@ -35,8 +36,19 @@ def is_admin(ctx) -> bool:
     return False
 
 
+# Prompt time context cached at 1-second granularity: concurrent requests in
+# the same second share one formatted string instead of re-running strftime
+_time_context_cache = (0, "")
+
+
 def get_current_time_context() -> str:
-    """Generate current date/time context for the bot"""
+    """Generate current date/time context for the bot (cached per second)"""
+    global _time_context_cache
+    now_s = int(time.time())
+    cached_s, cached_value = _time_context_cache
+    if now_s == cached_s and cached_value:
+        return cached_value
+
     now = datetime.now(UTC)
     local_time = now.astimezone()
 
@@ -45,7 +57,9 @@ def get_current_time_context() -> str:
     local_str = local_time.strftime("%Y-%m-%d %H:%M:%S %Z")
     day_of_week = now.strftime("%A")
 
-    return f"Current time: {local_str} ({utc_str}) - {day_of_week}"
+    time_context = f"Current time: {local_str} ({utc_str}) - {day_of_week}"
+    _time_context_cache = (now_s, time_context)
+    return time_context
 
 
 def add_debug_info_to_response(
@@ -7,6 +7,7 @@ adaptation based on user interactions and emotional context.
 
 import asyncio
 import logging
+import re
 from enum import Enum
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
@@ -14,6 +15,16 @@ from dataclasses import dataclass
 logger = logging.getLogger(__name__)
 
 
+def _compile_keyword_pattern(keywords: List[str]) -> "re.Pattern":
+    """Compile keywords into one substring-matching alternation.
+
+    Longest alternatives first so multi-word phrases win over their prefixes;
+    no word boundaries, preserving the original `keyword in text` semantics.
+    """
+    escaped = sorted((re.escape(kw) for kw in keywords), key=len, reverse=True)
+    return re.compile("|".join(escaped))
+
+
 class ConversationMode(Enum):
     """Conversation modes for adaptive responses"""
     HUMAN_LIKE = "human_like"           # Empathetic, caring, natural
@@ -57,32 +68,49 @@ class ConversationModeDetector:
     
     def __init__(self):
         self.emotional_support_keywords = [
-            "feel", "feeling", "worried", "sad", "anxious", "scared", "upset", 
+            "feel", "feeling", "worried", "sad", "anxious", "scared", "upset",
             "frustrated", "depressed", "lonely", "stressed", "overwhelmed",
             "hurt", "angry", "disappointed", "confused", "lost", "help me"
         ]
-        
+
         self.analytical_keywords = [
             "how does", "explain", "what is", "analyze", "compare", "evaluate",
             "research", "study", "understand", "learn about", "deep dive",
             "comprehensive", "detailed", "technical", "scientific", "academic"
         ]
-        
+
         self.problem_solving_keywords = [
             "help", "problem", "issue", "stuck", "error", "broken", "fix",
             "solve", "troubleshoot", "debug", "repair", "improve", "optimize"
         ]
-        
+
         self.creative_keywords = [
             "create", "design", "brainstorm", "idea", "creative", "imagine",
             "invent", "build", "make", "art", "story", "poem", "music", "draw"
         ]
-        
+
         self.casual_keywords = [
             "hello", "hi", "hey", "what's up", "how are you", "good morning",
             "good night", "thanks", "thank you", "awesome", "cool", "nice"
         ]
 
+        # Precompiled alternations: one C-level scan per category instead of
+        # a Python loop over every keyword
+        self._emotional_support_re = _compile_keyword_pattern(self.emotional_support_keywords)
+        self._analytical_re = _compile_keyword_pattern(self.analytical_keywords)
+        self._problem_solving_re = _compile_keyword_pattern(self.problem_solving_keywords)
+        self._creative_re = _compile_keyword_pattern(self.creative_keywords)
+
+    @staticmethod
+    def _keyword_score(pattern: "re.Pattern", keywords: List[str], text: str) -> int:
+        """Count keywords present in text, preserving per-keyword substring
+        semantics (a message containing "feeling" scores both "feel" and
+        "feeling"). The compiled alternation is a single-scan fast path for
+        the common case where no keyword matches at all."""
+        if pattern.search(text) is None:
+            return 0
+        return sum(1 for kw in keywords if kw in text)
+
     def detect_conversation_mode(
         self, 
         message: str, 
@@ -94,12 +122,10 @@ class ConversationModeDetector:
         message_lower = message.lower()
         
         # Check for explicit emotional support needs
-        emotional_score = sum(1 for keyword in self.emotional_support_keywords 
-                            if keyword in message_lower)
-        
+        emotional_score = self._keyword_score(self._emotional_support_re, self.emotional_support_keywords, message_lower)
+
         # Check for analytical requests
-        analytical_score = sum(1 for keyword in self.analytical_keywords 
-                              if keyword in message_lower)
+        analytical_score = self._keyword_score(self._analytical_re, self.analytical_keywords, message_lower)
         
         # Consider emotional context if available
         if emotional_context:
@@ -128,14 +154,10 @@ class ConversationModeDetector:
         message_lower = message.lower()
         
         # Score different interaction types
-        emotional_score = sum(1 for keyword in self.emotional_support_keywords 
-                            if keyword in message_lower)
-        problem_score = sum(1 for keyword in self.problem_solving_keywords 
-                           if keyword in message_lower)
-        analytical_score = sum(1 for keyword in self.analytical_keywords 
-                              if keyword in message_lower)
-        creative_score = sum(1 for keyword in self.creative_keywords 
-                            if keyword in message_lower)
+        emotional_score = self._keyword_score(self._emotional_support_re, self.emotional_support_keywords, message_lower)
+        problem_score = self._keyword_score(self._problem_solving_re, self.problem_solving_keywords, message_lower)
+        analytical_score = self._keyword_score(self._analytical_re, self.analytical_keywords, message_lower)
+        creative_score = self._keyword_score(self._creative_re, self.creative_keywords, message_lower)
         
         # Consider emotional context
         if emotional_context and emotional_context.get("needs_support", False):